@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Count filesystem syscalls made while resolving the media of TTDB records in index.py."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import index
+from ttdb_media import AssetPathCache, BudgetedLRU
+
+COUNTED_CALLS = ("stat", "lstat", "readlink", "getcwd")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark asset path resolution for record renders.")
+    parser.add_argument(
+        "--db",
+        default="BOI_approach_plates.md",
+        help="TTDB markdown file to load (default: BOI_approach_plates.md).",
+    )
+    parser.add_argument(
+        "--renders",
+        type=int,
+        default=20,
+        help="Renders of the most media-heavy record to time (default: 20).",
+    )
+    return parser.parse_args()
+
+
+class SyscallCounter:
+    def __init__(self) -> None:
+        self.counts = {name: 0 for name in COUNTED_CALLS}
+        self._originals = {name: getattr(os, name) for name in COUNTED_CALLS}
+
+    def __enter__(self) -> SyscallCounter:
+        for name, original in self._originals.items():
+            setattr(os, name, self._wrap(name, original))
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def _wrap(self, name: str, original):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return original(*args, **kwargs)
+
+        return counted
+
+
+def make_app(db_path: Path, asset_paths: AssetPathCache) -> index.IndexApp:
+    app = index.IndexApp.__new__(index.IndexApp)
+    app.db_path = db_path
+    records, order, _selected, _coords, _special = app._parse_records(db_path.read_text(encoding="utf-8"))
+    app.records = records
+    app.order = order
+    app._markdown_cache = BudgetedLRU(index.MARKDOWN_CACHE_BUDGET_BYTES)
+    app._asset_paths = asset_paths
+    return app
+
+
+def media_targets(app: index.IndexApp, record: index.Record) -> list[str]:
+    compiled = app._compile_record(record)
+    targets = [target for _text, _tags, target in compiled.runs if target and not app._resolve_internal_target(target)]
+    if compiled.lead_media is not None:
+        targets.append(compiled.lead_media.src)
+    return targets
+
+
+def render_media(app: index.IndexApp, record: index.Record) -> None:
+    compiled = app._compile_record(record)
+    media = compiled.lead_media
+    if media is not None:
+        app._target_to_external_uri(media.src)
+        app._resolve_local_target_path(media.src)
+        app._is_html_embed_source(media.src)
+        app._is_svg_source(media.src)
+        app._is_bitmap_preview_source(media.src)
+    for _text, _tags, target in compiled.runs:
+        if target and not app._resolve_internal_target(target):
+            app._target_to_external_uri(target)
+    audio_path, _loop = app._get_record_audio_config(record.record_id)
+    if audio_path:
+        app._resolve_asset_path(audio_path)
+
+
+def measure(app: index.IndexApp, record: index.Record, renders: int) -> tuple[float, float]:
+    with SyscallCounter() as counter:
+        started = time.perf_counter()
+        for _ in range(renders):
+            render_media(app, record)
+        elapsed = time.perf_counter() - started
+    return counter.total / renders, elapsed * 1000.0 / renders
+
+
+def main() -> int:
+    args = parse_args()
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"Error: {db_path} not found.", file=sys.stderr)
+        return 1
+    renders = max(1, args.renders)
+
+    probe = make_app(db_path, AssetPathCache())
+    record = max(probe.records.values(), key=lambda item: len(media_targets(probe, item)), default=None)
+    if record is None:
+        print(f"Error: {db_path} has no records.", file=sys.stderr)
+        return 1
+    print(f"record {record.record_id}: {len(media_targets(probe, record))} media targets")
+
+    print(f"{'cache':>10}  {'syscalls/render':>16}  {'ms/render':>10}")
+    for label, cache in (("none", AssetPathCache(ttl=0.0)), ("memoized", AssetPathCache())):
+        app = make_app(db_path, cache)
+        render_media(app, record)
+        syscalls, ms = measure(app, record, renders)
+        print(f"{label:>10}  {syscalls:>16.1f}  {ms:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Measure record/tour audio start latency through the ttdb_audio backends used by index.py."""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from ttdb_audio import AudioEngine, create_backend
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark audio start latency for tour steps.")
+    parser.add_argument(
+        "--wav",
+        default="../sounds/banjo.wav",
+        help="WAV file to play (default: ../sounds/banjo.wav).",
+    )
+    parser.add_argument(
+        "--backend",
+        default="null",
+        help="Audio backend: auto, winsound, pulse, alsa, file or null (default: null).",
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=20,
+        help="Tour steps to simulate (default: 20).",
+    )
+    parser.add_argument(
+        "--interval-ms",
+        type=int,
+        default=120,
+        help="Delay between simulated tour steps (default: 120).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    wav = Path(args.wav)
+    if not wav.exists():
+        print(f"Error: {wav} not found.", file=sys.stderr)
+        return 1
+    engine = AudioEngine(create_backend(args.backend))
+    if not engine.available:
+        print(f"Error: audio backend {args.backend!r} is not available here.", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    if engine.buffer(wav) is None and engine.backend.needs_pcm:
+        print(f"Error: unable to decode {wav}.", file=sys.stderr)
+        return 1
+    decode_ms = (time.perf_counter() - started) * 1000.0
+    started = time.perf_counter()
+    engine.buffer(wav)
+    cached_ms = (time.perf_counter() - started) * 1000.0
+
+    steps = max(1, args.steps)
+    engine.play("tour", wav, loop=True)
+    for _ in range(steps):
+        time.sleep(args.interval_ms / 1000.0)
+        engine.play("record", wav, loop=False)
+    time.sleep(0.2)
+    engine.close()
+
+    latencies = sorted(list(engine.start_latencies)[-steps:])
+    print(f"backend {engine.backend.name}: decode {decode_ms:.2f} ms, cached lookup {cached_ms:.3f} ms")
+    if not latencies:
+        print("no voices started")
+        return 1
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"start latency over {len(latencies)} steps: median {statistics.median(latencies):.1f} ms, "
+        f"p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Compare the vector (Tk canvas) and raster (Pillow) globe backends of index.py."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import index
+from globe_raster import RASTER_AVAILABLE, render_globe_raster
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark globe rendering backends.")
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="Comma-separated node counts (default: 1000,10000,100000).",
+    )
+    parser.add_argument(
+        "--edges",
+        type=int,
+        default=4,
+        help="Outgoing edges per node (default: 4).",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=5,
+        help="Frames to time per backend and size (default: 5).",
+    )
+    return parser.parse_args()
+
+
+def build_records(count: int, edges_per_node: int) -> tuple[dict[str, index.Record], list[str], dict]:
+    rnd = random.Random(count)
+    records: dict[str, index.Record] = {}
+    order: list[str] = []
+    coords: dict[str, tuple[float, float, float]] = {}
+    while len(order) < count:
+        lat = round(rnd.uniform(-85.0, 85.0), 4)
+        lon = round(rnd.uniform(-179.0, 179.0), 4)
+        record_id = f"@LAT{lat}LON{lon}"
+        if record_id in coords:
+            continue
+        coords[record_id] = (lat, lon, 0.0)
+        order.append(record_id)
+    for position, record_id in enumerate(order):
+        edges = [
+            index.Edge(type="nearby", target=order[(position + step) % count]) for step in range(1, edges_per_node + 1)
+        ]
+        records[record_id] = index.Record(
+            record_id=record_id, header=record_id, body="", title=f"Node {position}", edges=edges
+        )
+    return records, order, coords
+
+
+def make_app(workdir: Path) -> index.IndexApp:
+    index.DB_PATH = workdir / "bench_ttdb.md"
+    index.DISCOVERY_STATE_PATH = workdir / "discovery.json"
+    index.PREFERENCES_PATH = workdir / "prefs.json"
+    app = index.IndexApp()
+    app.tour_enabled.set(False)
+    app._clear_tour(stop_audio=True)
+    if app._poll_after_id:
+        app.after_cancel(app._poll_after_id)
+        app._poll_after_id = None
+    app.update()
+    return app
+
+
+def load_graph(app: index.IndexApp, count: int, edges_per_node: int) -> None:
+    records, order, coords = build_records(count, edges_per_node)
+    app.records = records
+    app.order = order
+    app.coords = coords
+    app._globe_vectors = {}
+    app.discovery = index.DiscoverySet(order)
+    app.discovery.update(order)
+    app.filtered_order = list(order)
+    app.selected_id = order[0]
+    app.first_record_id = order[0]
+    app._invalidate_globe_edges()
+
+
+def time_frames(app: index.IndexApp, backend: str, frames: int) -> tuple[float, float]:
+    app.globe_backend = backend
+    main_total = 0.0
+    full_total = 0.0
+    for frame in range(frames):
+        app.globe_rot_lon += 0.05
+        started = time.perf_counter()
+        app._render_globe()
+        app.update_idletasks()
+        main_total += time.perf_counter() - started
+        if backend == "raster" and app._raster_future is not None:
+            result = app._raster_future.result()
+            app._raster_future = None
+            app._raster_pending_scene = None
+            app._apply_raster_frame(result)
+            app.update_idletasks()
+        full_total += time.perf_counter() - started
+    return main_total * 1000.0 / frames, full_total * 1000.0 / frames
+
+
+def time_raster_only(count: int, edges_per_node: int, frames: int) -> float:
+    records, order, coords = build_records(count, edges_per_node)
+    app = index.IndexApp.__new__(index.IndexApp)
+    app.records = records
+    app.coords = coords
+    app._globe_vectors = {}
+    app.discovery = index.DiscoverySet(order)
+    app.discovery.update(order)
+    app.filtered_order = list(order)
+    app.search_term = ""
+    app.order = order
+    app._invalidate_globe_edges()
+    node_ids, vectors, hubs = app._ensure_globe_edges()
+    scene = index.GlobeRasterScene(
+        width=900,
+        height=520,
+        cx=450.0,
+        cy=260.0,
+        radius=300.0,
+        rot_lat=0.0,
+        rot_lon=0.0,
+        node_ids=node_ids,
+        vectors=vectors,
+        edge_hubs=hubs,
+        graticule=[],
+        palette=index.PALETTE,
+        selected_index=0,
+        halo_indices=app._globe_halo_indices,
+    )
+    started = time.perf_counter()
+    for frame in range(frames):
+        scene.rot_lon += 0.05
+        render_globe_raster(scene)
+    return (time.perf_counter() - started) * 1000.0 / frames
+
+
+def main() -> int:
+    args = parse_args()
+    sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+    frames = max(1, args.frames)
+
+    try:
+        workdir = Path(tempfile.mkdtemp(prefix="bench_globe_"))
+        app = make_app(workdir)
+    except Exception as err:
+        print(f"Tk unavailable ({err}); timing the raster renderer only.", file=sys.stderr)
+        if not RASTER_AVAILABLE:
+            print("Error: Pillow is not installed.", file=sys.stderr)
+            return 1
+        print(f"{'nodes':>8}  {'raster ms/frame':>16}")
+        for count in sizes:
+            print(f"{count:>8}  {time_raster_only(count, args.edges, frames):>16.1f}")
+        return 0
+
+    print(f"{'nodes':>8}  {'backend':>8}  {'main ms/frame':>14}  {'total ms/frame':>15}")
+    for count in sizes:
+        load_graph(app, count, args.edges)
+        for backend in ("vector", "raster"):
+            if backend == "raster" and (not RASTER_AVAILABLE or index.ImageTk is None):
+                print(f"{count:>8}  {backend:>8}  {'n/a (Pillow missing)':>31}")
+                continue
+            main_ms, total_ms = time_frames(app, backend, frames)
+            print(f"{count:>8}  {backend:>8}  {main_ms:>14.1f}  {total_ms:>15.1f}")
+    app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
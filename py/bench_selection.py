@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Time the per-selection order lookups of index.py (transition, tour successor, list visibility) against DB size."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import index
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark order lookups made on every record selection.")
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="Comma-separated record counts (default: 1000,10000,100000).",
+    )
+    parser.add_argument(
+        "--selections",
+        type=int,
+        default=2000,
+        help="Random selections to time per size (default: 2000).",
+    )
+    return parser.parse_args()
+
+
+def make_app(count: int) -> index.IndexApp:
+    order = [f"term-{position:06d}" for position in range(count)]
+    app = index.IndexApp.__new__(index.IndexApp)
+    app.records = {
+        record_id: index.Record(record_id=record_id, header=record_id, body="", title=record_id, edges=[])
+        for record_id in order
+    }
+    app.order = order
+    app.coords = {}
+    app.search_term = ""
+    app.search_index = {}
+    app.filtered_order = []
+    app.discovery = index.DiscoverySet(order)
+    app.discovery.update(order)
+    app._tour_planner = index.TourPlanner()
+    app._tour_planner.rebuild(app.discovery.ids(), app._coords_for_transition)
+    app._update_filtered_order()
+    return app
+
+
+def select_indexed(app: index.IndexApp, from_id: str, to_id: str) -> None:
+    app._describe_record_transition(from_id, to_id)
+    app._tour_successor(to_id)
+    _visible = to_id in app._filtered_positions
+
+
+def select_scanning(app: index.IndexApp, from_id: str, to_id: str) -> None:
+    app.order.index(from_id)
+    app.order.index(to_id)
+    order = app._get_discovered_order()
+    order[(order.index(to_id) + 1) % len(order)]
+    _visible = to_id in app.filtered_order
+
+
+def time_selections(app: index.IndexApp, pairs: list[tuple[str, str]], select) -> float:
+    started = time.perf_counter()
+    for from_id, to_id in pairs:
+        select(app, from_id, to_id)
+    return (time.perf_counter() - started) * 1_000_000.0 / len(pairs)
+
+
+def main() -> int:
+    args = parse_args()
+    sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+    selections = max(1, args.selections)
+    print(f"{'records':>8}  {'indexed us/sel':>15}  {'list scan us/sel':>17}")
+    for count in sizes:
+        app = make_app(count)
+        rnd = random.Random(count)
+        pairs = [(rnd.choice(app.order), rnd.choice(app.order)) for _ in range(selections)]
+        indexed = time_selections(app, pairs, select_indexed)
+        scanning = time_selections(app, pairs[: max(1, selections // 10)], select_scanning)
+        print(f"{count:>8}  {indexed:>15.2f}  {scanning:>17.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
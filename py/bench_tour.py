@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare guided-tour travel in file order against the TourPlanner route used by index.py."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+from ttdb_databases import scan_record_ids
+from ttdb_tour import TourPlanner, loop_length, unit_vector
+
+RECORD_COORDS_RE = re.compile(r"^@LAT(-?\d+(?:\.\d+)?)LON(-?\d+(?:\.\d+)?)$")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark guided tour travel and planning time.")
+    parser.add_argument(
+        "--dbs",
+        default="../TootTootTerminologyDB.md,../MyMentalPalaceDB.md,../a32_mega_ttdb.md",
+        help="Comma-separated TTDB files to tour (default: terminology, palace and a32 DBs).",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000",
+        help="Comma-separated counts of random records to tour as well (default: 1000,10000).",
+    )
+    return parser.parse_args()
+
+
+def locate(record_id: str) -> tuple[float, float] | None:
+    match = RECORD_COORDS_RE.match(record_id)
+    if not match:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def random_record_ids(count: int) -> list[str]:
+    rnd = random.Random(count)
+    record_ids: dict[str, None] = {}
+    while len(record_ids) < count:
+        lat = round(rnd.uniform(-85.0, 85.0), 4)
+        lon = round(rnd.uniform(-179.0, 179.0), 4)
+        record_ids[f"@LAT{lat}LON{lon}"] = None
+    return list(record_ids)
+
+
+def report(label: str, record_ids: list[str]) -> None:
+    located = [coords for coords in map(locate, record_ids) if coords is not None]
+    file_order = loop_length([unit_vector(lat, lon) for lat, lon in located])
+    planner = TourPlanner()
+    started = time.perf_counter()
+    planner.rebuild(record_ids, locate)
+    plan_ms = (time.perf_counter() - started) * 1000.0
+    print(f"{label:<28}  {len(located):>8}  {file_order:>11.1f}  {planner.route_length():>11.1f}  {plan_ms:>8.1f}")
+
+
+def main() -> int:
+    args = parse_args()
+    print(f"{'tour':<28}  {'stops':>8}  {'file rad':>11}  {'planned rad':>11}  {'plan ms':>8}")
+    for name in args.dbs.split(","):
+        if not name.strip():
+            continue
+        path = Path(name.strip())
+        if not path.exists():
+            print(f"{path.name:<28}  missing")
+            continue
+        # Dedupe like the discovery set does; repeated headers are one stop.
+        report(path.name, list(dict.fromkeys(scan_record_ids(path))))
+    for value in args.sizes.split(","):
+        if value.strip():
+            count = int(value)
+            report(f"random {count}", random_record_ids(count))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
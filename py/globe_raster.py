@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Globe geometry shared by the TTDB viewers, plus an offscreen Pillow renderer for globes too large for Tk canvas vector items."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+try:
+    from PIL import Image, ImageDraw
+except Exception:  # pragma: no cover - optional dependency for the raster globe backend
+    Image = None
+    ImageDraw = None
+
+
+RASTER_AVAILABLE = Image is not None and ImageDraw is not None
+GRATICULE_CACHE_SIZE = 8
+
+
+@dataclass
+class GlobeRasterScene:
+    width: int
+    height: int
+    cx: float
+    cy: float
+    radius: float
+    rot_lat: float
+    rot_lon: float
+    node_ids: list[str]
+    vectors: list[tuple[float, float, float]]
+    edge_hubs: list[tuple[int, list[int]]]
+    graticule: list[list[float]]
+    palette: dict[str, str]
+    selected_index: int = -1
+    first_index: int = -1
+    halo_indices: list[int] = field(default_factory=list)
+    halo_radius: float = 34.0
+
+
+@dataclass
+class GlobeRasterFrame:
+    image: object
+    screen_points: dict[str, tuple[float, float]]
+    selected: tuple[float, float, float] | None
+
+
+def rotate_vectors(
+    vectors: list[tuple[float, float, float]], rot_lat: float, rot_lon: float
+) -> list[tuple[float, float, float]]:
+    cos_y = math.cos(rot_lon)
+    sin_y = math.sin(rot_lon)
+    cos_x = math.cos(rot_lat)
+    sin_x = math.sin(rot_lat)
+    rotated: list[tuple[float, float, float]] = []
+    append = rotated.append
+    for x, y, z in vectors:
+        x1 = x * cos_y + z * sin_y
+        z1 = -x * sin_y + z * cos_y
+        append((x1, y * cos_x - z1 * sin_x, y * sin_x + z1 * cos_x))
+    return rotated
+
+
+def group_edge_hubs(
+    node_ids: list[str], positions: dict[str, int], targets_of: Callable[[str], Iterable[str]]
+) -> list[tuple[int, list[int]]]:
+    # Edges are stored undirected and grouped by hub so each frame can draw
+    # one star-shaped polyline per hub instead of one canvas item per edge.
+    seen_pairs: set[tuple[int, int]] = set()
+    hubs: dict[int, list[int]] = {}
+    for source_index, source_id in enumerate(node_ids):
+        for target_id in targets_of(source_id):
+            target_index = positions.get(target_id)
+            if target_index is None or target_index == source_index:
+                continue
+            pair = (min(source_index, target_index), max(source_index, target_index))
+            if pair in seen_pairs:
+                continue
+            seen_pairs.add(pair)
+            hubs.setdefault(source_index, []).append(target_index)
+    return list(hubs.items())
+
+
+def edge_star_lines(
+    edge_hubs: list[tuple[int, list[int]]], screen_xy: list[float], front: list[bool], selected_index: int
+) -> tuple[list[list[float]], list[float] | None]:
+    stars: list[list[float]] = []
+    selected_spokes: list[int] = []
+    for hub, targets in edge_hubs:
+        if not front[hub]:
+            continue
+        hx = screen_xy[hub * 2]
+        hy = screen_xy[hub * 2 + 1]
+        star = [hx, hy]
+        for target in targets:
+            if not front[target]:
+                continue
+            if hub == selected_index:
+                selected_spokes.append(target)
+            elif target == selected_index:
+                selected_spokes.append(hub)
+            else:
+                star.extend((screen_xy[target * 2], screen_xy[target * 2 + 1], hx, hy))
+        if len(star) >= 4:
+            stars.append(star)
+
+    if selected_index < 0 or not selected_spokes:
+        return stars, None
+    sx = screen_xy[selected_index * 2]
+    sy = screen_xy[selected_index * 2 + 1]
+    selected_star = [sx, sy]
+    for other in selected_spokes:
+        selected_star.extend((screen_xy[other * 2], screen_xy[other * 2 + 1], sx, sy))
+    return stars, selected_star
+
+
+def graticule_unit_lines() -> list[list[tuple[float, float, float]]]:
+    lines: list[list[tuple[float, float, float]]] = []
+    for lon in range(-150, 180, 30):
+        lines.append([_unit_vector(lat, lon) for lat in range(-90, 91, 6)])
+    for lat in range(-60, 90, 30):
+        lines.append([_unit_vector(lat, lon) for lon in range(-180, 181, 6)])
+    return lines
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    return math.cos(lat_r) * math.sin(lon_r), math.sin(lat_r), math.cos(lat_r) * math.cos(lon_r)
+
+
+class GraticuleCache:
+    def __init__(self, max_entries: int = GRATICULE_CACHE_SIZE) -> None:
+        self._lines = graticule_unit_lines()
+        self._samples = [point for line in self._lines for point in line]
+        self._max_entries = max(1, max_entries)
+        self._segments: dict[tuple[float, float, float, float, float], list[list[float]]] = {}
+
+    def segments(self, rot_lat: float, rot_lon: float, cx: float, cy: float, radius: float) -> list[list[float]]:
+        key = (rot_lat, rot_lon, cx, cy, radius)
+        cached = self._segments.get(key)
+        if cached is not None:
+            return cached
+
+        rotated = rotate_vectors(self._samples, rot_lat, rot_lon)
+        segments: list[list[float]] = []
+        offset = 0
+        for line in self._lines:
+            segment: list[float] = []
+            for x, y, z in rotated[offset : offset + len(line)]:
+                if z > 0:
+                    segment.append(cx + x * radius)
+                    segment.append(cy - y * radius)
+                    continue
+                if len(segment) >= 4:
+                    segments.append(segment)
+                segment = []
+            if len(segment) >= 4:
+                segments.append(segment)
+            offset += len(line)
+
+        if len(self._segments) >= self._max_entries:
+            self._segments.clear()
+        self._segments[key] = segments
+        return segments
+
+
+def render_globe_raster(scene: GlobeRasterScene) -> GlobeRasterFrame:
+    if not RASTER_AVAILABLE:
+        raise RuntimeError("Pillow is required for the raster globe backend.")
+
+    palette = scene.palette
+    image = Image.new("RGB", (max(1, scene.width), max(1, scene.height)), palette["graph_bg"])
+    draw = ImageDraw.Draw(image)
+    cx, cy, radius = scene.cx, scene.cy, scene.radius
+
+    draw.ellipse(
+        (cx - radius, cy - radius, cx + radius, cy + radius),
+        fill="#0e1117",
+        outline=palette["graph_outline"],
+        width=2,
+    )
+    inner = radius * 0.92
+    draw.ellipse((cx - inner, cy - inner, cx + inner, cy + inner), outline=palette["graph_inner"], width=1)
+    for segment in scene.graticule:
+        draw.line(segment, fill=palette["graph_grid"], width=1)
+
+    rotated = rotate_vectors(scene.vectors, scene.rot_lat, scene.rot_lon)
+    screen_x = [cx + x * radius for x, _y, _z in rotated]
+    screen_y = [cy - y * radius for _x, y, _z in rotated]
+    front = [z > 0 for _x, _y, z in rotated]
+    selected_index = scene.selected_index
+
+    node_back = palette["node_back"]
+    for index, is_front in enumerate(front):
+        if is_front or index == selected_index:
+            continue
+        px = screen_x[index]
+        py = screen_y[index]
+        draw.ellipse((px - 3, py - 3, px + 3, py + 3), fill=node_back)
+
+    halo = scene.halo_radius
+    for index in scene.halo_indices:
+        if not front[index]:
+            continue
+        if index == selected_index:
+            color, width = "#ff4a4a", 2
+        elif index == scene.first_index:
+            color, width = "#0f8b8d", 2
+        else:
+            color, width = "#7cc7ff", 1
+        px = screen_x[index]
+        py = screen_y[index]
+        draw.ellipse((px - halo, py - halo, px + halo, py + halo), outline=color, width=width)
+
+    selected_lines: list[tuple[float, float, float, float]] = []
+    for hub, targets in scene.edge_hubs:
+        if not front[hub]:
+            continue
+        hx = screen_x[hub]
+        hy = screen_y[hub]
+        for target in targets:
+            if not front[target]:
+                continue
+            line = (hx, hy, screen_x[target], screen_y[target])
+            if hub == selected_index or target == selected_index:
+                selected_lines.append(line)
+            else:
+                draw.line(line, fill="#2a3a4d", width=1)
+    for line in selected_lines:
+        draw.line(line, fill="#7cc7ff", width=2)
+
+    screen_points: dict[str, tuple[float, float]] = {}
+    node_front = palette["node_front"]
+    node_outline = palette["node_outline"]
+    for index, is_front in enumerate(front):
+        if not is_front or index == selected_index:
+            continue
+        px = screen_x[index]
+        py = screen_y[index]
+        draw.ellipse((px - 5, py - 5, px + 5, py + 5), fill=node_front, outline=node_outline, width=2)
+        screen_points[scene.node_ids[index]] = (px, py)
+
+    selected: tuple[float, float, float] | None = None
+    if 0 <= selected_index < len(rotated):
+        selected = (screen_x[selected_index], screen_y[selected_index], rotated[selected_index][2])
+    return GlobeRasterFrame(image=image, screen_points=screen_points, selected=selected)
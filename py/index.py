@@ -1,35 +1,73 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
+import bisect
+import logging
 import math
 import re
 import time
 import webbrowser
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
+from typing import Callable
 import tkinter as tk
 from tkinter import font as tkfont
 from tkinter import ttk
 
-try:
-    import winsound
-except Exception:  # pragma: no cover - optional on non-Windows platforms
-    winsound = None
-
 try:
     from tkinterweb import HtmlFrame  # type: ignore
 except Exception:  # pragma: no cover - optional dependency for embedded browser media
     HtmlFrame = None
 
+try:
+    from PIL import ImageTk
+except Exception:  # pragma: no cover - optional dependency for the raster globe backend
+    ImageTk = None
+
+from globe_raster import (
+    RASTER_AVAILABLE,
+    GlobeRasterFrame,
+    GlobeRasterScene,
+    GraticuleCache,
+    edge_star_lines,
+    group_edge_hubs,
+    render_globe_raster,
+    rotate_vectors,
+)
+from ttdb_audio import AUDIO_SINK_PATH, AudioEngine, create_backend
+from ttdb_databases import AliasIndex, DbCatalog, DbSnapshot, DbSnapshotCache, badge_label, build_search_index
+from ttdb_listview import ListboxModel
+from ttdb_media import (
+    DECODE_AVAILABLE,
+    SVG_AVAILABLE,
+    AssetPathCache,
+    BudgetedLRU,
+    ImagePipeline,
+    SvgRasterCache,
+    decode_thumbnail,
+    thumbnail_key,
+)
+from ttdb_scene import SCENE_RECORD_TYPE, Scene, ScenePlayer, compile_scene, parse_scene_body
+from ttdb_state import STATE_PROFILE, db_identity, open_state_store
+from ttdb_tour import TourPlanner
+
+view_log = logging.getLogger("ttdb.view")
+
 
 DB_PATH = Path("TootTootTerminologyDB.md")
 DISCOVERY_STATE_PATH = Path(".index_discovery.json")
 PREFERENCES_PATH = Path(".index_prefs.json")
+STATE_BACKEND = "json"  # "json" or "sqlite"
 
 REFRESH_MS = 1500
 SEARCH_DEBOUNCE_MS = 100
 ANIMATION_MS = 16
+GLOBE_EASE_TAU_MS = 98.0
+GLOBE_ZOOM_EASE_TAU_MS = 70.0
+RECORD_EASE_SHARPNESS = 4.5
 
 TOUR_DELAY_MS = 12000
 TOUR_SLOW_DELAY_MULTIPLIER = 1.7
@@ -45,6 +83,12 @@ GLOBE_ZOOM_MAX = 3.5
 GLOBE_ZOOM_STEP = 1.12
 GLOBE_DEFAULT_ZOOM = 1.2
 GLOBE_BASE_RADIUS_SCALE = 1.18
+DB_SIDE_GLOBE_SCALE = 0.25
+DB_SIDE_GLOBE_NEAR_OVERLAP = 2.22
+DB_SIDE_GLOBE_STEP = 1.68
+DB_SHIFT_MIN_MS = 220
+DB_SHIFT_MAX_MS = 760
+DB_SNAPSHOT_POLL_MS = 60
 LAYOUT_COMPACT_BREAKPOINT = 900
 GRAPH_ZOOM_BTN_SIZE = 44
 GRAPH_ZOOM_GAP = 6
@@ -63,10 +107,31 @@ RECORD_PANEL_OFFSET_COMPACT = 280
 RECORD_PANEL_BIAS_COMPACT = 150
 RECORDS_LIST_MAX_HEIGHT = 420
 LEAD_MEDIA_PANEL_HEIGHT = 232
+RECORD_CHUNK_LINES = 60
+RECORD_CHUNK_CHARS = 8000
+RECORD_STREAM_SLICE_MS = 4.0
+PREFETCH_EDGE_NEIGHBORS = 4
+PREFETCH_RETRY_MS = 120
+MARKDOWN_CACHE_BUDGET_BYTES = 16 * 1024 * 1024
+PREVIEW_CACHE_BUDGET_BYTES = 16 * 1024 * 1024
+PREVIEW_DECODE_BUDGET_BYTES = 48 * 1024 * 1024
+PREVIEW_MAX_SIZE = (720, 180)
+TK_PREVIEW_EXTENSIONS = {".png", ".gif", ".ppm", ".pgm"}
+PILLOW_PREVIEW_EXTENSIONS = TK_PREVIEW_EXTENSIONS | {".jpg", ".jpeg", ".webp", ".bmp"}
+IMAGE_POLL_MS = 30
+SCENE_LATE_NOTICE_MS = 50.0
+VIEW_SELECTION = "selection"
+VIEW_DISCOVERY = "discovery"
+VIEW_FILTER = "filter"
+VIEW_DATA = "data"
 Z_SCALE = 0.1
 Z_MIN_SCALE = 0.5
 Z_MAX_SCALE = 1.5
 
+GLOBE_BACKEND = "auto"
+AUDIO_BACKEND = "auto"  # "auto", "winsound", "pulse", "alsa", "file" or "null"
+GLOBE_RASTER_NODE_THRESHOLD = 2500
+
 DRAG_SENSITIVITY = 0.005
 DRAG_THRESHOLD = 6
 DRAG_LAT_LIMIT = math.pi / 2 - 0.05
@@ -117,6 +182,7 @@ class Record:
     edges: list[Edge]
     audio_path: str | None = None
     audio_loop: bool = False
+    scene: Scene | None = None
 
 
 @dataclass
@@ -126,6 +192,223 @@ class LeadMedia:
     title: str = ""
 
 
+MarkdownRun = tuple[str, tuple[str, ...], str | None]
+PreviewCallback = Callable[[tk.PhotoImage | None], None]
+ImageJob = tuple[Future, Callable[[object], tk.PhotoImage | None], PreviewCallback | None]
+
+
+@dataclass
+class CompiledRecord:
+    body_hash: int
+    lead_media: LeadMedia | None
+    runs: list[MarkdownRun]
+
+
+@dataclass
+class RecordFrameSlot:
+    frame: tk.Frame
+    media_host: tk.Frame
+    text: tk.Text
+
+
+class DiscoverySet:
+    def __init__(self, order: list[str] | None = None) -> None:
+        self.reset(order or [])
+
+    def reset(self, order: list[str]) -> None:
+        self._order = order
+        self._index = {record_id: position for position, record_id in enumerate(order)}
+        self._bits = bytearray((len(order) + 7) // 8)
+        # Positions in the order they were discovered; the sorted view is rebuilt only when read.
+        self._added: list[int] = []
+        self._positions: list[int] | None = []
+        self._ids: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._added)
+
+    def __contains__(self, record_id: object) -> bool:
+        position = self._index.get(record_id)  # type: ignore[arg-type]
+        return position is not None and bool(self._bits[position >> 3] & (1 << (position & 7)))
+
+    def add(self, record_id: str) -> bool:
+        position = self._index.get(record_id)
+        if position is None:
+            return False
+        mask = 1 << (position & 7)
+        if self._bits[position >> 3] & mask:
+            return False
+        self._bits[position >> 3] |= mask
+        self._added.append(position)
+        self._positions = None
+        self._ids = None
+        return True
+
+    def update(self, record_ids: list[str]) -> bool:
+        changed = False
+        for record_id in record_ids:
+            changed = self.add(record_id) or changed
+        return changed
+
+    def position(self, record_id: str) -> int | None:
+        return self._index.get(record_id)
+
+    def rank(self, record_id: str | None) -> int | None:
+        position = self._index.get(record_id) if record_id else None
+        if position is None or record_id not in self:
+            return None
+        return bisect.bisect_left(self._sorted_positions(), position)
+
+    def ids(self) -> list[str]:
+        if self._ids is None:
+            order = self._order
+            self._ids = [order[position] for position in self._sorted_positions()]
+        return self._ids
+
+    def _sorted_positions(self) -> list[int]:
+        if self._positions is None:
+            self._positions = sorted(self._added)
+        return self._positions
+
+
+class ViewState:
+    FILTER_INPUTS = frozenset({VIEW_DISCOVERY, VIEW_FILTER, VIEW_DATA})
+    REGION_INPUTS = {
+        "list": frozenset({VIEW_SELECTION, VIEW_DISCOVERY, VIEW_FILTER, VIEW_DATA}),
+        "record": frozenset({VIEW_SELECTION, VIEW_DATA}),
+        "center": frozenset({VIEW_SELECTION, VIEW_DATA}),
+        "globe": frozenset({VIEW_SELECTION, VIEW_DISCOVERY, VIEW_FILTER, VIEW_DATA}),
+        "search_meta": frozenset({VIEW_DISCOVERY, VIEW_FILTER, VIEW_DATA}),
+        "status": frozenset({VIEW_DISCOVERY, VIEW_DATA}),
+    }
+
+    def __init__(self) -> None:
+        self.trace: list[tuple[str, float]] = []
+        self.changes: frozenset[str] = frozenset()
+
+    def begin(self, changes: set[str]) -> None:
+        self.changes = frozenset(changes)
+        self.trace = []
+
+    def needs(self, region: str) -> bool:
+        return bool(self.changes & self.REGION_INPUTS[region])
+
+    def run(self, region: str, render: Callable[[], None]) -> None:
+        started = time.perf_counter()
+        render()
+        self.trace.append((region, (time.perf_counter() - started) * 1000.0))
+
+    def describe(self) -> str:
+        kinds = ",".join(sorted(self.changes)) or "none"
+        regions = ", ".join(f"{region} {elapsed:.1f}ms" for region, elapsed in self.trace) or "nothing"
+        return f"view [{kinds}] -> {regions}"
+
+
+class LinkRegistry:
+    def __init__(self) -> None:
+        self._starts: list[tuple[int, int]] = []
+        self._ends: list[tuple[int, int]] = []
+        self._targets: list[str] = []
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._ends.clear()
+        self._targets.clear()
+
+    def add(self, start: str, end: str, target: str) -> None:
+        self._starts.append(self._parse_index(start))
+        self._ends.append(self._parse_index(end))
+        self._targets.append(target)
+
+    def lookup(self, index: str) -> str | None:
+        position = self._parse_index(index)
+        slot = bisect.bisect_right(self._starts, position) - 1
+        if slot < 0 or position >= self._ends[slot]:
+            return None
+        return self._targets[slot]
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    @staticmethod
+    def _parse_index(index: str) -> tuple[int, int]:
+        line, _, column = str(index).partition(".")
+        return int(line), int(column or 0)
+
+
+class AnimationClock:
+    def __init__(self, widget: tk.Misc, on_frame: Callable[[], None] | None = None) -> None:
+        self._widget = widget
+        self._on_frame = on_frame
+        self._tweens: dict[str, Callable[[float], bool]] = {}
+        self._after_id: str | None = None
+
+    def start(self, name: str, step: Callable[[float], bool]) -> None:
+        self._tweens[name] = step
+        if self._after_id is None:
+            self._after_id = self._widget.after(ANIMATION_MS, self._tick)
+
+    def stop(self, name: str) -> None:
+        self._tweens.pop(name, None)
+
+    def is_running(self, name: str) -> bool:
+        return name in self._tweens
+
+    def cancel_all(self) -> None:
+        self._tweens.clear()
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _tick(self) -> None:
+        self._after_id = None
+        now = time.perf_counter()
+        for name, step in list(self._tweens.items()):
+            if self._tweens.get(name) is not step:
+                continue
+            try:
+                finished = step(now)
+            except tk.TclError:
+                finished = True
+            if finished and self._tweens.get(name) is step:
+                del self._tweens[name]
+        if self._on_frame is not None:
+            self._on_frame()
+        # The loop only stays scheduled while something is moving.
+        if self._tweens and self._after_id is None:
+            self._after_id = self._widget.after(ANIMATION_MS, self._tick)
+
+
+def decay_factor(elapsed_ms: float, tau_ms: float) -> float:
+    if tau_ms <= 0:
+        return 1.0
+    return 1.0 - math.exp(-max(0.0, elapsed_ms) / tau_ms)
+
+
+def ease_out_expo(progress: float, sharpness: float = RECORD_EASE_SHARPNESS) -> float:
+    progress = max(0.0, min(1.0, progress))
+    return (1.0 - math.exp(-sharpness * progress)) / (1.0 - math.exp(-sharpness))
+
+
+def ease_in_out_cubic(progress: float) -> float:
+    progress = max(0.0, min(1.0, progress))
+    if progress < 0.5:
+        return 4.0 * progress**3
+    return 1.0 - (-2.0 * progress + 2.0) ** 3 / 2.0
+
+
+def blend_color(color: str, background: str, alpha: float) -> str:
+    alpha = max(0.0, min(1.0, alpha))
+    channels = (
+        round(int(color[i : i + 2], 16) * alpha + int(background[i : i + 2], 16) * (1.0 - alpha))
+        for i in (1, 3, 5)
+    )
+    return "#" + "".join(f"{value:02x}" for value in channels)
+
+
 class IndexApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -138,19 +421,48 @@ class IndexApp(tk.Tk):
         self.db_path = DB_PATH
         self.discovery_path = DISCOVERY_STATE_PATH
         self.preferences_path = PREFERENCES_PATH
+        self._db_identity = db_identity(self.db_path)
+        self._state_store = open_state_store(
+            STATE_BACKEND, self.discovery_path, self.preferences_path, STATE_PROFILE, home_db_id=self._db_identity
+        )
+        self._db_catalog = DbCatalog(self.db_path)
+        self._db_catalog.refresh()
+        self._alias_index = AliasIndex(self._db_catalog)
+        self._snapshots = DbSnapshotCache(self._build_snapshot)
+        self._snapshot_poll_after_id: str | None = None
+        self._db_globe_targets: list[tuple[Path, float, float, float, float]] = []
+        self._db_cost_labels: dict[Path, str] = {}
+        self._db_shift_px = 0.0
+        self._preferred_record_id: str | None = None
 
         self.records: dict[str, Record] = {}
         self.order: list[str] = []
         self.filtered_order: list[str] = []
+        self._filtered_positions: dict[str, int] = {}
         self.search_index: dict[str, str] = {}
         self.coords: dict[str, tuple[float, float, float]] = {}
+        self._globe_vectors: dict[str, tuple[float, float, float]] = {}
         self.special_records: dict[str, dict[str, str]] = {}
         self.screen_points: dict[str, tuple[float, float]] = {}
+        self._globe_node_ids: list[str] | None = None
+        self._globe_node_vectors: list[tuple[float, float, float]] = []
+        self._globe_edge_hubs: list[tuple[int, list[int]]] = []
+        self._globe_node_positions: dict[str, int] = {}
+        self._globe_halo_indices: list[int] = []
+        self.globe_backend = GLOBE_BACKEND
+        self._globe_backend_active = "vector"
+        self._raster_executor: ThreadPoolExecutor | None = None
+        self._raster_future: Future | None = None
+        self._raster_pending_scene: GlobeRasterScene | None = None
+        self._raster_poll_after_id: str | None = None
+        self._raster_photo: object | None = None
+        self._raster_screen_points: dict[str, tuple[float, float]] = {}
+        self._graticule_cache = GraticuleCache()
 
         self.selected_id: str | None = None
         self.first_record_id: str | None = None
-        self.discovered_ids: list[str] = []
-        self._list_order: list[str] = []
+        self.discovery = DiscoverySet()
+        self._tour_planner = TourPlanner()
 
         self.search_term = ""
         self._search_after_id: str | None = None
@@ -159,12 +471,26 @@ class IndexApp(tk.Tk):
 
         self._file_mtime: float | None = None
         self._last_text = ""
-        self._link_counter = 0
+        self._markdown_cache = BudgetedLRU(MARKDOWN_CACHE_BUDGET_BYTES)
+        self._view_state = ViewState()
+        self._preview_cache = BudgetedLRU(PREVIEW_CACHE_BUDGET_BYTES)
+        self._image_pipeline = ImagePipeline(PREVIEW_DECODE_BUDGET_BYTES)
+        self._svg_rasters = SvgRasterCache()
+        self._asset_paths = AssetPathCache()
+        self._image_jobs: list[ImageJob] = []
+        self._image_poll_after_id: str | None = None
+        self._prefetch_queue: list[str] = []
+        self._record_stream_widget: tk.Text | None = None
+        self._record_stream_chunks: deque[list[MarkdownRun]] = deque()
+        self._record_stream_after_id: str | None = None
+        self._prefetch_after_id: str | None = None
         self._pending_record_transition: dict[str, float | str] | None = None
+        self._scene_player: ScenePlayer | None = None
+        self._scene_record_id: str | None = None
+        self._scene_after_id: str | None = None
         self._record_current_frame: tk.Frame | None = None
+        self._record_slots: list[RecordFrameSlot] = []
         self._record_current_id: str | None = None
-        self._record_animation_after_id: str | None = None
-        self._record_animation_token = 0
         self._prefs_save_after_id: str | None = None
         self._pending_scroll_fraction: float | None = None
         self.app_canvas: tk.Canvas | None = None
@@ -182,13 +508,18 @@ class IndexApp(tk.Tk):
         self.search_meta_var = tk.StringVar(value="Loading ...")
         self.tour_note_var = tk.StringVar(value="Default network tour will advance after a short pause.")
         self.selected_var = tk.StringVar(value="Selected: (none)")
+        self.scene_status_var = tk.StringVar(value="")
 
         self.globe_rot_lat = 0.0
         self.globe_rot_lon = 0.0
         self.globe_target_lat = 0.0
         self.globe_target_lon = 0.0
-        self.globe_animating = False
         self.globe_zoom = GLOBE_DEFAULT_ZOOM
+        self.globe_zoom_target = GLOBE_DEFAULT_ZOOM
+        self._globe_tween_last = 0.0
+        self._zoom_tween_last = 0.0
+        self._globe_frame_dirty = False
+        self._animation_clock = AnimationClock(self, on_frame=self._on_animation_frame)
 
         self._globe_drag_active = False
         self._globe_drag_moved = False
@@ -201,6 +532,7 @@ class IndexApp(tk.Tk):
         self._record_audio_path: str | None = None
         self._record_audio_loop = False
         self._record_audio_playing = False
+        self._audio = AudioEngine(create_backend(AUDIO_BACKEND, AUDIO_SINK_PATH))
 
         self._init_fonts()
         self._build_ui()
@@ -209,6 +541,7 @@ class IndexApp(tk.Tk):
         self.bind("<KeyPress-space>", self._on_space_press)
 
         self._load_db(force=True)
+        self._prefetch_neighbor_dbs()
         self.after_idle(self._restore_saved_scroll_position)
         self.after(180, self._restore_saved_scroll_position)
         self._start_polling()
@@ -313,6 +646,12 @@ class IndexApp(tk.Tk):
             row=0, column=0, sticky="w"
         )
         ttk.Label(record_head, textvariable=self.selected_var, style="Muted.TLabel").grid(row=0, column=1, sticky="e")
+        self.scene_controls = ttk.Frame(record_head, style="Card.TFrame")
+        self.scene_play_button = ttk.Button(self.scene_controls, text="Play Scene", command=self._start_scene)
+        self.scene_play_button.pack(side="left", padx=(0, 8))
+        self.scene_stop_button = ttk.Button(self.scene_controls, text="Stop", command=self._stop_scene)
+        self.scene_stop_button.pack(side="left", padx=(0, 12))
+        ttk.Label(self.scene_controls, textvariable=self.scene_status_var, style="Muted.TLabel").pack(side="left")
 
         self.record_panel_body = ttk.Frame(record_card, style="Card.TFrame", height=RECORD_PANEL_MIN_HEIGHT)
         self.record_panel_body.grid(row=1, column=0, sticky="nsew")
@@ -366,6 +705,7 @@ class IndexApp(tk.Tk):
         )
         self.record_listbox.grid(row=0, column=0, sticky="nsew")
         self.record_listbox.bind("<<ListboxSelect>>", self._on_record_list_select)
+        self._list_model = ListboxModel(self.record_listbox, self._record_list_label)
         list_scroll = ttk.Scrollbar(list_frame, orient="vertical", command=self.record_listbox.yview)
         list_scroll.grid(row=0, column=1, sticky="ns")
         self.record_listbox.configure(yscrollcommand=list_scroll.set)
@@ -594,10 +934,19 @@ class IndexApp(tk.Tk):
         text.tag_configure("rule", foreground="#39424e")
         text.tag_configure("muted", foreground="#a7a7b3")
         text.tag_configure("media", foreground="#bde0fe")
+        text.tag_configure("link", foreground="#7cc7ff", underline=True)
+        text.tag_bind("link", "<Button-1>", self._on_link_click)
+        text.tag_bind("link", "<Enter>", lambda event: event.widget.configure(cursor="hand2"))
+        text.tag_bind("link", "<Leave>", lambda event: event.widget.configure(cursor=""))
+        text.link_registry = LinkRegistry()  # ranges of the shared "link" tag -> targets
 
     def _on_close(self) -> None:
         self._clear_tour(stop_audio=True)
         self._stop_record_animation(normalize_current=False)
+        self._animation_clock.cancel_all()
+        self._cancel_prefetch()
+        self._cancel_record_stream()
+        self._stop_scene(resume=False)
         if self._prefs_save_after_id:
             try:
                 self.after_cancel(self._prefs_save_after_id)
@@ -605,18 +954,32 @@ class IndexApp(tk.Tk):
                 pass
             self._prefs_save_after_id = None
         self._save_preferences()
+        self._state_store.close()
         if self._poll_after_id:
             self.after_cancel(self._poll_after_id)
             self._poll_after_id = None
+        if self._snapshot_poll_after_id:
+            self.after_cancel(self._snapshot_poll_after_id)
+            self._snapshot_poll_after_id = None
+        self._snapshots.shutdown()
+        self._alias_index.close()
+        if self._raster_poll_after_id:
+            self.after_cancel(self._raster_poll_after_id)
+            self._raster_poll_after_id = None
+        if self._raster_executor is not None:
+            self._raster_executor.shutdown(wait=False, cancel_futures=True)
+            self._raster_executor = None
+        if self._image_poll_after_id:
+            self.after_cancel(self._image_poll_after_id)
+            self._image_poll_after_id = None
+        self._image_jobs = []
+        self._image_pipeline.shutdown()
+        self._svg_rasters.shutdown()
+        self._audio.close()
         self.destroy()
 
     def _load_preferences(self) -> None:
-        try:
-            payload = json.loads(self.preferences_path.read_text(encoding="utf-8"))
-        except Exception:
-            return
-        if not isinstance(payload, dict):
-            return
+        payload = self._state_store.load_preferences(self._db_identity)
         guided = payload.get("guided_tour")
         if isinstance(guided, bool):
             self.tour_enabled.set(guided)
@@ -637,10 +1000,7 @@ class IndexApp(tk.Tk):
             "invert_drag_y": bool(self.invert_drag_y.get()),
             "scroll_y": self._get_app_scroll_fraction(),
         }
-        try:
-            self.preferences_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception:
-            pass
+        self._state_store.save_preferences(self._db_identity, payload)
 
     def _get_app_scroll_fraction(self) -> float:
         if self.app_canvas is None:
@@ -658,10 +1018,15 @@ class IndexApp(tk.Tk):
 
     def _poll_db(self) -> None:
         self._poll_after_id = None
+        self._asset_paths.poll_watches()
+        if self._db_catalog.refresh():
+            self._update_db_cost_labels()
+            self._render_globe()
         self._load_db(force=False)
         self._poll_after_id = self.after(REFRESH_MS, self._poll_db)
 
     def _refresh_now(self) -> None:
+        self._db_catalog.refresh(force=True)
         self._load_db(force=True)
         self._note_interaction()
 
@@ -671,15 +1036,21 @@ class IndexApp(tk.Tk):
             self.records = {}
             self.order = []
             self.filtered_order = []
+            self._filtered_positions = {}
             self.search_index = {}
             self.coords = {}
+            self._globe_vectors = {}
             self.special_records = {}
             self.selected_id = None
             self.first_record_id = None
-            self.discovered_ids = []
+            self.discovery.reset([])
+            self._tour_planner.rebuild([], self._coords_for_transition)
             self.screen_points = {}
+            self._invalidate_globe_edges()
+            self._list_model.invalidate_labels()
             self._set_tour_audio_path(None)
             self._stop_record_audio()
+            self._stop_scene(resume=False)
             self._render_list()
             self._render_record()
             self._render_globe()
@@ -696,31 +1067,50 @@ class IndexApp(tk.Tk):
         if not force and self._file_mtime is not None and mtime == self._file_mtime:
             return
 
-        try:
-            text = self.db_path.read_text(encoding="utf-8")
-        except Exception as err:
-            self._set_status_message(f"Unable to read {self.db_path}: {err}")
-            return
+        snapshot = self._snapshots.lookup(self.db_path, mtime)
+        if snapshot is None:
+            try:
+                text = self.db_path.read_text(encoding="utf-8")
+            except Exception as err:
+                self._set_status_message(f"Unable to read {self.db_path}: {err}")
+                return
 
-        if not force and text == self._last_text:
-            self._file_mtime = mtime
-            return
+            if not force and text == self._last_text:
+                self._file_mtime = mtime
+                return
+
+            snapshot = self._snapshot_from_text(self.db_path, text, mtime)
+            self._snapshots.put(snapshot)
+            self._update_db_cost_labels()
 
         self._file_mtime = mtime
-        self._last_text = text
+        self._last_text = snapshot.text
 
-        records, order, selected, coords, special_records = self._parse_records(text)
+        records = snapshot.records
+        order = snapshot.order
+        selected = snapshot.selected
         previous_selected = self.selected_id
+        preferred = self._preferred_record_id
+        self._preferred_record_id = None
 
         self.records = records
         self.order = order
-        self.coords = coords
-        self.special_records = special_records
+        self.coords = snapshot.coords
+        self._globe_vectors = snapshot.vectors
+        self.special_records = snapshot.special_records
+        self.search_index = snapshot.search_index
+        self._invalidate_globe_edges()
+        self._list_model.invalidate_labels()
+        self._markdown_cache.retain(lambda record_id: record_id in records)
         self._set_tour_audio_path(self._get_tour_audio_path(self.special_records))
+        if self._scene_record_id not in records:
+            self._stop_scene(resume=False)
 
         self._initialize_discovery()
 
-        if previous_selected in self.records:
+        if preferred in self.records:
+            self.selected_id = preferred
+        elif previous_selected in self.records:
             self.selected_id = previous_selected
         elif selected in self.records:
             self.selected_id = selected
@@ -732,19 +1122,66 @@ class IndexApp(tk.Tk):
         if self.selected_id:
             self._discover_record(self.selected_id)
 
-        self._build_search_index()
-        self._apply_search(prefer_visible_selection=True, schedule_tour=False)
+        self._refresh_view({VIEW_DATA}, prefer_visible_selection=True)
         self._play_record_audio_for_selection(self.selected_id, restart=True, suppress=False)
-        self._set_status_link()
         self._schedule_tour()
 
     def _set_status_message(self, message: str) -> None:
         self.status_var.set(message)
 
     def _set_status_link(self) -> None:
-        discovered_count = len(self._get_discovered_order())
+        discovered_count = len(self.discovery)
         total = len(self.order)
-        self.status_var.set(f"DB: {self.db_path} · {discovered_count}/{total} discovered")
+        costs = dict(self._snapshots.costs())
+        active_mb = costs.get(self._db_identity, 0) / (1024 * 1024)
+        cached_mb = self._snapshots.total_cost / (1024 * 1024)
+        self.status_var.set(
+            f"DB: {self.db_path} · {discovered_count}/{total} discovered · "
+            f"{active_mb:.1f} MB parsed, {len(costs)} DBs cached ({cached_mb:.1f} MB)"
+        )
+
+    def _build_snapshot(self, path: Path) -> DbSnapshot:
+        # Runs on the snapshot worker as well as the Tk thread, so it must not touch widgets or app state.
+        mtime = path.stat().st_mtime
+        return self._snapshot_from_text(path, path.read_text(encoding="utf-8"), mtime)
+
+    def _snapshot_from_text(self, path: Path, text: str, mtime: float) -> DbSnapshot:
+        records, order, selected, coords, special_records = self._parse_records(text)
+        return DbSnapshot(
+            path=path,
+            mtime=mtime,
+            text=text,
+            records=records,
+            order=order,
+            selected=selected,
+            coords=coords,
+            special_records=special_records,
+            search_index=build_search_index(records, order),
+            vectors={record_id: self._sphere_vector(*coord) for record_id, coord in coords.items()},
+        )
+
+    def _prefetch_neighbor_dbs(self) -> None:
+        self._snapshots.prefetch(self._db_catalog.neighbors(self.db_path))
+        if self._snapshots.pending and self._snapshot_poll_after_id is None:
+            self._snapshot_poll_after_id = self.after(DB_SNAPSHOT_POLL_MS, self._poll_snapshots)
+
+    def _poll_snapshots(self) -> None:
+        self._snapshot_poll_after_id = None
+        if self._snapshots.collect():
+            self._update_db_cost_labels()
+            self._set_status_link()
+            self._render_globe()
+        if self._snapshots.pending:
+            self._snapshot_poll_after_id = self.after(DB_SNAPSHOT_POLL_MS, self._poll_snapshots)
+
+    def _update_db_cost_labels(self) -> None:
+        costs = dict(self._snapshots.costs())
+        labels: dict[Path, str] = {}
+        for path in self._db_catalog.paths:
+            cost = costs.get(db_identity(path))
+            if cost is not None:
+                labels[path] = f"{cost / (1024 * 1024):.1f} MB"
+        self._db_cost_labels = labels
 
     def _parse_records(
         self, content: str
@@ -807,6 +1244,9 @@ class IndexApp(tk.Tk):
                     special_records[kind] = config
                 continue
             record_config, body = self._parse_record_config(body)
+            scene: Scene | None = None
+            if re.search(rf"\btype:\s*{SCENE_RECORD_TYPE}\b", header_line):
+                scene, body = parse_scene_body(body)
 
             edges: list[Edge] = []
             relates_match = re.search(r"relates:([^|]+)", header_line)
@@ -834,6 +1274,7 @@ class IndexApp(tk.Tk):
                 edges=edges,
                 audio_path=record_config.get("audio_path"),
                 audio_loop=bool(record_config.get("audio_loop", False)),
+                scene=scene,
             )
             order.append(record_id)
 
@@ -937,13 +1378,13 @@ class IndexApp(tk.Tk):
             return
         self._set_tour_audio_playing(False)
         self._tour_audio_path = next_path
+        resolved = self._resolve_asset_path(next_path) if next_path else None
+        if resolved is not None and resolved.suffix.lower() == ".wav":
+            self._audio.preload(resolved)
 
     def _stop_record_audio(self) -> None:
-        if winsound is not None and self._record_audio_playing:
-            try:
-                winsound.PlaySound(None, winsound.SND_ASYNC)
-            except Exception:
-                pass
+        if self._record_audio_playing:
+            self._audio.stop("record")
         self._record_audio_path = None
         self._record_audio_loop = False
         self._record_audio_playing = False
@@ -960,7 +1401,7 @@ class IndexApp(tk.Tk):
         return audio_path, bool(record.audio_loop)
 
     def _play_record_audio_for_selection(self, record_id: str | None, restart: bool = True, suppress: bool = False) -> None:
-        if suppress:
+        if suppress or self._scene_player is not None:
             self._stop_record_audio()
             return
 
@@ -983,29 +1424,20 @@ class IndexApp(tk.Tk):
         if can_reuse:
             return
 
-        if winsound is None:
-            self._record_audio_path = audio_path
-            self._record_audio_loop = audio_loop
+        self._record_audio_path = audio_path
+        self._record_audio_loop = audio_loop
+        if not self._audio.available:
             self._record_audio_playing = False
             return
 
-        flags = winsound.SND_FILENAME | winsound.SND_ASYNC
-        if audio_loop:
-            flags |= winsound.SND_LOOP
-
-        try:
-            winsound.PlaySound(str(resolved), flags)
-            self._record_audio_path = audio_path
-            self._record_audio_loop = audio_loop
-            self._record_audio_playing = True
-            self._tour_audio_playing = False
-        except Exception:
-            self._record_audio_path = audio_path
-            self._record_audio_loop = audio_loop
-            self._record_audio_playing = False
+        # Mixing backends layer the record clip over the tour loop; winsound has a single voice.
+        if not self._audio.mixes:
+            self._audio.stop("tour")
+        self._record_audio_playing = self._audio.play("record", resolved, loop=audio_loop)
+        self._tour_audio_playing = self._tour_audio_playing and self._audio.is_playing("tour")
 
     def _set_tour_audio_playing(self, should_play: bool) -> None:
-        if winsound is None:
+        if not self._audio.available:
             self._tour_audio_playing = False
             return
         if not self._tour_audio_path:
@@ -1018,85 +1450,57 @@ class IndexApp(tk.Tk):
             return
 
         if should_play and not self._tour_audio_playing:
-            try:
-                winsound.PlaySound(
-                    str(resolved),
-                    winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_LOOP,
-                )
-                self._tour_audio_playing = True
-                self._record_audio_playing = False
-            except Exception:
-                self._tour_audio_playing = False
+            if not self._audio.mixes:
+                self._audio.stop("record")
+            self._tour_audio_playing = self._audio.play("tour", resolved, loop=True)
+            self._record_audio_playing = self._record_audio_playing and self._audio.is_playing("record")
             return
 
         if not should_play and self._tour_audio_playing:
-            try:
-                winsound.PlaySound(None, winsound.SND_ASYNC)
-            except Exception:
-                pass
+            self._audio.stop("tour")
             self._tour_audio_playing = False
 
     def _read_discovery_store(self) -> list[str]:
-        try:
-            payload = json.loads(self.discovery_path.read_text(encoding="utf-8"))
-        except Exception:
-            return []
-        if not isinstance(payload, list):
-            return []
-        return [value for value in payload if isinstance(value, str)]
+        return self._state_store.load_discovery(self._db_identity)
 
-    def _persist_discovery(self) -> None:
-        try:
-            self.discovery_path.write_text(json.dumps(self.discovered_ids, indent=2), encoding="utf-8")
-        except Exception:
-            pass
+    def _persist_discovery(self, added: list[str]) -> None:
+        self._state_store.save_discovery(self._db_identity, self.discovery.ids(), added)
 
     def _initialize_discovery(self) -> None:
         self.first_record_id = self.order[0] if self.order else None
-        stored_ids = self._read_discovery_store()
-        discovered_set = {record_id for record_id in stored_ids if record_id in self.records}
-        if self.first_record_id and self.first_record_id in self.records:
-            discovered_set.add(self.first_record_id)
-        self.discovered_ids = [record_id for record_id in self.order if record_id in discovered_set]
-        self._persist_discovery()
+        self.discovery.reset(self.order)
+        self.discovery.update(self._read_discovery_store())
+        added: list[str] = []
+        if self.first_record_id and self.first_record_id in self.records and self.discovery.add(self.first_record_id):
+            added.append(self.first_record_id)
+        self._tour_planner.rebuild(self.discovery.ids(), self._coords_for_transition)
+        self._invalidate_globe_edges()
+        self._persist_discovery(added)
 
     def _discover_record(self, record_id: str | None) -> bool:
         if not record_id or record_id not in self.records:
             return False
-        discovered_set = set(self.discovered_ids)
-        changed = False
-        if self.first_record_id and self.first_record_id in self.records and self.first_record_id not in discovered_set:
-            discovered_set.add(self.first_record_id)
-            changed = True
-        if record_id not in discovered_set:
-            discovered_set.add(record_id)
-            changed = True
-        if not changed:
+        added = [
+            value
+            for value in (self.first_record_id, record_id)
+            if value and value in self.records and self.discovery.add(value)
+        ]
+        if not added:
             return False
-        self.discovered_ids = [value for value in self.order if value in discovered_set]
-        self._persist_discovery()
+        for value in added:
+            self._tour_planner.add(value, self._coords_for_transition(value))
+        self._invalidate_globe_edges()
+        self._persist_discovery(added)
         return True
 
     def _get_discovered_order(self) -> list[str]:
-        if not self.order or not self.discovered_ids:
-            return []
-        discovered_set = set(self.discovered_ids)
-        return [record_id for record_id in self.order if record_id in discovered_set]
+        return self.discovery.ids()
 
     def _get_visible_order_for_graph(self) -> list[str]:
         if self.search_term:
             return list(self.filtered_order)
         return self._get_discovered_order()
 
-    def _build_search_index(self) -> None:
-        self.search_index = {}
-        for record_id in self.order:
-            record = self.records.get(record_id)
-            if not record:
-                continue
-            blob = "\n".join(part for part in (record.title or "", record.header, record.body) if part)
-            self.search_index[record_id] = blob.lower()
-
     def _on_search_input(self, _event: tk.Event) -> None:
         if self._search_after_id:
             self.after_cancel(self._search_after_id)
@@ -1116,36 +1520,65 @@ class IndexApp(tk.Tk):
         self._note_interaction()
 
     def _apply_search(self, prefer_visible_selection: bool = True, schedule_tour: bool = False) -> None:
-        term = self.search_term
-        discovered_order = self._get_discovered_order()
-        if not term:
-            self.filtered_order = list(discovered_order)
-        else:
-            self.filtered_order = [
-                record_id for record_id in discovered_order if term in self.search_index.get(record_id, "")
-            ]
+        self._refresh_view({VIEW_FILTER}, prefer_visible_selection=prefer_visible_selection, schedule_tour=schedule_tour)
 
-        if prefer_visible_selection and self.filtered_order and self.selected_id not in self.filtered_order:
+    def _refresh_view(
+        self, changes: set[str], prefer_visible_selection: bool = False, schedule_tour: bool = False
+    ) -> None:
+        view = self._view_state
+        changes = set(changes)
+        view.begin(changes)
+        if changes & ViewState.FILTER_INPUTS:
+            view.run("filter", self._update_filtered_order)
+
+        if prefer_visible_selection and self.filtered_order and self.selected_id not in self._filtered_positions:
             previous_id = self.selected_id
             self.selected_id = self.filtered_order[0]
             self._queue_record_transition(previous_id, self.selected_id, from_tour=False)
-            self._discover_record(self.selected_id)
+            if self._discover_record(self.selected_id):
+                changes.add(VIEW_DISCOVERY)
             self._play_record_audio_for_selection(self.selected_id, restart=True, suppress=False)
-
-        self._render_list()
-        self._render_record()
-        self._center_on_selected()
-        self._render_globe()
-        self._update_search_meta()
-        self._set_status_link()
+            changes.add(VIEW_SELECTION)
+            view.changes = frozenset(changes)
+
+        if view.needs("list"):
+            view.run("list", self._render_list)
+        if view.needs("record"):
+            view.run("record", self._render_record)
+        if view.needs("center"):
+            view.run("center", self._center_on_selected)
+        if view.needs("globe"):
+            view.run("globe", self._render_globe)
+        if view.needs("search_meta"):
+            view.run("search_meta", self._update_search_meta)
+        if view.needs("status"):
+            view.run("status", self._set_status_link)
+        if view_log.isEnabledFor(logging.DEBUG):
+            view_log.debug("%s", view.describe())
         if schedule_tour:
             self._schedule_tour()
 
+    def _update_filtered_order(self) -> None:
+        term = self.search_term
+        discovered_order = self._get_discovered_order()
+        if not term:
+            filtered_order = list(discovered_order)
+        else:
+            filtered_order = [
+                record_id for record_id in discovered_order if term in self.search_index.get(record_id, "")
+            ]
+        # Selection-only refreshes leave the filter result unchanged; keep the cached globe edges then.
+        if filtered_order == self.filtered_order:
+            return
+        self.filtered_order = filtered_order
+        self._filtered_positions = dict(zip(filtered_order, range(len(filtered_order))))
+        self._invalidate_globe_edges()
+
     def _update_search_meta(self) -> None:
         if not self.order:
             self.search_meta_var.set("No records.")
             return
-        discovered_count = len(self._get_discovered_order())
+        discovered_count = len(self.discovery)
         if not self.search_term:
             self.search_meta_var.set(f"{discovered_count} discovered of {len(self.order)} terms.")
             return
@@ -1154,55 +1587,51 @@ class IndexApp(tk.Tk):
         )
 
     def _render_list(self) -> None:
-        self.record_listbox.delete(0, "end")
-        self._list_order = []
-        source = self.filtered_order
-        if not source:
-            placeholder = "No matching discovered records." if self.search_term else "No discovered records yet."
-            self.record_listbox.insert("end", placeholder)
-            return
-        for record_id in source:
-            record = self.records.get(record_id)
-            title = record.title if record else None
-            label = f"{record_id} - {title}" if title else record_id
-            self.record_listbox.insert("end", label)
-            self._list_order.append(record_id)
-
-        if self.selected_id in self._list_order:
-            idx = self._list_order.index(self.selected_id)
-            self.record_listbox.selection_clear(0, "end")
-            self.record_listbox.selection_set(idx)
-            self.record_listbox.activate(idx)
-            self.record_listbox.see(idx)
+        placeholder = "No matching discovered records." if self.search_term else "No discovered records yet."
+        self._list_model.update(self.filtered_order, placeholder)
+        self._list_model.select(self.selected_id)
+
+    def _record_list_label(self, record_id: str) -> str:
+        record = self.records.get(record_id)
+        title = record.title if record else None
+        return f"{record_id} - {title}" if title else record_id
 
     def _on_record_list_select(self, _event: tk.Event) -> None:
         selection = self.record_listbox.curselection()
         if not selection:
             return
         idx = selection[0]
-        if idx < 0 or idx >= len(self._list_order):
+        record_id = self._list_model.id_at(idx)
+        if record_id is None:
             return
-        record_id = self._list_order[idx]
         self._select_record(record_id, from_tour=False, from_list=True)
         self._note_interaction()
 
-    def _select_record(self, record_id: str, from_tour: bool = False, from_list: bool = False) -> None:
+    def _select_record(
+        self,
+        record_id: str,
+        from_tour: bool = False,
+        from_list: bool = False,
+        from_scene: bool = False,
+        transition: dict[str, float] | None = None,
+    ) -> None:
         if record_id not in self.records:
             return
+        if self._scene_player is not None and not from_scene:
+            self._stop_scene(resume=False)
         previous_id = self.selected_id
-        self._discover_record(record_id)
-        self._queue_record_transition(previous_id, record_id, from_tour=from_tour)
+        changes = {VIEW_SELECTION}
+        self._state_store.record_visit(self._db_identity, record_id)
+        if self._discover_record(record_id):
+            changes.add(VIEW_DISCOVERY)
+        self._queue_record_transition(previous_id, record_id, from_tour=from_tour, transition=transition)
         self.selected_id = record_id
-        self._play_record_audio_for_selection(record_id, restart=True, suppress=False)
-        self._apply_search(prefer_visible_selection=False, schedule_tour=False)
-        if not from_tour:
+        self._play_record_audio_for_selection(record_id, restart=True, suppress=from_scene)
+        self._refresh_view(changes)
+        if not from_tour and not from_scene:
             self._schedule_tour()
-        if not from_list and self.selected_id in self._list_order:
-            idx = self._list_order.index(self.selected_id)
-            self.record_listbox.selection_clear(0, "end")
-            self.record_listbox.selection_set(idx)
-            self.record_listbox.activate(idx)
-            self.record_listbox.see(idx)
+        if not from_list and self.selected_id in self._list_model:
+            self._list_model.select(self.selected_id)
 
     def _render_record(self) -> None:
         selected_id = self.selected_id if self.selected_id in self.records else None
@@ -1210,6 +1639,7 @@ class IndexApp(tk.Tk):
             self.selected_var.set(f"Selected: {selected_id}")
         else:
             self.selected_var.set("Selected: (none)")
+        self._update_scene_controls()
 
         transition = self._pending_record_transition
         self._pending_record_transition = None
@@ -1228,6 +1658,7 @@ class IndexApp(tk.Tk):
             and transition.get("to_id") == selected_id
         )
 
+        self._schedule_prefetch()
         if not should_animate:
             self._set_record_frame(incoming_frame, selected_id)
             return
@@ -1243,52 +1674,47 @@ class IndexApp(tk.Tk):
 
         current_frame.place(x=0, y=0, relwidth=1, relheight=1)
         incoming_frame.place(x=enter_x, y=enter_y, relwidth=1, relheight=1)
+        incoming_frame.lift()
         self._record_current_frame = incoming_frame
         self._record_current_id = selected_id
 
-        self._record_animation_token += 1
-        token = self._record_animation_token
-        started_at = time.perf_counter()
+        # Scene cues pass their scheduled start so the slide stays on the scene clock.
+        started_at = float(transition.get("started_at", time.perf_counter()))
 
-        def tick() -> None:
-            if token != self._record_animation_token:
-                return
-            elapsed_ms = (time.perf_counter() - started_at) * 1000.0
+        def step(now: float) -> bool:
+            elapsed_ms = (now - started_at) * 1000.0
             progress = 1.0 if duration_ms <= 0 else min(1.0, elapsed_ms / duration_ms)
-            ease = 1.0 - pow(1.0 - progress, 3)
+            ease = ease_out_expo(progress)
             out_x = int(round(exit_x * ease))
             out_y = int(round(exit_y * ease))
             in_x = int(round(enter_x * (1.0 - ease)))
             in_y = int(round(enter_y * (1.0 - ease)))
 
-            try:
-                current_frame.place_configure(x=out_x, y=out_y)
-                incoming_frame.place_configure(x=in_x, y=in_y)
-            except tk.TclError:
-                self._record_animation_after_id = None
-                return
-
-            if progress >= 1.0:
-                try:
-                    current_frame.destroy()
-                except tk.TclError:
-                    pass
-                try:
-                    incoming_frame.place_configure(x=0, y=0, relwidth=1, relheight=1)
-                except tk.TclError:
-                    self._record_animation_after_id = None
-                    return
-                for child in self.record_view_host.winfo_children():
-                    if child is not incoming_frame:
-                        child.destroy()
-                self._record_animation_after_id = None
-                return
+            current_frame.place_configure(x=out_x, y=out_y)
+            incoming_frame.place_configure(x=in_x, y=in_y)
+            if progress < 1.0:
+                return False
 
-            self._record_animation_after_id = self.after(ANIMATION_MS, tick)
+            incoming_frame.place_configure(x=0, y=0, relwidth=1, relheight=1)
+            self._hide_idle_record_frames()
+            return True
 
-        self._record_animation_after_id = self.after(ANIMATION_MS, tick)
+        self._animation_clock.start("record", step)
 
     def _build_record_frame(self, record_id: str | None) -> tuple[tk.Frame, tk.Text]:
+        slot = self._acquire_record_slot()
+        self._populate_record_widget(slot.text, slot.media_host, record_id)
+        return slot.frame, slot.text
+
+    def _acquire_record_slot(self) -> RecordFrameSlot:
+        for slot in self._record_slots:
+            if slot.frame is not self._record_current_frame:
+                return slot
+        slot = self._create_record_slot()
+        self._record_slots.append(slot)
+        return slot
+
+    def _create_record_slot(self) -> RecordFrameSlot:
         frame = tk.Frame(
             self.record_view_host,
             bg="#0f0f12",
@@ -1329,12 +1755,18 @@ class IndexApp(tk.Tk):
         text_scroll.grid(row=1, column=1, sticky="ns")
         text.configure(yscrollcommand=text_scroll.set)
         self._apply_text_tags(text)
-        self._populate_record_widget(text, media_host, record_id)
-        return frame, text
+        return RecordFrameSlot(frame=frame, media_host=media_host, text=text)
+
+    def _hide_idle_record_frames(self) -> None:
+        for slot in self._record_slots:
+            if slot.frame is not self._record_current_frame:
+                slot.frame.place_forget()
 
     def _populate_record_widget(self, widget: tk.Text, media_host: tk.Frame, record_id: str | None) -> None:
+        self._cancel_record_stream()
         widget.configure(state="normal")
         widget.delete("1.0", "end")
+        self._link_registry(widget).clear()
 
         if not record_id or record_id not in self.records:
             self._clear_media_host(media_host)
@@ -1343,29 +1775,97 @@ class IndexApp(tk.Tk):
             return
 
         record = self.records[record_id]
-        body, lead_media = self._extract_lead_media(record.body)
-        self._populate_lead_media(media_host, lead_media)
+        compiled = self._compile_record(record)
+        self._populate_lead_media(media_host, compiled.lead_media)
 
+        runs: list[MarkdownRun] = []
         if record.title:
-            widget.insert("end", record.title + "\n", ("h2",))
-            widget.insert("end", "\n")
+            self._append_run(runs, record.title + "\n", ("h2",))
+            self._append_run(runs, "\n")
 
-        if body:
-            self._insert_markdown(widget, body)
+        runs.extend(compiled.runs)
 
         if record.edges:
-            widget.insert("end", "\nRelated records\n", ("h3",))
+            self._append_run(runs, "\nRelated records\n", ("h3",))
             for edge in record.edges:
-                widget.insert("end", f"- {edge.type} -> ", ("bullet",))
+                self._append_run(runs, f"- {edge.type} -> ", ("bullet",))
                 if edge.target in self.records:
                     label = self.records[edge.target].title or edge.target
-                    self._insert_link(widget, label, edge.target)
+                    self._append_run(runs, label, (), edge.target)
                 else:
-                    widget.insert("end", edge.target, ("muted",))
-                widget.insert("end", "\n")
+                    self._append_run(runs, edge.target, ("muted",))
+                self._append_run(runs, "\n")
 
+        chunks = self._chunk_runs(runs, RECORD_CHUNK_LINES, RECORD_CHUNK_CHARS)
+        if chunks:
+            self._insert_runs(widget, chunks[0])
         widget.configure(state="disabled")
         widget.see("1.0")
+        if len(chunks) > 1:
+            self._record_stream_widget = widget
+            self._record_stream_chunks = deque(chunks[1:])
+            self._record_stream_after_id = self.after_idle(self._stream_record_chunks)
+
+    def _chunk_runs(self, runs: list[MarkdownRun], max_lines: int, max_chars: int) -> list[list[MarkdownRun]]:
+        chunks: list[list[MarkdownRun]] = []
+        current: list[MarkdownRun] = []
+        lines = 0
+        chars = 0
+        for text, tags, target in runs:
+            while text:
+                cut = len(text)
+                if target is None:
+                    newline = -1
+                    for _ in range(max_lines - lines):
+                        newline = text.find("\n", newline + 1)
+                        if newline < 0:
+                            break
+                    if newline >= 0:
+                        cut = newline + 1
+                    cut = min(cut, max(1, max_chars - chars))
+                piece, text = text[:cut], text[cut:]
+                current.append((piece, tags, target))
+                lines += piece.count("\n")
+                chars += len(piece)
+                if lines >= max_lines or chars >= max_chars:
+                    chunks.append(current)
+                    current = []
+                    lines = 0
+                    chars = 0
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _stream_record_chunks(self) -> None:
+        self._record_stream_after_id = None
+        widget = self._record_stream_widget
+        if widget is None:
+            return
+        deadline = time.perf_counter() + RECORD_STREAM_SLICE_MS / 1000.0
+        try:
+            widget.configure(state="normal")
+            while self._record_stream_chunks:
+                self._insert_runs(widget, self._record_stream_chunks.popleft())
+                if time.perf_counter() >= deadline:
+                    break
+            widget.configure(state="disabled")
+        except tk.TclError:
+            self._cancel_record_stream()
+            return
+        if self._record_stream_chunks:
+            self._record_stream_after_id = self.after_idle(self._stream_record_chunks)
+        else:
+            self._record_stream_widget = None
+
+    def _cancel_record_stream(self) -> None:
+        self._record_stream_widget = None
+        self._record_stream_chunks.clear()
+        if self._record_stream_after_id:
+            try:
+                self.after_cancel(self._record_stream_after_id)
+            except tk.TclError:
+                pass
+            self._record_stream_after_id = None
 
     def _populate_lead_media(self, media_host: tk.Frame, lead_media: LeadMedia | None) -> None:
         self._clear_media_host(media_host)
@@ -1411,6 +1911,8 @@ class IndexApp(tk.Tk):
         body.columnconfigure(0, weight=1)
 
         rendered = self._try_embed_media(body, lead_media)
+        if not rendered:
+            rendered = self._try_svg_preview(body, lead_media)
         if not rendered:
             rendered = self._try_bitmap_preview(body, lead_media)
         if not rendered:
@@ -1484,34 +1986,182 @@ class IndexApp(tk.Tk):
         if local is None:
             return False
 
-        try:
-            image = tk.PhotoImage(file=str(local))
-        except Exception:
+        return self._show_media_preview(
+            parent,
+            media,
+            self._cached_bitmap_preview(local),
+            lambda on_ready: self._request_bitmap_preview(local, on_ready),
+        )
+
+    def _try_svg_preview(self, parent: tk.Frame, media: LeadMedia) -> bool:
+        if not self._is_svg_source(media.src) or not SVG_AVAILABLE or not DECODE_AVAILABLE or ImageTk is None:
             return False
 
-        max_width = 720
-        max_height = 180
-        step_x = max(1, math.ceil(image.width() / max_width))
-        step_y = max(1, math.ceil(image.height() / max_height))
-        step = max(step_x, step_y)
-        if step > 1:
-            image = image.subsample(step, step)
+        local = self._resolve_local_target_path(media.src)
+        if local is None:
+            return False
 
+        return self._show_media_preview(
+            parent,
+            media,
+            self._cached_svg_preview(local),
+            lambda on_ready: self._request_svg_preview(local, on_ready),
+        )
+
+    def _show_media_preview(
+        self,
+        parent: tk.Frame,
+        media: LeadMedia,
+        image: tk.PhotoImage | None,
+        request: Callable[[PreviewCallback], bool],
+    ) -> bool:
         label = tk.Label(
             parent,
-            image=image,
+            text="Loading preview...",
             bg="#0f0f12",
+            fg="#9da8bd",
             highlightbackground="#2a2f3a",
             highlightthickness=1,
             bd=0,
             relief="flat",
             cursor="hand2",
         )
-        label.image = image  # keep reference alive
         label.grid(row=0, column=0, sticky="nsew")
         label.bind("<Button-1>", lambda _event, src=media.src: self._open_target(src))
+
+        def show(image: tk.PhotoImage | None) -> None:
+            if not label.winfo_exists():
+                return
+            if image is None:
+                label.destroy()
+                self._render_media_fallback(parent, media)
+                return
+            label.configure(image=image, text="")
+            label.image = image  # keep reference alive
+
+        if image is not None:
+            show(image)
+        elif not request(show):
+            label.destroy()
+            return False
+        return True
+
+    def _cached_bitmap_preview(self, local: Path) -> tk.PhotoImage | None:
+        key = thumbnail_key(local, PREVIEW_MAX_SIZE)
+        if key is None:
+            return None
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        thumbnail = self._image_pipeline.cached(local, PREVIEW_MAX_SIZE)
+        if thumbnail is None or ImageTk is None:
+            return None
+        return self._store_bitmap_preview(key, ImageTk.PhotoImage(thumbnail))
+
+    def _request_bitmap_preview(self, local: Path, on_ready: PreviewCallback | None) -> bool:
+        if not DECODE_AVAILABLE or ImageTk is None:
+            image = self._decode_bitmap_preview(local)
+            if image is not None and on_ready is not None:
+                on_ready(image)
+            return image is not None
+        future = self._image_pipeline.submit(local, PREVIEW_MAX_SIZE)
+        if future is None:
+            return False
+        self._queue_image_job(future, lambda thumbnail: self._bitmap_photo(local, thumbnail), on_ready)
+        return True
+
+    def _bitmap_photo(self, local: Path, thumbnail: object) -> tk.PhotoImage:
+        key = thumbnail_key(local, PREVIEW_MAX_SIZE)
+        cached = self._preview_cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        image = ImageTk.PhotoImage(thumbnail)
+        if key is not None:
+            self._store_bitmap_preview(key, image)
+        return image
+
+    def _cached_svg_preview(self, local: Path) -> tk.PhotoImage | None:
+        key = self._svg_rasters.key(local)
+        if key is None:
+            return None
+        cached = self._preview_cache.get(("svg", key))
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        png_bytes = self._svg_rasters.cached(local)
+        if png_bytes is None:
+            return None
+        return self._svg_photo(key, png_bytes)
+
+    def _request_svg_preview(self, local: Path, on_ready: PreviewCallback | None) -> bool:
+        key = self._svg_rasters.key(local)
+        future = self._svg_rasters.submit(local)
+        if key is None or future is None:
+            return False
+        self._queue_image_job(future, lambda png_bytes: self._svg_photo(key, png_bytes), on_ready)
         return True
 
+    def _svg_photo(self, key: str, png_bytes: object) -> tk.PhotoImage | None:
+        try:
+            thumbnail = decode_thumbnail(BytesIO(png_bytes), PREVIEW_MAX_SIZE)  # type: ignore[arg-type]
+        except Exception:
+            return None
+        return self._store_bitmap_preview(("svg", key), ImageTk.PhotoImage(thumbnail))
+
+    def _queue_image_job(
+        self,
+        future: Future,
+        finish: Callable[[object], tk.PhotoImage | None],
+        on_ready: PreviewCallback | None,
+    ) -> None:
+        self._image_jobs.append((future, finish, on_ready))
+        if self._image_poll_after_id is None:
+            self._image_poll_after_id = self.after(IMAGE_POLL_MS, self._poll_image_jobs)
+
+    def _poll_image_jobs(self) -> None:
+        self._image_poll_after_id = None
+        waiting: list[ImageJob] = []
+        for job in self._image_jobs:
+            future, finish, on_ready = job
+            if not future.done():
+                waiting.append(job)
+                continue
+            image = None
+            try:
+                result = future.result()
+            except Exception:
+                result = None
+            if result is not None:
+                image = finish(result)
+            if on_ready is not None:
+                try:
+                    on_ready(image)
+                except tk.TclError:
+                    pass
+        self._image_jobs = waiting
+        if waiting:
+            self._image_poll_after_id = self.after(IMAGE_POLL_MS, self._poll_image_jobs)
+
+    def _decode_bitmap_preview(self, local: Path) -> tk.PhotoImage | None:
+        key = thumbnail_key(local, PREVIEW_MAX_SIZE)
+        if key is None:
+            return None
+        try:
+            image = tk.PhotoImage(file=str(local))
+        except Exception:
+            return None
+
+        max_width, max_height = PREVIEW_MAX_SIZE
+        step_x = max(1, math.ceil(image.width() / max_width))
+        step_y = max(1, math.ceil(image.height() / max_height))
+        step = max(step_x, step_y)
+        if step > 1:
+            image = image.subsample(step, step)
+        return self._store_bitmap_preview(key, image)
+
+    def _store_bitmap_preview(self, key: object, image: tk.PhotoImage) -> tk.PhotoImage:
+        self._preview_cache.put(key, image, image.width() * image.height() * 4)
+        return image
+
     def _render_media_fallback(self, parent: tk.Frame, media: LeadMedia) -> None:
         note = (
             "Inline HTML/SVG preview requires `tkinterweb`."
@@ -1550,35 +2200,34 @@ class IndexApp(tk.Tk):
         ).grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
 
     def _set_record_frame(self, frame: tk.Frame, record_id: str | None) -> None:
-        for child in self.record_view_host.winfo_children():
-            if child is not frame:
-                child.destroy()
         frame.place(x=0, y=0, relwidth=1, relheight=1)
         self._record_current_frame = frame
         self._record_current_id = record_id
+        self._hide_idle_record_frames()
 
     def _stop_record_animation(self, normalize_current: bool = False) -> None:
-        if self._record_animation_after_id:
-            try:
-                self.after_cancel(self._record_animation_after_id)
-            except tk.TclError:
-                pass
-            self._record_animation_after_id = None
-        self._record_animation_token += 1
+        self._animation_clock.stop("record")
         if normalize_current and self._record_current_frame is not None:
             try:
                 self._record_current_frame.place(x=0, y=0, relwidth=1, relheight=1)
             except tk.TclError:
                 self._record_current_frame = None
                 self._record_current_id = None
-        for child in self.record_view_host.winfo_children():
-            if child is not self._record_current_frame:
-                child.destroy()
+        self._hide_idle_record_frames()
 
-    def _queue_record_transition(self, from_id: str | None, to_id: str | None, from_tour: bool = False) -> None:
+    def _queue_record_transition(
+        self,
+        from_id: str | None,
+        to_id: str | None,
+        from_tour: bool = False,
+        transition: dict[str, float] | None = None,
+    ) -> None:
         if not from_id or not to_id or from_id == to_id:
             self._pending_record_transition = None
             return
+        if transition is not None:
+            self._pending_record_transition = {**transition, "from_id": from_id, "to_id": to_id}
+            return
         self._pending_record_transition = self._describe_record_transition(from_id, to_id, from_tour=from_tour)
 
     def _describe_record_transition(self, from_id: str, to_id: str, from_tour: bool = False) -> dict[str, float | str]:
@@ -1596,9 +2245,9 @@ class IndexApp(tk.Tk):
             dir_y = -lat_delta
             distance_fraction = self._great_circle_distance_fraction(from_coords, to_coords)
         else:
-            from_idx = self.order.index(from_id) if from_id in self.order else -1
-            to_idx = self.order.index(to_id) if to_id in self.order else -1
-            if from_idx >= 0 and to_idx >= 0:
+            from_idx = self.discovery.position(from_id)
+            to_idx = self.discovery.position(to_id)
+            if from_idx is not None and to_idx is not None:
                 idx_delta = to_idx - from_idx
                 dir_x = 1.0 if idx_delta == 0 else float(math.copysign(1.0, idx_delta))
                 dir_y = 0.0
@@ -1726,7 +2375,52 @@ class IndexApp(tk.Tk):
             }
         return references
 
-    def _insert_markdown(self, widget: tk.Text, text: str) -> None:
+    def _compile_record(self, record: Record) -> CompiledRecord:
+        body_hash = hash(record.body)
+        cached = self._markdown_cache.get(record.record_id)
+        if isinstance(cached, CompiledRecord) and cached.body_hash == body_hash:
+            return cached
+        body, lead_media = self._extract_lead_media(record.body)
+        compiled = CompiledRecord(
+            body_hash=body_hash,
+            lead_media=lead_media,
+            runs=self._compile_markdown(body) if body else [],
+        )
+        cost = len(record.body) * 2 + sum(len(text) * 2 + 96 for text, _tags, _target in compiled.runs)
+        self._markdown_cache.put(record.record_id, compiled, cost)
+        return compiled
+
+    def _append_run(
+        self,
+        runs: list[MarkdownRun],
+        text: str,
+        tags: tuple[str, ...] = (),
+        target: str | None = None,
+    ) -> None:
+        if not text:
+            return
+        if target is None and runs:
+            last_text, last_tags, last_target = runs[-1]
+            if last_target is None and last_tags == tags:
+                runs[-1] = (last_text + text, tags, None)
+                return
+        runs.append((text, tags, target))
+
+    def _insert_runs(self, widget: tk.Text, runs: list[MarkdownRun]) -> None:
+        batch: list[object] = []
+        for text, tags, target in runs:
+            if target is None:
+                batch.extend((text, tags))
+                continue
+            if batch:
+                widget.insert("end", *batch)
+                batch = []
+            self._insert_link(widget, text, target, tags)
+        if batch:
+            widget.insert("end", *batch)
+
+    def _compile_markdown(self, text: str) -> list[MarkdownRun]:
+        runs: list[MarkdownRun] = []
         lines = text.splitlines()
         references = self._collect_markdown_references(lines)
 
@@ -1750,10 +2444,10 @@ class IndexApp(tk.Tk):
             line = raw_line.rstrip()
             if line.startswith("```"):
                 in_code = not in_code
-                widget.insert("end", line + "\n", ("fence",))
+                self._append_run(runs, line + "\n", ("fence",))
                 continue
             if in_code:
-                widget.insert("end", line + "\n", ("code",))
+                self._append_run(runs, line + "\n", ("code",))
                 continue
 
             image_line_match = re.match(
@@ -1770,48 +2464,49 @@ class IndexApp(tk.Tk):
                     if ref:
                         media = LeadMedia(src=ref["href"], alt=image_line_match.group(3), title=ref.get("title", ""))
                 if media and not self._is_javascript_uri(media.src):
-                    widget.insert("end", "Media: ", ("muted",))
-                    self._insert_link(widget, media.alt or media.src, media.src, ("media",))
-                    widget.insert("end", "\n")
+                    self._append_run(runs, "Media: ", ("muted",))
+                    self._append_run(runs, media.alt or media.src, ("media",), media.src)
+                    self._append_run(runs, "\n")
                 else:
-                    widget.insert("end", line + "\n")
+                    self._append_run(runs, line + "\n")
                 continue
 
             heading_match = re.match(r"^(#{1,4})\s+(.*)$", line)
             if heading_match:
                 level = min(4, len(heading_match.group(1)))
                 tag = "h2" if level == 1 else "h3" if level == 2 else "h4"
-                self._insert_inline_markdown(widget, heading_match.group(2), references, (tag,))
-                widget.insert("end", "\n")
+                self._compile_inline_markdown(runs, heading_match.group(2), references, (tag,))
+                self._append_run(runs, "\n")
                 continue
 
             if re.match(r"^\s*(-|\*|\d+\.)\s+", line):
-                widget.insert("end", "- ", ("bullet",))
+                self._append_run(runs, "- ", ("bullet",))
                 cleaned = re.sub(r"^\s*(-|\*|\d+\.)\s+", "", line)
-                self._insert_inline_markdown(widget, cleaned, references, ("bullet",))
-                widget.insert("end", "\n")
+                self._compile_inline_markdown(runs, cleaned, references, ("bullet",))
+                self._append_run(runs, "\n")
                 continue
 
             if re.match(r"^\s*>\s+", line):
                 cleaned = re.sub(r"^\s*>\s+", "", line)
-                self._insert_inline_markdown(widget, cleaned, references, ("quote",))
-                widget.insert("end", "\n")
+                self._compile_inline_markdown(runs, cleaned, references, ("quote",))
+                self._append_run(runs, "\n")
                 continue
 
             if re.match(r"^\s*---+\s*$", line):
-                widget.insert("end", "----------------------------------------\n", ("rule",))
+                self._append_run(runs, "----------------------------------------\n", ("rule",))
                 continue
 
             if not line.strip():
-                widget.insert("end", "\n")
+                self._append_run(runs, "\n")
                 continue
 
-            self._insert_inline_markdown(widget, line, references)
-            widget.insert("end", "\n")
+            self._compile_inline_markdown(runs, line, references)
+            self._append_run(runs, "\n")
+        return runs
 
-    def _insert_inline_markdown(
+    def _compile_inline_markdown(
         self,
-        widget: tk.Text,
+        runs: list[MarkdownRun],
         text: str,
         references: dict[str, dict[str, str]],
         extra_tags: tuple[str, ...] = (),
@@ -1820,47 +2515,47 @@ class IndexApp(tk.Tk):
         for match in INLINE_TOKEN_RE.finditer(text):
             start, end = match.span()
             if start > cursor:
-                widget.insert("end", text[cursor:start], extra_tags)
+                self._append_run(runs, text[cursor:start], extra_tags)
 
             token_text = match.group(0)
             if match.group(1) is not None:
                 alt = match.group(1)
                 src = match.group(2).strip()
                 if self._is_javascript_uri(src):
-                    widget.insert("end", token_text, extra_tags)
+                    self._append_run(runs, token_text, extra_tags)
                 else:
-                    self._insert_link(widget, f"[media] {alt or src}", src, ("media", *extra_tags))
+                    self._append_run(runs, f"[media] {alt or src}", ("media", *extra_tags), src)
             elif match.group(3) is not None:
                 alt = match.group(3)
                 ref_key = match.group(4).strip().lower()
                 ref = references.get(ref_key)
                 if ref and not self._is_javascript_uri(ref["href"]):
-                    self._insert_link(widget, f"[media] {alt or ref['href']}", ref["href"], ("media", *extra_tags))
+                    self._append_run(runs, f"[media] {alt or ref['href']}", ("media", *extra_tags), ref["href"])
                 else:
-                    widget.insert("end", token_text, extra_tags)
+                    self._append_run(runs, token_text, extra_tags)
             elif match.group(5) is not None:
                 label = match.group(5)
                 href = match.group(6).strip()
                 if self._is_javascript_uri(href):
-                    widget.insert("end", token_text, extra_tags)
+                    self._append_run(runs, token_text, extra_tags)
                 else:
-                    self._insert_link(widget, label, href, extra_tags)
+                    self._append_run(runs, label, extra_tags, href)
             elif match.group(7) is not None:
                 label = match.group(7)
                 ref_key = match.group(8).strip().lower()
                 ref = references.get(ref_key)
                 if ref and not self._is_javascript_uri(ref["href"]):
-                    self._insert_link(widget, label, ref["href"], extra_tags)
+                    self._append_run(runs, label, extra_tags, ref["href"])
                 else:
-                    widget.insert("end", token_text, extra_tags)
+                    self._append_run(runs, token_text, extra_tags)
             elif match.group(9) is not None:
                 raw = match.group(9)
                 href = f"https://{raw}" if raw.startswith("www.") else raw
-                self._insert_link(widget, raw, href, extra_tags)
+                self._append_run(runs, raw, extra_tags, href)
             cursor = end
 
         if cursor < len(text):
-            widget.insert("end", text[cursor:], extra_tags)
+            self._append_run(runs, text[cursor:], extra_tags)
 
     def _insert_link(
         self,
@@ -1869,24 +2564,55 @@ class IndexApp(tk.Tk):
         target: str,
         extra_tags: tuple[str, ...] = (),
     ) -> None:
-        tag = f"link_{self._link_counter}"
-        self._link_counter += 1
-        widget.tag_configure(tag, foreground="#7cc7ff", underline=True)
-
+        start = widget.index("end-1c")
+        widget.insert("end", label, ("link", *extra_tags))
+        self._link_registry(widget).add(start, widget.index("end-1c"), target)
+
+    def _link_registry(self, widget: tk.Text) -> LinkRegistry:
+        registry = getattr(widget, "link_registry", None)
+        if registry is None:
+            registry = LinkRegistry()
+            widget.link_registry = registry
+        return registry
+
+    def _on_link_click(self, event: tk.Event) -> None:
+        widget = event.widget
+        try:
+            index = widget.index("current")
+        except tk.TclError:
+            return
+        target = self._link_registry(widget).lookup(index)
+        if not target:
+            return
         internal_target = self._resolve_internal_target(target)
         if internal_target:
-            widget.tag_bind(tag, "<Button-1>", lambda _event, rid=internal_target: self._select_record(rid))
-        else:
-            widget.tag_bind(tag, "<Button-1>", lambda _event, uri=target: self._open_target(uri))
+            path, record_id = internal_target
+            if path == self.db_path:
+                self._select_record(record_id)
+            else:
+                self._switch_db(path, preferred_record_id=record_id)
+            return
+        if self._clean_target(target).lower().startswith("toot:"):
+            # Unresolvable toot links must not navigate anywhere (TTCP-RFC-0003 §2.3).
+            return
+        self._open_target(target)
 
-        widget.tag_bind(tag, "<Enter>", lambda _event: widget.configure(cursor="hand2"))
-        widget.tag_bind(tag, "<Leave>", lambda _event: widget.configure(cursor=""))
-        widget.insert("end", label, (tag, *extra_tags))
+    def _resolve_internal_target(self, target: str) -> tuple[Path, str] | None:
+        cleaned = self._clean_target(target)
+        toot_match = re.match(r"^toot:(?://)?(.*)$", cleaned, re.I)
+        if toot_match:
+            alias, _, token = toot_match.group(1).strip().strip("/").rpartition("/")
+            resolved = self._alias_index.resolve(alias or None, token, self.db_path)
+        else:
+            resolved = self._resolve_ttdb_target(cleaned)
+        if resolved is None:
+            return None
+        # Header scans also see special records, which are not selectable.
+        if resolved[0] == self.db_path and resolved[1] not in self.records:
+            return None
+        return resolved
 
-    def _resolve_internal_target(self, target: str) -> str | None:
-        cleaned = target.strip()
-        if cleaned.startswith("<") and cleaned.endswith(">"):
-            cleaned = cleaned[1:-1].strip()
+    def _resolve_ttdb_target(self, cleaned: str) -> tuple[Path, str] | None:
         if "#" in cleaned:
             cleaned = cleaned.rsplit("#", 1)[-1].strip()
         if cleaned.startswith("ttdb://"):
@@ -1898,7 +2624,11 @@ class IndexApp(tk.Tk):
         if not cleaned:
             return None
         if cleaned in self.records:
-            return cleaned
+            return self.db_path, cleaned
+        # Legacy "@LAT45LON-120 db_alias" form (TTCP-RFC-0003 §3.2).
+        record_id, _, alias = cleaned.partition(" ")
+        if record_id.startswith("@") and alias.strip():
+            return self._alias_index.resolve(alias.strip(), record_id, self.db_path)
         return None
 
     def _is_javascript_uri(self, target: str) -> bool:
@@ -1917,6 +2647,11 @@ class IndexApp(tk.Tk):
         return target, ""
 
     def _resolve_asset_path(self, value: str) -> Path | None:
+        return self._asset_paths.lookup(  # type: ignore[return-value]
+            str(self.db_path), "asset", value, lambda: self._lookup_asset_path(value)
+        )
+
+    def _lookup_asset_path(self, value: str) -> Path | None:
         cleaned = value.strip()
         if not cleaned:
             return None
@@ -1927,13 +2662,20 @@ class IndexApp(tk.Tk):
             return candidate.resolve()
         db_dir = self.db_path.resolve().parent if self.db_path.exists() else Path.cwd()
         nested = (db_dir / candidate).resolve()
+        self._asset_paths.watch(str(self.db_path), nested.parent)
         if nested.exists():
             return nested
+        self._asset_paths.watch(str(self.db_path), candidate.absolute().parent)
         if candidate.exists():
             return candidate.resolve()
         return None
 
     def _resolve_local_target_path(self, target: str) -> Path | None:
+        return self._asset_paths.lookup(  # type: ignore[return-value]
+            str(self.db_path), "local", target, lambda: self._lookup_local_target_path(target)
+        )
+
+    def _lookup_local_target_path(self, target: str) -> Path | None:
         cleaned = self._clean_target(target)
         if not cleaned or re.match(r"^[A-Za-z][A-Za-z0-9+.-]*://", cleaned):
             return None
@@ -1943,6 +2685,11 @@ class IndexApp(tk.Tk):
         return self._resolve_asset_path(base)
 
     def _target_to_external_uri(self, target: str) -> str | None:
+        return self._asset_paths.lookup(  # type: ignore[return-value]
+            str(self.db_path), "uri", target, lambda: self._lookup_external_uri(target)
+        )
+
+    def _lookup_external_uri(self, target: str) -> str | None:
         cleaned = self._clean_target(target)
         if not cleaned or self._is_javascript_uri(cleaned):
             return None
@@ -1959,6 +2706,11 @@ class IndexApp(tk.Tk):
         return cleaned
 
     def _media_extension(self, target: str) -> str:
+        return self._asset_paths.lookup(  # type: ignore[return-value]
+            "", "ext", target, lambda: self._lookup_media_extension(target)
+        )
+
+    def _lookup_media_extension(self, target: str) -> str:
         cleaned = self._clean_target(target)
         if not cleaned:
             return ""
@@ -1974,7 +2726,8 @@ class IndexApp(tk.Tk):
         return self._media_extension(target) == ".svg"
 
     def _is_bitmap_preview_source(self, target: str) -> bool:
-        return self._media_extension(target) in {".png", ".gif", ".ppm", ".pgm"}
+        extensions = PILLOW_PREVIEW_EXTENSIONS if DECODE_AVAILABLE and ImageTk is not None else TK_PREVIEW_EXTENSIONS
+        return self._media_extension(target) in extensions
 
     def _open_target(self, target: str) -> None:
         uri = self._target_to_external_uri(target)
@@ -1990,14 +2743,9 @@ class IndexApp(tk.Tk):
                 webbrowser.open(str(self.db_path))
 
     def _forget_discoveries(self) -> None:
-        try:
-            if self.discovery_path.exists():
-                self.discovery_path.unlink()
-        except Exception:
-            pass
+        self._state_store.clear_discovery(self._db_identity)
         self._initialize_discovery()
-        self._apply_search(prefer_visible_selection=True, schedule_tour=False)
-        self._set_status_link()
+        self._refresh_view({VIEW_DISCOVERY}, prefer_visible_selection=True)
         self._note_interaction()
 
     def _on_tour_toggle(self) -> None:
@@ -2044,6 +2792,10 @@ class IndexApp(tk.Tk):
 
     def _schedule_tour(self) -> None:
         self._clear_tour(stop_audio=False)
+        if self._scene_player is not None:
+            self._set_tour_audio_playing(False)
+            self.tour_note_var.set("Guided tour is paused while the scene plays.")
+            return
         discovered_order = self._get_discovered_order()
         selected_record_audio_path, _selected_record_audio_loop = self._get_record_audio_config(self.selected_id)
         should_play_audio = (
@@ -2072,17 +2824,167 @@ class IndexApp(tk.Tk):
 
     def _advance_tour(self) -> None:
         self._tour_after_id = None
-        order = self._get_discovered_order()
-        if not self.tour_enabled.get() or not order:
+        if not self.tour_enabled.get():
+            return
+        next_id = self._tour_successor(self.selected_id)
+        if next_id is None:
             return
-        try:
-            idx = order.index(self.selected_id) if self.selected_id else 0
-        except ValueError:
-            idx = 0
-        next_id = order[(idx + 1) % len(order)]
         self._select_record(next_id, from_tour=True)
         self._schedule_tour()
 
+    def _tour_successor(self, record_id: str | None) -> str | None:
+        return self._tour_planner.successor(record_id)
+
+    def _update_scene_controls(self) -> None:
+        record = self.records.get(self.selected_id) if self.selected_id else None
+        playing = self._scene_player is not None
+        if record is None or record.scene is None:
+            if not playing:
+                self.scene_controls.grid_remove()
+                return
+        self.scene_controls.grid(row=1, column=0, columnspan=2, sticky="w", pady=(6, 0))
+        if playing:
+            self.scene_play_button.configure(text="Replay Scene")
+            self.scene_stop_button.state(["!disabled"])
+            looping = self._scene_player.timeline.loop_from is not None
+            status = "Playing scene loop" if looping else "Playing scene"
+            late_ms = self._scene_player.max_late_ms
+            if late_ms >= SCENE_LATE_NOTICE_MS:
+                status += f" (cues up to {late_ms:.0f} ms late)"
+            self.scene_status_var.set(f"{status}.")
+            return
+        self.scene_play_button.configure(text="Play Scene")
+        self.scene_stop_button.state(["disabled"])
+        edge_count = len(record.scene.edges)
+        self.scene_status_var.set(f"{edge_count} transitions ready." if edge_count else "No transitions configured.")
+
+    def _start_scene(self) -> None:
+        record_id = self.selected_id if self._scene_player is None else self._scene_record_id
+        record = self.records.get(record_id) if record_id else None
+        if record is None or record.scene is None:
+            return
+        timeline = compile_scene(record.scene, lambda value: value in self.records)
+        if timeline is None:
+            self.scene_status_var.set("Scene has no playable transitions.")
+            return
+        self._stop_scene(resume=False)
+        self._clear_tour(stop_audio=True)
+        self._stop_record_audio()
+        for scene_record_id in timeline.record_ids:
+            self._prefetch_record(self.records[scene_record_id])
+        audio = self._resolve_asset_path(timeline.audio_path) if timeline.audio_path else None
+        if audio is not None and audio.suffix.lower() == ".wav":
+            self._audio.play("scene", audio, loop=True)
+        self._scene_record_id = record_id
+        self._scene_player = ScenePlayer(timeline, time.perf_counter())
+        self._scene_tick()
+
+    def _stop_scene(self, resume: bool = True) -> None:
+        if self._scene_after_id:
+            try:
+                self.after_cancel(self._scene_after_id)
+            except tk.TclError:
+                pass
+            self._scene_after_id = None
+        if self._scene_player is None:
+            return
+        self._scene_player = None
+        self._scene_record_id = None
+        self._audio.stop("scene")
+        self._update_scene_controls()
+        if resume:
+            self._play_record_audio_for_selection(self.selected_id, restart=False, suppress=False)
+            self._schedule_tour()
+
+    def _scene_tick(self) -> None:
+        self._scene_after_id = None
+        player = self._scene_player
+        if player is None:
+            return
+        fired = player.due(time.perf_counter())
+        if any(cue.kind == "stop" for cue, _scheduled in fired):
+            fired = [item for item in fired if item[0].kind == "select"]
+            player = None
+        # After a stall only the latest due selection is shown.
+        selects = [(cue, scheduled) for cue, scheduled in fired if cue.record_id in self.records]
+        if selects:
+            cue, scheduled = selects[-1]
+            transition = None if cue.transition is None else {**cue.transition, "started_at": scheduled}
+            self._select_record(cue.record_id, from_scene=True, transition=transition)  # type: ignore[arg-type]
+        if player is None:
+            self._stop_scene()
+            return
+        delay_ms = player.next_delay_ms(time.perf_counter())
+        if delay_ms is not None:
+            self._scene_after_id = self.after(delay_ms, self._scene_tick)
+
+    def _prefetch_candidates(self, record_id: str | None) -> list[str]:
+        record = self.records.get(record_id) if record_id else None
+        if record is None:
+            return []
+        candidates: list[str] = []
+        if self.tour_enabled.get():
+            successor = self._tour_successor(record_id)
+            if successor and successor != record_id:
+                candidates.append(successor)
+        neighbors = 0
+        for edge in record.edges:
+            if neighbors >= PREFETCH_EDGE_NEIGHBORS:
+                break
+            if edge.target == record_id or edge.target not in self.records:
+                continue
+            neighbors += 1
+            if edge.target not in candidates:
+                candidates.append(edge.target)
+        return candidates
+
+    def _schedule_prefetch(self) -> None:
+        self._cancel_prefetch()
+        self._prefetch_queue = self._prefetch_candidates(self.selected_id)
+        if self._prefetch_queue:
+            self._prefetch_after_id = self.after_idle(self._run_prefetch)
+
+    def _cancel_prefetch(self) -> None:
+        self._prefetch_queue = []
+        if self._prefetch_after_id:
+            try:
+                self.after_cancel(self._prefetch_after_id)
+            except tk.TclError:
+                pass
+            self._prefetch_after_id = None
+
+    def _run_prefetch(self) -> None:
+        self._prefetch_after_id = None
+        if not self._prefetch_queue:
+            return
+        # Keep decode work out of the slide transition's frame budget.
+        if self._animation_clock.is_running("record"):
+            self._prefetch_after_id = self.after(PREFETCH_RETRY_MS, self._run_prefetch)
+            return
+        record = self.records.get(self._prefetch_queue.pop(0))
+        if record is not None:
+            self._prefetch_record(record)
+        if self._prefetch_queue:
+            self._prefetch_after_id = self.after_idle(self._run_prefetch)
+
+    def _prefetch_record(self, record: Record) -> None:
+        audio_path, _audio_loop = self._get_record_audio_config(record.record_id)
+        audio_local = self._resolve_asset_path(audio_path) if audio_path else None
+        if audio_local is not None and audio_local.suffix.lower() == ".wav":
+            self._audio.preload(audio_local)
+        compiled = self._compile_record(record)
+        media = compiled.lead_media
+        if media is None:
+            return
+        local = self._resolve_local_target_path(media.src)
+        if local is None:
+            return
+        if self._is_bitmap_preview_source(media.src):
+            if self._cached_bitmap_preview(local) is None:
+                self._request_bitmap_preview(local, None)
+        elif self._is_svg_source(media.src) and SVG_AVAILABLE and HtmlFrame is None and ImageTk is not None:
+            self._svg_rasters.submit(local)
+
     def _note_interaction(self) -> None:
         if self.tour_enabled.get():
             self.tour_paused = False
@@ -2121,7 +3023,7 @@ class IndexApp(tk.Tk):
         self.globe_rot_lat = self._clamp_lat(self.globe_rot_lat + dy * DRAG_SENSITIVITY * invert)
         self.globe_target_lat = self.globe_rot_lat
         self.globe_target_lon = self.globe_rot_lon
-        self.globe_animating = False
+        self._animation_clock.stop("globe")
         self._render_globe()
 
     def _on_graph_release(self, event: tk.Event) -> None:
@@ -2139,6 +3041,8 @@ class IndexApp(tk.Tk):
         self._globe_drag_moved = False
         if time.time() < self._globe_suppress_click_until:
             return
+        if self._select_db_near_point(event.x, event.y):
+            return
         if self._select_record_near_point(event.x, event.y):
             self._note_interaction()
 
@@ -2153,16 +3057,29 @@ class IndexApp(tk.Tk):
 
     def _set_globe_zoom(self, value: float) -> bool:
         clamped = min(GLOBE_ZOOM_MAX, max(GLOBE_ZOOM_MIN, value))
-        if abs(clamped - self.globe_zoom) < 0.0001:
+        if abs(clamped - self.globe_zoom_target) < 0.0001:
             return False
-        self.globe_zoom = clamped
-        self._render_globe()
+        self.globe_zoom_target = clamped
+        if not self._animation_clock.is_running("zoom"):
+            self._zoom_tween_last = time.perf_counter()
+            self._animation_clock.start("zoom", self._step_globe_zoom)
         return True
 
     def _zoom_globe_step(self, direction: int) -> bool:
         if direction > 0:
-            return self._set_globe_zoom(self.globe_zoom * GLOBE_ZOOM_STEP)
-        return self._set_globe_zoom(self.globe_zoom / GLOBE_ZOOM_STEP)
+            return self._set_globe_zoom(self.globe_zoom_target * GLOBE_ZOOM_STEP)
+        return self._set_globe_zoom(self.globe_zoom_target / GLOBE_ZOOM_STEP)
+
+    def _step_globe_zoom(self, now: float) -> bool:
+        elapsed_ms = (now - self._zoom_tween_last) * 1000.0
+        self._zoom_tween_last = now
+        self._globe_frame_dirty = True
+        delta = self.globe_zoom_target - self.globe_zoom
+        if abs(delta) < 0.002:
+            self.globe_zoom = self.globe_zoom_target
+            return True
+        self.globe_zoom += delta * decay_factor(elapsed_ms, GLOBE_ZOOM_EASE_TAU_MS)
+        return False
 
     def _find_nearest_record_to_center(self) -> str | None:
         width = self.graph_canvas.winfo_width()
@@ -2220,25 +3137,32 @@ class IndexApp(tk.Tk):
         rot_lat = math.atan2(y, z1)
         self.globe_target_lat = rot_lat
         self.globe_target_lon = rot_lon
-        if not self.globe_animating:
-            self.globe_animating = True
-            self.after(ANIMATION_MS, self._animate_globe)
-
-    def _animate_globe(self) -> None:
-        if not self.globe_animating:
-            return
+        if not self._animation_clock.is_running("globe"):
+            self._globe_tween_last = time.perf_counter()
+            self._animation_clock.start("globe", self._animate_globe)
+
+    def _animate_globe(self, now: float) -> bool:
+        # Exponential decay from wall-clock time: a slow frame covers more of the
+        # remaining distance instead of stretching the whole animation.
+        elapsed_ms = (now - self._globe_tween_last) * 1000.0
+        self._globe_tween_last = now
+        self._globe_frame_dirty = True
         delta_lat = self._angle_delta(self.globe_target_lat, self.globe_rot_lat)
         delta_lon = self._angle_delta(self.globe_target_lon, self.globe_rot_lon)
         if abs(delta_lat) < 0.002 and abs(delta_lon) < 0.002:
             self.globe_rot_lat = self.globe_target_lat
             self.globe_rot_lon = self.globe_target_lon
-            self.globe_animating = False
-            self._render_globe()
+            return True
+        factor = decay_factor(elapsed_ms, GLOBE_EASE_TAU_MS)
+        self.globe_rot_lat += delta_lat * factor
+        self.globe_rot_lon += delta_lon * factor
+        return False
+
+    def _on_animation_frame(self) -> None:
+        if not self._globe_frame_dirty:
             return
-        self.globe_rot_lat += delta_lat * 0.15
-        self.globe_rot_lon += delta_lon * 0.15
+        self._globe_frame_dirty = False
         self._render_globe()
-        self.after(ANIMATION_MS, self._animate_globe)
 
     def _angle_delta(self, target: float, current: float) -> float:
         delta = target - current
@@ -2259,16 +3183,18 @@ class IndexApp(tk.Tk):
     def _clamp_z_scale(self, scale: float) -> float:
         return max(Z_MIN_SCALE, min(Z_MAX_SCALE, scale))
 
-    def _project_point(self, lat: float, lon: float, depth: float) -> tuple[float, float, float]:
+    def _sphere_vector(self, lat: float, lon: float, depth: float) -> tuple[float, float, float]:
         lat_r = math.radians(lat)
         lon_r = math.radians(lon)
-        x = math.cos(lat_r) * math.sin(lon_r)
-        y = math.sin(lat_r)
-        z = math.cos(lat_r) * math.cos(lon_r)
         scale = self._clamp_z_scale(1.0 + depth * Z_SCALE)
-        x *= scale
-        y *= scale
-        z *= scale
+        return (
+            math.cos(lat_r) * math.sin(lon_r) * scale,
+            math.sin(lat_r) * scale,
+            math.cos(lat_r) * math.cos(lon_r) * scale,
+        )
+
+    def _project_point(self, lat: float, lon: float, depth: float) -> tuple[float, float, float]:
+        x, y, z = self._sphere_vector(lat, lon, depth)
 
         cos_y = math.cos(self.globe_rot_lon)
         sin_y = math.sin(self.globe_rot_lon)
@@ -2294,8 +3220,9 @@ class IndexApp(tk.Tk):
         if radius <= 10:
             return
 
-        cx = width / 2.0
+        cx = width / 2.0 + self._db_shift_px
         cy = height / 2.0
+        self._draw_db_side_globes(cx, cy, radius)
 
         canvas.create_oval(
             cx - radius,
@@ -2315,23 +3242,33 @@ class IndexApp(tk.Tk):
             width=1,
         )
 
-        self._draw_graticule(cx, cy, radius)
+        node_ids, node_vectors, edge_hubs = self._ensure_globe_edges()
+        self._globe_backend_active = self._select_globe_backend(len(node_ids))
+        if self._globe_backend_active == "raster":
+            self._render_globe_raster(width, height, cx, cy, radius)
+            return
 
-        visible_order = self._get_visible_order_for_graph()
-        visible_set = set(visible_order)
-        coords_entries = [(record_id, self.coords[record_id]) for record_id in visible_order if record_id in self.coords]
-        if not coords_entries:
+        self._draw_graticule(cx, cy, radius)
+        if not node_ids:
             return
 
         projections: dict[str, tuple[float, float, float]] = {}
+        screen_xy: list[float] = []
+        front: list[bool] = []
         nodes_front: list[tuple[str, float, float, float]] = []
         nodes_back: list[tuple[str, float, float, float]] = []
         selected_point: tuple[str, float, float, float] | None = None
-        for record_id, (lat, lon, depth) in coords_entries:
-            x, y, z = self._project_point(lat, lon, depth)
+        selected_index = -1
+        rotated = rotate_vectors(node_vectors, self.globe_rot_lat, self.globe_rot_lon)
+        for index, record_id in enumerate(node_ids):
+            x, y, z = rotated[index]
             projections[record_id] = (x, y, z)
+            screen_xy.append(cx + x * radius)
+            screen_xy.append(cy - y * radius)
+            front.append(z > 0)
             if record_id == self.selected_id:
                 selected_point = (record_id, x, y, z)
+                selected_index = index
             elif z > 0:
                 nodes_front.append((record_id, x, y, z))
             else:
@@ -2343,34 +3280,7 @@ class IndexApp(tk.Tk):
             canvas.create_oval(px - 3, py - 3, px + 3, py + 3, fill=PALETTE["node_back"], outline="")
 
         self._draw_discovery_halos(cx, cy, radius, projections)
-
-        for source_id, record in self.records.items():
-            if source_id not in visible_set:
-                continue
-            source_proj = projections.get(source_id)
-            if not source_proj:
-                continue
-            sx, sy, sz = source_proj
-            if sz <= 0:
-                continue
-            sxp = cx + sx * radius
-            syp = cy - sy * radius
-            for edge in record.edges:
-                target_id = edge.target
-                if target_id not in visible_set:
-                    continue
-                target_proj = projections.get(target_id)
-                if not target_proj:
-                    continue
-                tx, ty, tz = target_proj
-                if tz <= 0:
-                    continue
-                txp = cx + tx * radius
-                typ = cy - ty * radius
-                is_selected_edge = source_id == self.selected_id or target_id == self.selected_id
-                color = "#7cc7ff" if is_selected_edge else "#2a3a4d"
-                width_line = 2 if is_selected_edge else 1
-                canvas.create_line(sxp, syp, txp, typ, fill=color, width=width_line)
+        self._draw_edge_batches(edge_hubs, screen_xy, front, selected_index)
 
         for record_id, x, y, _z in nodes_front:
             px = cx + x * radius
@@ -2400,68 +3310,342 @@ class IndexApp(tk.Tk):
 
         if selected_point:
             record_id, x, y, _z = selected_point
-            px = cx + x * radius
-            py = cy - y * radius
-            eye_radius = max(8.0, min(15.0, 8.0 + 2.6 * math.sqrt(max(0.1, self.globe_zoom))))
-            to_center_x = cx - px
-            to_center_y = cy - py
-            mag = math.hypot(to_center_x, to_center_y) or 1.0
-            look_scale = eye_radius * 0.22
-            iris_cx = px + (to_center_x / mag) * look_scale
-            iris_cy = py + (to_center_y / mag) * look_scale
+            self._draw_selected_eye(record_id, cx + x * radius, cy - y * radius, cx, cy)
 
+    def _draw_db_side_globes(self, cx: float, cy: float, radius: float) -> None:
+        self._db_globe_targets = []
+        entries = self._db_catalog.side_order(self.db_path)
+        if not entries:
+            return
+        canvas = self.graph_canvas
+        background = PALETTE["graph_bg"]
+        side_radius = max(8.0, radius * DB_SIDE_GLOBE_SCALE)
+        first_offset = radius + side_radius * DB_SIDE_GLOBE_NEAR_OVERLAP
+        step_offset = side_radius * DB_SIDE_GLOBE_STEP
+        globes: list[tuple[int, Path, float]] = []
+        for path, side, rank in entries:
+            offset_x = side * (first_offset + (rank - 1) * step_offset)
+            globes.append((rank, path, cx + offset_x))
+            self._db_globe_targets.append((path, cx + offset_x, cy, side_radius, offset_x))
+
+        r = side_radius
+        y = cy
+        # Farther globes first so nearer ones overlap them.
+        for rank, path, x in reversed(globes):
+            depth_fade = max(0.28, 0.54 - (rank - 1) * 0.11)
+            halo_alpha = max(0.2, 0.56 - (rank - 1) * 0.1)
+            fill = blend_color("#070a12", background, min(0.95, 0.7 + depth_fade * 0.2))
             canvas.create_oval(
-                px - eye_radius,
-                py - eye_radius,
-                px + eye_radius,
-                py + eye_radius,
-                fill=PALETTE["selected_fill"],
-                outline=PALETTE["node_outline"],
-                width=2,
-                tags=("node", record_id),
+                x - r,
+                y - r,
+                x + r,
+                y + r,
+                fill=fill,
+                outline=blend_color("#7cc7ff", fill, 0.4 * depth_fade),
+                width=1.5,
+                tags=("db_globe",),
             )
             canvas.create_oval(
-                iris_cx - eye_radius * 0.54,
-                iris_cy - eye_radius * 0.54,
-                iris_cx + eye_radius * 0.54,
-                iris_cy + eye_radius * 0.54,
-                fill=PALETTE["selected_iris"],
-                outline=PALETTE["node_outline"],
-                width=1,
-                tags=("node", record_id),
+                x - r * 0.84,
+                y - r * 0.84,
+                x + r * 0.84,
+                y + r * 0.84,
+                outline=blend_color("#ffffff", fill, 0.22 * depth_fade),
+                tags=("db_globe",),
             )
             canvas.create_oval(
-                iris_cx - eye_radius * 0.28,
-                iris_cy - eye_radius * 0.28,
-                iris_cx + eye_radius * 0.28,
-                iris_cy + eye_radius * 0.28,
-                fill="#07090c",
+                x - r * 0.49,
+                y - r * 0.51,
+                x + r * 0.17,
+                y + r * 0.15,
+                fill=blend_color("#7cc7ff", fill, halo_alpha * 0.44),
                 outline="",
-                tags=("node", record_id),
+                tags=("db_globe",),
             )
-            canvas.create_oval(
-                iris_cx - eye_radius * 0.21 - eye_radius * 0.16,
-                iris_cy - eye_radius * 0.25 - eye_radius * 0.16,
-                iris_cx - eye_radius * 0.21 + eye_radius * 0.16,
-                iris_cy - eye_radius * 0.25 + eye_radius * 0.16,
-                fill="#ffffff",
-                outline="",
-                tags=("node", record_id),
+            label_size = max(8, int(r * 0.43))
+            canvas.create_text(
+                x,
+                y,
+                text=badge_label(path),
+                fill=blend_color("#e9f6ff", fill, 0.82 * depth_fade),
+                font=("Trebuchet MS", label_size, "bold"),
+                tags=("db_globe",),
             )
-            self.screen_points[record_id] = (px, py)
-
-            title = self.records.get(record_id).title if self.records.get(record_id) else None
-            if title:
-                label_size = max(10, min(16, int(11 * self.globe_zoom)))
+            cost_label = self._db_cost_labels.get(path)
+            if cost_label:
                 canvas.create_text(
-                    px + label_size * 0.7,
-                    py - label_size * 0.6,
-                    text=title,
-                    anchor="nw",
-                    fill="#e9e9f0",
-                    font=("Trebuchet MS", label_size, "bold"),
+                    x,
+                    y + r + max(7, label_size * 0.8),
+                    text=cost_label,
+                    fill=blend_color("#a7a7b3", background, depth_fade + 0.2),
+                    font=("Trebuchet MS", max(7, label_size - 3)),
+                    tags=("db_globe",),
                 )
 
+    def _select_db_near_point(self, x: float, y: float) -> bool:
+        for path, gx, gy, radius, offset_x in self._db_globe_targets:
+            if math.hypot(x - gx, y - gy) <= radius:
+                return self._switch_db(path, offset_x=offset_x)
+        return False
+
+    def _switch_db(self, path: Path, preferred_record_id: str | None = None, offset_x: float | None = None) -> bool:
+        if path == self.db_path or self._animation_clock.is_running("db_shift"):
+            return False
+        if offset_x is None:
+            offset_x = next((target[4] for target in self._db_globe_targets if target[0] == path), None)
+        if offset_x is None:
+            width = max(self.graph_canvas.winfo_width(), 1)
+            height = max(self.graph_canvas.winfo_height(), 1)
+            radius = max(10.0, self._get_globe_base_radius(width, height) * self.globe_zoom)
+            offset_x = radius + max(8.0, radius * DB_SIDE_GLOBE_SCALE) * DB_SIDE_GLOBE_NEAR_OVERLAP
+
+        self._clear_tour(stop_audio=True)
+        self._stop_scene(resume=False)
+        self._preferred_record_id = preferred_record_id
+        # Parsing starts now so it overlaps the slide instead of following it.
+        self._snapshots.prefetch([path])
+
+        start_px = self._db_shift_px
+        end_px = -offset_x
+        duration_ms = max(DB_SHIFT_MIN_MS, min(DB_SHIFT_MAX_MS, 260 + abs(end_px - start_px) * 0.35))
+        started_at = time.perf_counter()
+
+        def step(now: float) -> bool:
+            progress = min(1.0, (now - started_at) * 1000.0 / duration_ms)
+            self._db_shift_px = start_px + (end_px - start_px) * ease_in_out_cubic(progress)
+            self._globe_frame_dirty = True
+            if progress < 1.0:
+                return False
+            self._db_shift_px = 0.0
+            self._activate_db(path)
+            return True
+
+        self._animation_clock.start("db_shift", step)
+        return True
+
+    def _activate_db(self, path: Path) -> None:
+        self._save_preferences()
+        self.db_path = path
+        self._db_identity = db_identity(path)
+        self._file_mtime = None
+        self._last_text = ""
+        self.selected_id = None
+        self._load_preferences()
+        self._load_db(force=True)
+        self.after_idle(self._restore_saved_scroll_position)
+        self._update_db_cost_labels()
+        self._set_status_link()
+        self._prefetch_neighbor_dbs()
+
+    def _draw_selected_eye(self, record_id: str, px: float, py: float, cx: float, cy: float) -> None:
+        canvas = self.graph_canvas
+        eye_radius = max(8.0, min(15.0, 8.0 + 2.6 * math.sqrt(max(0.1, self.globe_zoom))))
+        to_center_x = cx - px
+        to_center_y = cy - py
+        mag = math.hypot(to_center_x, to_center_y) or 1.0
+        look_scale = eye_radius * 0.22
+        iris_cx = px + (to_center_x / mag) * look_scale
+        iris_cy = py + (to_center_y / mag) * look_scale
+
+        canvas.create_oval(
+            px - eye_radius,
+            py - eye_radius,
+            px + eye_radius,
+            py + eye_radius,
+            fill=PALETTE["selected_fill"],
+            outline=PALETTE["node_outline"],
+            width=2,
+            tags=("node", "selected_eye", record_id),
+        )
+        canvas.create_oval(
+            iris_cx - eye_radius * 0.54,
+            iris_cy - eye_radius * 0.54,
+            iris_cx + eye_radius * 0.54,
+            iris_cy + eye_radius * 0.54,
+            fill=PALETTE["selected_iris"],
+            outline=PALETTE["node_outline"],
+            width=1,
+            tags=("node", "selected_eye", record_id),
+        )
+        canvas.create_oval(
+            iris_cx - eye_radius * 0.28,
+            iris_cy - eye_radius * 0.28,
+            iris_cx + eye_radius * 0.28,
+            iris_cy + eye_radius * 0.28,
+            fill="#07090c",
+            outline="",
+            tags=("node", "selected_eye", record_id),
+        )
+        canvas.create_oval(
+            iris_cx - eye_radius * 0.21 - eye_radius * 0.16,
+            iris_cy - eye_radius * 0.25 - eye_radius * 0.16,
+            iris_cx - eye_radius * 0.21 + eye_radius * 0.16,
+            iris_cy - eye_radius * 0.25 + eye_radius * 0.16,
+            fill="#ffffff",
+            outline="",
+            tags=("node", "selected_eye", record_id),
+        )
+        self.screen_points[record_id] = (px, py)
+
+        title = self.records.get(record_id).title if self.records.get(record_id) else None
+        if title:
+            label_size = max(10, min(16, int(11 * self.globe_zoom)))
+            canvas.create_text(
+                px + label_size * 0.7,
+                py - label_size * 0.6,
+                text=title,
+                anchor="nw",
+                fill="#e9e9f0",
+                font=("Trebuchet MS", label_size, "bold"),
+                tags=("selected_eye",),
+            )
+
+    def _invalidate_globe_edges(self) -> None:
+        self._globe_node_ids = None
+
+    def _ensure_globe_edges(self) -> tuple[list[str], list[tuple[float, float, float]], list[tuple[int, list[int]]]]:
+        if self._globe_node_ids is not None:
+            return self._globe_node_ids, self._globe_node_vectors, self._globe_edge_hubs
+
+        node_ids: list[str] = []
+        node_vectors: list[tuple[float, float, float]] = []
+        positions: dict[str, int] = {}
+        for record_id in self._get_visible_order_for_graph():
+            coord = self.coords.get(record_id)
+            if coord is None or record_id in positions:
+                continue
+            positions[record_id] = len(node_ids)
+            node_ids.append(record_id)
+            vector = self._globe_vectors.get(record_id)
+            node_vectors.append(vector if vector is not None else self._sphere_vector(*coord))
+
+        discovery = self.discovery
+        self._globe_node_ids = node_ids
+        self._globe_node_vectors = node_vectors
+        self._globe_node_positions = positions
+        self._globe_edge_hubs = group_edge_hubs(node_ids, positions, self._edge_targets)
+        self._globe_halo_indices = [index for index, record_id in enumerate(node_ids) if record_id in discovery]
+        return node_ids, node_vectors, self._globe_edge_hubs
+
+    def _draw_edge_batches(
+        self,
+        edge_hubs: list[tuple[int, list[int]]],
+        screen_xy: list[float],
+        front: list[bool],
+        selected_index: int,
+    ) -> None:
+        canvas = self.graph_canvas
+        stars, selected_star = edge_star_lines(edge_hubs, screen_xy, front, selected_index)
+        for star in stars:
+            canvas.create_line(*star, fill="#2a3a4d", width=1)
+        if selected_star:
+            canvas.create_line(*selected_star, fill="#7cc7ff", width=2)
+
+    def _edge_targets(self, record_id: str) -> list[str]:
+        record = self.records.get(record_id)
+        if not record or not record.edges:
+            return []
+        return [edge.target for edge in record.edges]
+
+    def _select_globe_backend(self, node_count: int) -> str:
+        if not RASTER_AVAILABLE or ImageTk is None:
+            return "vector"
+        if self.globe_backend in {"vector", "raster"}:
+            return self.globe_backend
+        return "raster" if node_count >= GLOBE_RASTER_NODE_THRESHOLD else "vector"
+
+    def _render_globe_raster(self, width: int, height: int, cx: float, cy: float, radius: float) -> None:
+        node_ids = self._globe_node_ids or []
+        positions = self._globe_node_positions
+        scene = GlobeRasterScene(
+            width=width,
+            height=height,
+            cx=cx,
+            cy=cy,
+            radius=radius,
+            rot_lat=self.globe_rot_lat,
+            rot_lon=self.globe_rot_lon,
+            node_ids=node_ids,
+            vectors=self._globe_node_vectors,
+            edge_hubs=self._globe_edge_hubs,
+            graticule=self._graticule_segments(cx, cy, radius),
+            palette=PALETTE,
+            selected_index=positions.get(self.selected_id, -1) if self.selected_id else -1,
+            first_index=positions.get(self.first_record_id, -1) if self.first_record_id else -1,
+            halo_indices=self._globe_halo_indices,
+            halo_radius=max(16, min(64, 34 * math.sqrt(max(0.1, self.globe_zoom)))),
+        )
+        self._submit_raster_scene(scene)
+
+        canvas = self.graph_canvas
+        if self._raster_photo is not None:
+            canvas.create_image(0, 0, image=self._raster_photo, anchor="nw", tags=("raster",))
+            self._raise_raster_overlays()
+        self.screen_points = dict(self._raster_screen_points)
+
+        # The eyeball and its label stay vector items so selection feedback is
+        # immediate even while the raster frame is still being drawn.
+        coord = self.coords.get(self.selected_id) if self.selected_id in positions else None
+        if coord is not None:
+            x, y, _z = self._project_point(*coord)
+            self._draw_selected_eye(self.selected_id, cx + x * radius, cy - y * radius, cx, cy)
+
+    def _submit_raster_scene(self, scene: GlobeRasterScene) -> None:
+        if self._raster_future is not None and not self._raster_future.done():
+            self._raster_pending_scene = scene
+            return
+        if self._raster_executor is None:
+            self._raster_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="globe-raster")
+        self._raster_future = self._raster_executor.submit(render_globe_raster, scene)
+        if self._raster_poll_after_id is None:
+            self._raster_poll_after_id = self.after(ANIMATION_MS, self._poll_raster_frame)
+
+    def _poll_raster_frame(self) -> None:
+        self._raster_poll_after_id = None
+        future = self._raster_future
+        if future is None:
+            return
+        if not future.done():
+            self._raster_poll_after_id = self.after(ANIMATION_MS, self._poll_raster_frame)
+            return
+        self._raster_future = None
+        try:
+            frame = future.result()
+        except Exception:
+            frame = None
+        if frame is not None and self._globe_backend_active == "raster":
+            self._apply_raster_frame(frame)
+        pending = self._raster_pending_scene
+        self._raster_pending_scene = None
+        if pending is not None:
+            self._submit_raster_scene(pending)
+
+    def _apply_raster_frame(self, frame: GlobeRasterFrame) -> None:
+        canvas = self.graph_canvas
+        try:
+            photo = ImageTk.PhotoImage(frame.image, master=canvas)
+        except Exception:
+            return
+        self._raster_photo = photo
+        self._raster_screen_points = frame.screen_points
+        items = canvas.find_withtag("raster")
+        if items:
+            canvas.itemconfigure(items[0], image=photo)
+        else:
+            canvas.create_image(0, 0, image=photo, anchor="nw", tags=("raster",))
+            self._raise_raster_overlays()
+        selected_points = {
+            record_id: point for record_id, point in self.screen_points.items() if record_id == self.selected_id
+        }
+        self.screen_points = {**frame.screen_points, **selected_points}
+
+    def _raise_raster_overlays(self) -> None:
+        # The frame covers the vector disc; only the side globes and the selected eye stay above it.
+        canvas = self.graph_canvas
+        canvas.tag_raise("raster")
+        canvas.tag_raise("db_globe", "raster")
+        canvas.tag_raise("selected_eye", "raster")
+
     def _draw_discovery_halos(
         self, cx: float, cy: float, radius: float, projections: dict[str, tuple[float, float, float]]
     ) -> None:
@@ -2500,43 +3684,11 @@ class IndexApp(tk.Tk):
             )
 
     def _draw_graticule(self, cx: float, cy: float, radius: float) -> None:
-        for lon in range(-150, 180, 30):
-            points: list[tuple[float, float, bool]] = []
-            for lat in range(-90, 91, 6):
-                x, y, z = self._project_point(lat, lon, 0.0)
-                if z > 0:
-                    points.append((cx + x * radius, cy - y * radius, True))
-                else:
-                    points.append((0.0, 0.0, False))
-            self._draw_visible_line(points)
-
-        for lat in range(-60, 90, 30):
-            points = []
-            for lon in range(-180, 181, 6):
-                x, y, z = self._project_point(lat, lon, 0.0)
-                if z > 0:
-                    points.append((cx + x * radius, cy - y * radius, True))
-                else:
-                    points.append((0.0, 0.0, False))
-            self._draw_visible_line(points)
-
-    def _draw_visible_line(self, points: list[tuple[float, float, bool]]) -> None:
-        segment: list[tuple[float, float]] = []
-        for px, py, visible in points:
-            if visible:
-                segment.append((px, py))
-                continue
-            if len(segment) >= 2:
-                self.graph_canvas.create_line(*self._flatten(segment), fill=PALETTE["graph_grid"], width=1)
-            segment = []
-        if len(segment) >= 2:
-            self.graph_canvas.create_line(*self._flatten(segment), fill=PALETTE["graph_grid"], width=1)
-
-    def _flatten(self, points: list[tuple[float, float]]) -> list[float]:
-        flat: list[float] = []
-        for x, y in points:
-            flat.extend([x, y])
-        return flat
+        for segment in self._graticule_segments(cx, cy, radius):
+            self.graph_canvas.create_line(*segment, fill=PALETTE["graph_grid"], width=1)
+
+    def _graticule_segments(self, cx: float, cy: float, radius: float) -> list[list[float]]:
+        return self._graticule_cache.segments(self.globe_rot_lat, self.globe_rot_lon, cx, cy, radius)
 
 
 def main() -> None:
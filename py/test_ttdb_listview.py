@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import random
+
+from ttdb_listview import FULL_REPLACE_THRESHOLD, ListboxModel
+
+
+class FakeListbox:
+    def __init__(self) -> None:
+        self.rows: list[str] = []
+        self.edits = 0
+
+    def _index(self, index: int | str) -> int:
+        return len(self.rows) if index == "end" else int(index)
+
+    def insert(self, index: int | str, *labels: str) -> None:
+        at = self._index(index)
+        self.rows[at:at] = labels
+        self.edits += 1
+
+    def delete(self, first: int | str, last: int | str | None = None) -> None:
+        start = self._index(first)
+        stop = start if last is None else min(self._index(last), len(self.rows) - 1)
+        del self.rows[start : stop + 1]
+        self.edits += 1
+
+
+def label(record_id: str) -> str:
+    return f"label {record_id}"
+
+
+def make_model(ids: list[str]) -> tuple[ListboxModel, FakeListbox]:
+    listbox = FakeListbox()
+    model = ListboxModel(listbox, label)  # type: ignore[arg-type]
+    model.update(ids)
+    return model, listbox
+
+
+def assert_shows(model: ListboxModel, listbox: FakeListbox, ids: list[str]) -> None:
+    assert listbox.rows == [label(record_id) for record_id in ids]
+    assert model.ids == ids
+    for row, record_id in enumerate(ids):
+        assert model.row_of(record_id) == row
+        assert model.id_at(row) == record_id
+
+
+def test_update_matches_target_across_insert_delete_reorder_mixes() -> None:
+    rnd = random.Random(40)
+    universe = [f"@R{index}" for index in range(120)]
+    current = universe[:60]
+    model, listbox = make_model(current)
+    for _step in range(300):
+        target = list(current)
+        for _edit in range(rnd.randint(1, 6)):
+            kind = rnd.choice(("insert", "delete", "move", "swap"))
+            if kind == "insert":
+                missing = [record_id for record_id in universe if record_id not in target]
+                if missing:
+                    target.insert(rnd.randint(0, len(target)), rnd.choice(missing))
+            elif target and kind == "delete":
+                target.pop(rnd.randrange(len(target)))
+            elif target and kind == "move":
+                target.insert(rnd.randint(0, len(target) - 1), target.pop(rnd.randrange(len(target))))
+            elif len(target) >= 2:
+                first, second = rnd.sample(range(len(target)), 2)
+                target[first], target[second] = target[second], target[first]
+        model.update(target)
+        assert_shows(model, listbox, target)
+        removed = set(current) - set(target)
+        assert all(record_id not in model and model.row_of(record_id) is None for record_id in removed)
+        current = target
+
+
+def test_single_move_is_one_delete_and_one_insert() -> None:
+    ids = [f"@R{index}" for index in range(FULL_REPLACE_THRESHOLD * 2)]
+    model, listbox = make_model(ids)
+    target = ids[1:10] + ids[:1] + ids[10:]
+    listbox.edits = 0
+    model.update(target)
+    assert_shows(model, listbox, target)
+    assert listbox.edits == 2
+
+
+def test_placeholder_round_trip() -> None:
+    model, listbox = make_model(["@A", "@B"])
+    model.update([], placeholder="No matches")
+    assert listbox.rows == ["No matches"]
+    assert len(model) == 0 and model.row_of("@A") is None
+    model.update(["@B", "@C"])
+    assert_shows(model, listbox, ["@B", "@C"])
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from ttdb_scene import (
+    SCENE_MAX_CUES_PER_DUE,
+    SCENE_MIN_CYCLE_MS,
+    ScenePlayer,
+    compile_scene,
+    parse_scene_block,
+)
+
+
+def compile_text(text: str, records: set[str]):
+    scene = parse_scene_block(text)
+    assert scene is not None
+    return compile_scene(scene, records.__contains__)
+
+
+def test_zero_hold_loop_is_stretched_to_minimum_cycle() -> None:
+    timeline = compile_text(
+        "edge: next | from: @A | to: @B | hold_ms: 0\nedge: next | from: @B | to: @A | hold_ms: 0",
+        {"@A", "@B"},
+    )
+    assert timeline is not None
+    assert timeline.loop_from == 1
+    assert timeline.cycle_ms == SCENE_MIN_CYCLE_MS
+
+
+def test_zero_hold_self_loop_is_stretched_to_minimum_cycle() -> None:
+    timeline = compile_text("edge: next | from: @A | to: @A | hold_ms: 0", {"@A"})
+    assert timeline is not None
+    assert timeline.cycle_ms == SCENE_MIN_CYCLE_MS
+    assert timeline.cues[-1].at_ms == SCENE_MIN_CYCLE_MS
+
+
+def test_due_caps_cues_and_skips_missed_cycles() -> None:
+    timeline = compile_text("edge: next | from: @A | to: @A | hold_ms: 0", {"@A"})
+    player = ScenePlayer(timeline, started_at=0.0)
+    fired = player.due(3600.0)
+    assert 0 < len(fired) <= SCENE_MAX_CUES_PER_DUE
+    assert player.max_late_ms >= 3600.0 * 1000.0 - SCENE_MIN_CYCLE_MS * SCENE_MAX_CUES_PER_DUE
+    assert player.next_delay_ms(3600.0) is not None
+    # Once caught up, the next tick only fires what came due since.
+    assert len(player.due(3600.0 + SCENE_MIN_CYCLE_MS / 1000.0)) <= 2
+
+
+def test_linear_scene_stops_after_last_edge() -> None:
+    timeline = compile_text("edge: next | from: @A | to: @B | hold_ms: 500", {"@A", "@B"})
+    assert timeline is not None
+    assert timeline.loop_from is None
+    player = ScenePlayer(timeline, started_at=0.0)
+    assert player.due(0.0)[0][0].kind == "select"
+    assert player.max_late_ms == 0.0
+    kinds = [cue.kind for cue, _scheduled in player.due(10.0)]
+    assert kinds == ["select", "stop"]
+    assert player.max_late_ms == 10.0 * 1000.0 - 500
+    assert player.next_delay_ms(10.0) is None
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import random
+
+from ttdb_tour import TourPlanner, loop_length, unit_vector
+
+
+def random_ids(count: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    return [f"@LAT{rnd.uniform(-80.0, 80.0):.3f}LON{rnd.uniform(-179.0, 179.0):.3f}" for _ in range(count)]
+
+
+def locate(record_id: str) -> tuple[float, float] | None:
+    if not record_id.startswith("@LAT"):
+        return None
+    lat, lon = record_id[4:].split("LON")
+    return float(lat), float(lon)
+
+
+def walk(planner: TourPlanner, start: str) -> list[str]:
+    visited = [start]
+    current = planner.successor(start)
+    while current != start:
+        assert current is not None and len(visited) <= len(planner)
+        visited.append(current)
+        current = planner.successor(current)
+    return visited
+
+
+def test_rebuild_is_a_permutation_with_unplaced_records_last() -> None:
+    record_ids = random_ids(60, seed=1) + ["plain-a", "plain-b"]
+    random.Random(2).shuffle(record_ids)
+    planner = TourPlanner()
+    assert planner.rebuild(record_ids, locate)
+    assert sorted(planner.order) == sorted(record_ids)
+    assert planner.order[-2:] == [record_id for record_id in record_ids if locate(record_id) is None]
+    assert not planner.rebuild(list(record_ids), locate)
+
+
+def test_rebuild_never_lengthens_the_file_order_loop() -> None:
+    record_ids = random_ids(200, seed=3)
+    planner = TourPlanner()
+    planner.rebuild(record_ids, locate)
+    file_order = loop_length([unit_vector(*locate(record_id) or (0.0, 0.0)) for record_id in record_ids])
+    assert planner.route_length() <= file_order
+
+
+def test_successor_closes_the_cycle() -> None:
+    record_ids = random_ids(30, seed=4) + ["plain"]
+    planner = TourPlanner()
+    planner.rebuild(record_ids, locate)
+    assert walk(planner, planner.order[0]) == planner.order
+    assert planner.successor(planner.order[-1]) == planner.order[0]
+    assert planner.successor(None) == planner.order[0]
+    assert TourPlanner().successor(None) is None
+
+
+def test_add_keeps_a_permutation_and_appends_unplaced_last() -> None:
+    planner = TourPlanner(nn_limit=8, window=4)
+    added: list[str] = []
+    for position, record_id in enumerate(random_ids(40, seed=5)):
+        planner.add(record_id, locate(record_id))
+        added.append(record_id)
+        if position % 10 == 0:
+            planner.add(f"plain-{position}", None)
+            added.append(f"plain-{position}")
+    planner.add(added[0], locate(added[0]))
+    assert sorted(planner.order) == sorted(added)
+    unplaced = [record_id for record_id in added if locate(record_id) is None]
+    assert planner.order[-len(unplaced):] == unplaced
+    assert sorted(walk(planner, added[0])) == sorted(added)
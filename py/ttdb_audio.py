@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""Record and tour audio for the TTDB viewers: cached PCM buffers played through a mixer thread or winsound."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import threading
+import time
+import warnings
+import wave
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+try:
+    import winsound
+except Exception:  # pragma: no cover - optional on non-Windows platforms
+    winsound = None
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except Exception:  # pragma: no cover - removed in Python 3.13; mix_pcm falls back to one array pass
+    audioop = None
+
+from ttdb_media import BudgetedLRU
+
+AUDIO_CACHE_BUDGET_BYTES = 32 * 1024 * 1024
+AUDIO_PERIOD_MS = 20
+AUDIO_LEAD_MS = 60
+AUDIO_LATENCY_SAMPLES = 64
+AUDIO_SINK_PATH = Path("ttdb_audio.pcm")  # raw PCM output of the "file" backend, truncated per session
+
+PcmFormat = tuple[int, int, int]  # channels, sample width in bytes, frame rate
+
+PACAT_FORMATS = {1: "u8", 2: "s16le", 3: "s24le", 4: "s32le"}
+APLAY_FORMATS = {1: "U8", 2: "S16_LE", 3: "S24_3LE", 4: "S32_LE"}
+SAMPLE_TYPECODES = {1: "B", 2: "h", 4: "i"}
+
+
+@dataclass(frozen=True)
+class PcmBuffer:
+    channels: int
+    sample_width: int
+    frame_rate: int
+    frames: bytes
+
+    @property
+    def format(self) -> PcmFormat:
+        return self.channels, self.sample_width, self.frame_rate
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+    @property
+    def duration(self) -> float:
+        return len(self.frames) / float(self.frame_size * self.frame_rate)
+
+
+@dataclass
+class Voice:
+    path: Path
+    buffer: PcmBuffer | None
+    loop: bool = False
+    requested_at: float = field(default_factory=time.perf_counter)
+    start_latency_ms: float | None = None
+    offset: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.buffer is not None and not self.loop and self.offset >= len(self.buffer.frames)
+
+    def read(self, size: int) -> bytes:
+        frames = self.buffer.frames if self.buffer is not None else b""
+        if not frames:
+            return b""
+        parts: list[bytes] = []
+        while size > 0:
+            if self.offset >= len(frames):
+                if not self.loop:
+                    break
+                self.offset = 0
+            chunk = frames[self.offset : self.offset + size]
+            self.offset += len(chunk)
+            size -= len(chunk)
+            parts.append(chunk)
+        return b"".join(parts)
+
+
+def decode_wav(source: Path | BinaryIO) -> PcmBuffer:
+    with wave.open(source if not isinstance(source, Path) else str(source), "rb") as reader:
+        return PcmBuffer(
+            channels=reader.getnchannels(),
+            sample_width=reader.getsampwidth(),
+            frame_rate=reader.getframerate(),
+            frames=reader.readframes(reader.getnframes()),
+        )
+
+
+def silence_byte(sample_width: int) -> bytes:
+    # 8-bit WAV samples are unsigned and centred on 0x80; wider widths are signed.
+    return b"\x80" if sample_width == 1 else b"\x00"
+
+
+def mix_pcm(chunks: list[bytes], sample_width: int, size: int) -> bytes:
+    pad = silence_byte(sample_width)
+    chunks = [chunk.ljust(size, pad) for chunk in chunks if chunk]
+    if not chunks:
+        return pad * size
+    if len(chunks) == 1:
+        return chunks[0]
+    if audioop is not None:
+        # audioop treats 8-bit fragments as signed, so unsigned WAV data is shifted around the sum.
+        if sample_width == 1:
+            chunks = [audioop.bias(chunk, 1, -128) for chunk in chunks]
+        mixed = chunks[0]
+        for chunk in chunks[1:]:
+            mixed = audioop.add(mixed, chunk, sample_width)
+        return audioop.bias(mixed, 1, 128) if sample_width == 1 else mixed
+    return _mix_samples(chunks, sample_width)
+
+
+def _mix_samples(chunks: list[bytes], sample_width: int) -> bytes:
+    # Samples are little-endian in WAV, as are the supported hosts, so array() reads them in place.
+    high = (1 << (sample_width * 8 - 1)) - 1
+    low = -high - 1
+    offset = 128 if sample_width == 1 else 0
+    if sample_width == 3:
+        voices: list = [
+            [int.from_bytes(chunk[index : index + 3], "little", signed=True) for index in range(0, len(chunk), 3)]
+            for chunk in chunks
+        ]
+    else:
+        voices = [array(SAMPLE_TYPECODES[sample_width], chunk) for chunk in chunks]
+    bias = offset * len(voices)
+    mixed = [min(high, max(low, sum(samples) - bias)) + offset for samples in zip(*voices)]
+    if sample_width == 3:
+        return b"".join(sample.to_bytes(3, "little", signed=True) for sample in mixed)
+    return array(SAMPLE_TYPECODES[sample_width], mixed).tobytes()
+
+
+class PcmSink(ABC):
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        ...
+
+    def close(self) -> None:
+        return
+
+
+class FileSink(PcmSink):
+    def __init__(self, path: Path | None, append: bool = False) -> None:
+        self._handle = open(path, "ab" if append else "wb") if path is not None else None
+
+    def write(self, data: bytes) -> None:
+        if self._handle is not None:
+            self._handle.write(data)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class CommandSink(PcmSink):
+    def __init__(self, command: list[str]) -> None:
+        self._process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+    def write(self, data: bytes) -> None:
+        assert self._process.stdin is not None
+        self._process.stdin.write(data)
+        self._process.stdin.flush()
+
+    def close(self) -> None:
+        try:
+            if self._process.stdin is not None:
+                self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+
+class AudioBackend:
+    name = "null"
+    needs_pcm = False
+    mixes = False
+
+    def __init__(self) -> None:
+        self.available = True
+        self.on_start: Callable[[Voice], None] | None = None
+
+    def play(self, channel: str, voice: Voice) -> None:
+        return
+
+    def stop(self, channel: str | None = None) -> None:
+        return
+
+    def is_playing(self, channel: str) -> bool:
+        return False
+
+    def close(self) -> None:
+        return
+
+    def _started(self, voice: Voice, latency_ms: float) -> None:
+        voice.start_latency_ms = latency_ms
+        if self.on_start is not None:
+            self.on_start(voice)
+
+
+class WinsoundBackend(AudioBackend):
+    name = "winsound"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.available = winsound is not None
+        self._channel: str | None = None
+
+    def play(self, channel: str, voice: Voice) -> None:
+        flags = winsound.SND_FILENAME | winsound.SND_ASYNC
+        if voice.loop:
+            flags |= winsound.SND_LOOP
+        winsound.PlaySound(str(voice.path), flags)
+        self._channel = channel
+        self._started(voice, (time.perf_counter() - voice.requested_at) * 1000.0)
+
+    def stop(self, channel: str | None = None) -> None:
+        if self._channel is None or (channel is not None and channel != self._channel):
+            return
+        try:
+            winsound.PlaySound(None, winsound.SND_ASYNC)
+        except Exception:
+            pass
+        self._channel = None
+
+    def is_playing(self, channel: str) -> bool:
+        return self._channel == channel
+
+
+class MixerBackend(AudioBackend, ABC):
+    needs_pcm = True
+    mixes = True
+
+    def __init__(self, period_ms: int = AUDIO_PERIOD_MS, lead_ms: int = AUDIO_LEAD_MS) -> None:
+        super().__init__()
+        self.period = period_ms / 1000.0
+        self.lead = lead_ms / 1000.0
+        self._voices: dict[str, Voice] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._sink: PcmSink | None = None
+        self._format: PcmFormat | None = None
+
+    def play(self, channel: str, voice: Voice) -> None:
+        assert voice.buffer is not None
+        with self._cond:
+            if any(other.buffer.format != voice.buffer.format for other in self._voices.values()):  # type: ignore[union-attr]
+                self._voices.clear()
+            self._voices[channel] = voice
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"ttdb-audio-{self.name}", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def stop(self, channel: str | None = None) -> None:
+        with self._cond:
+            if channel is None:
+                self._voices.clear()
+            else:
+                self._voices.pop(channel, None)
+
+    def is_playing(self, channel: str) -> bool:
+        with self._cond:
+            return channel in self._voices
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._voices.clear()
+            self._cond.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            thread.join(1.0)
+        self._close_sink()
+
+    @abstractmethod
+    def _open_sink(self, pcm_format: PcmFormat) -> PcmSink:
+        ...
+
+    def _close_sink(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+            self._format = None
+
+    def _run(self) -> None:
+        clock_start: float | None = None
+        written = 0.0
+        while True:
+            with self._cond:
+                while not self._voices and not self._closed:
+                    clock_start = None
+                    self._cond.wait()
+                if self._closed:
+                    return
+                voices = list(self._voices.items())
+            pcm_format = voices[-1][1].buffer.format  # type: ignore[union-attr]
+            try:
+                if pcm_format != self._format:
+                    self._close_sink()
+                    self._sink = self._open_sink(pcm_format)
+                    self._format = pcm_format
+                    clock_start = None
+            except Exception:
+                self.available = False
+                self.stop()
+                continue
+            channels, sample_width, frame_rate = pcm_format
+            bytes_per_second = channels * sample_width * frame_rate
+            size = max(1, int(frame_rate * self.period)) * channels * sample_width
+            now = time.perf_counter()
+            if clock_start is None:
+                clock_start = now
+                written = 0.0
+            queued = max(0.0, written - (now - clock_start))
+
+            chunks: list[bytes] = []
+            for channel, voice in voices:
+                chunks.append(voice.read(size))
+                if voice.start_latency_ms is None:
+                    self._started(voice, (now - voice.requested_at + queued) * 1000.0)
+                if voice.finished:
+                    with self._cond:
+                        if self._voices.get(channel) is voice:
+                            del self._voices[channel]
+            try:
+                self._sink.write(mix_pcm(chunks, sample_width, size))  # type: ignore[union-attr]
+            except Exception:
+                self._close_sink()
+                self.stop()
+                continue
+            written += size / bytes_per_second
+
+            ahead = written - (time.perf_counter() - clock_start)
+            if ahead > self.lead:
+                time.sleep(ahead - self.lead)
+
+
+class CommandBackend(MixerBackend):
+    def __init__(self, tool: str, **kwargs: int) -> None:
+        super().__init__(**kwargs)
+        self.name = tool
+        self.available = shutil.which(tool) is not None
+
+    def command(self, pcm_format: PcmFormat) -> list[str]:
+        channels, sample_width, frame_rate = pcm_format
+        lead_us = int(self.lead * 1_000_000)
+        if self.name == "pacat":
+            return [
+                "pacat",
+                "--playback",
+                "--raw",
+                f"--format={PACAT_FORMATS[sample_width]}",
+                f"--rate={frame_rate}",
+                f"--channels={channels}",
+                f"--latency-msec={lead_us // 1000}",
+            ]
+        return [
+            "aplay",
+            "-q",
+            "-t",
+            "raw",
+            "-f",
+            APLAY_FORMATS[sample_width],
+            "-c",
+            str(channels),
+            "-r",
+            str(frame_rate),
+            f"--buffer-time={lead_us}",
+        ]
+
+    def _open_sink(self, pcm_format: PcmFormat) -> PcmSink:
+        return CommandSink(self.command(pcm_format))
+
+
+class FileSinkBackend(MixerBackend):
+    name = "file"
+
+    def __init__(self, path: Path | None = None, **kwargs: int) -> None:
+        super().__init__(**kwargs)
+        self.path = path
+        self._opened = False
+        if path is None:
+            self.name = "null"
+
+    def _open_sink(self, _pcm_format: PcmFormat) -> PcmSink:
+        # Truncate once per session; later reopens (a format change) append to this session's output.
+        sink = FileSink(self.path, append=self._opened)
+        self._opened = True
+        return sink
+
+
+def create_backend(name: str = "auto", sink_path: Path = AUDIO_SINK_PATH) -> AudioBackend:
+    if name == "winsound" or (name == "auto" and winsound is not None):
+        return WinsoundBackend()
+    if name in {"pulse", "alsa"}:
+        return CommandBackend("pacat" if name == "pulse" else "aplay")
+    if name == "auto":
+        for tool in ("pacat", "aplay"):
+            if shutil.which(tool):
+                return CommandBackend(tool)
+    if name == "file":
+        return FileSinkBackend(sink_path)
+    backend = FileSinkBackend(None)
+    backend.available = name == "null"
+    return backend
+
+
+class AudioEngine:
+    def __init__(self, backend: AudioBackend, budget: int = AUDIO_CACHE_BUDGET_BYTES) -> None:
+        self.backend = backend
+        self.start_latencies: deque[float] = deque(maxlen=AUDIO_LATENCY_SAMPLES)
+        self._cache = BudgetedLRU(budget)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        backend.on_start = self._record_latency
+
+    @property
+    def available(self) -> bool:
+        return self.backend.available
+
+    @property
+    def mixes(self) -> bool:
+        return self.backend.mixes
+
+    def buffer(self, path: Path) -> PcmBuffer | None:
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        try:
+            buffer = decode_wav(path)
+        except (OSError, EOFError, wave.Error):
+            return None
+        with self._lock:
+            self._cache.put(key, buffer, len(buffer.frames))
+        return buffer
+
+    def preload(self, path: Path) -> None:
+        if not self.backend.needs_pcm or not self.available:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ttdb-audio-decode")
+        self._executor.submit(self.buffer, path)
+
+    def play(self, channel: str, path: Path, loop: bool = False) -> bool:
+        if not self.available:
+            return False
+        requested_at = time.perf_counter()
+        buffer = self.buffer(path) if self.backend.needs_pcm else None
+        if self.backend.needs_pcm and buffer is None:
+            return False
+        try:
+            self.backend.play(channel, Voice(path, buffer, loop, requested_at))
+        except Exception:
+            return False
+        return True
+
+    def stop(self, channel: str | None = None) -> None:
+        self.backend.stop(channel)
+
+    def is_playing(self, channel: str) -> bool:
+        return self.backend.is_playing(channel)
+
+    def close(self) -> None:
+        self.backend.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _record_latency(self, voice: Voice) -> None:
+        if voice.start_latency_ms is not None:
+            self.start_latencies.append(voice.start_latency_ms)
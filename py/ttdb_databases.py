@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""Catalog of the TTDB files beside the active database and a byte-budgeted LRU of their parsed snapshots."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from ttdb_media import BudgetedLRU
+from ttdb_state import StateWriter, db_identity
+
+DB_CATALOG_SUFFIXES = (".md",)
+DB_SNAPSHOT_BUDGET_BYTES = 96 * 1024 * 1024
+DB_SNAPSHOT_WORKERS = 1
+DB_PREFETCH_RANK = 1
+# Per-record bytes beyond its strings: Record/Edge objects, dict slots, coordinate and vector tuples.
+DB_RECORD_OVERHEAD_BYTES = 1200
+ALIAS_INDEX_PATH = Path(".ttdb_cache") / "aliases.json"
+ALIAS_INDEX_VERSION = 1
+
+DB_HEADER_RE = re.compile(r"^@LAT(-?\d+(?:\.\d+)?)LON-?\d+(?:\.\d+)?(?=\s|\||$)")
+RECORD_SEPARATOR_RE = re.compile(r"^\s*---+\s*$")
+SPECIAL_FENCE_RE = re.compile(r"^\s*```ttdb-special", re.I)
+
+Vector = tuple[float, float, float]
+
+
+@dataclass
+class DbSnapshot:
+    path: Path
+    mtime: float
+    text: str
+    records: dict[str, object]
+    order: list[str]
+    selected: str | None
+    coords: dict[str, tuple[float, float, float]]
+    special_records: dict[str, dict[str, str]]
+    search_index: dict[str, str]
+    vectors: dict[str, Vector]
+    cost: int = 0
+
+
+def is_ttdb_file(path: Path) -> bool:
+    try:
+        with path.open(encoding="utf-8", errors="replace") as handle:
+            return any(DB_HEADER_RE.match(line) for line in handle)
+    except OSError:
+        return False
+
+
+def badge_label(path: Path) -> str:
+    base = re.sub(r"DB$", "", path.stem, flags=re.I)
+    initials = "".join(re.findall(r"[A-Z]", base))[:5]
+    if len(initials) >= 2:
+        return initials
+    compact = re.sub(r"[^A-Za-z0-9]", "", base)
+    return compact[:4].upper() or "DB"
+
+
+def db_aliases(path: Path) -> set[str]:
+    stem = path.stem.lower()
+    aliases = {str(path).lower(), path.name.lower(), stem, re.sub(r"[_-]?ttdb$", "", stem)}
+    if not stem.endswith("ttdb"):
+        aliases.add(re.sub(r"db$", "", stem))
+    aliases.discard("")
+    return aliases
+
+
+def record_token(record_id: str) -> str:
+    return record_id.strip().lstrip("@").lower()
+
+
+def scan_record_ids(path: Path) -> list[str]:
+    # Mirrors the block split of the full parser but only looks at the first "@" line of each block,
+    # plus the fence that turns a south-pole record into a (non-selectable) special record.
+    record_ids: list[str] = []
+    awaiting_header = True
+    south_pole = False
+    with path.open(encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            if RECORD_SEPARATOR_RE.match(line):
+                awaiting_header = True
+                south_pole = False
+            elif awaiting_header and line.startswith("@"):
+                record_id = line.split()[0]
+                record_ids.append(record_id)
+                awaiting_header = False
+                match = DB_HEADER_RE.match(record_id)
+                south_pole = match is not None and float(match.group(1)) == -90.0
+            elif south_pole and SPECIAL_FENCE_RE.match(line):
+                record_ids.pop()
+                south_pole = False
+    return record_ids
+
+
+def build_search_index(records: dict[str, object], order: list[str]) -> dict[str, str]:
+    index: dict[str, str] = {}
+    for record_id in order:
+        record = records.get(record_id)
+        if record is None:
+            continue
+        blob = "\n".join(part for part in (record.title or "", record.header, record.body) if part)
+        index[record_id] = blob.lower()
+    return index
+
+
+def estimate_snapshot_cost(snapshot: DbSnapshot) -> int:
+    text = snapshot.text
+    # CPython stores a str at 1, 2 or 4 bytes per character depending on its widest code point.
+    width = 1 if text.isascii() else 2 if max(text) <= "\uffff" else 4
+    chars = len(text) + sum(len(blob) for blob in snapshot.search_index.values())
+    for record in snapshot.records.values():
+        chars += len(record.header) + len(record.body) + len(record.title or "")
+    return chars * width + len(snapshot.records) * DB_RECORD_OVERHEAD_BYTES
+
+
+class DbCatalog:
+    def __init__(self, home: Path) -> None:
+        self.home = home
+        self.paths: list[Path] = [home]
+        self._directory_mtime: int | None = None
+
+    def refresh(self, force: bool = False) -> bool:
+        directory = self.home.parent
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return False
+        if not force and mtime == self._directory_mtime:
+            return False
+        self._directory_mtime = mtime
+        try:
+            names = sorted(
+                (entry.name for entry in os.scandir(directory) if entry.is_file()),
+                key=str.lower,
+            )
+        except OSError:
+            return False
+        paths = [self.home]
+        for name in names:
+            path = directory / name
+            if path.suffix.lower() in DB_CATALOG_SUFFIXES and path != self.home and is_ttdb_file(path):
+                paths.append(path)
+        if paths == self.paths:
+            return False
+        self.paths = paths
+        return True
+
+    def side_order(self, active: Path) -> list[tuple[Path, int, int]]:
+        # Alternate right/left by rank so the nearest neighbors sit closest to the main globe.
+        paths = self.paths
+        if active not in paths or len(paths) < 2:
+            return []
+        total = len(paths)
+        start = paths.index(active)
+        seen = {active}
+        ordered: list[tuple[Path, int, int]] = []
+        for rank in range(1, total):
+            for side in (1, -1):
+                path = paths[(start + side * rank) % total]
+                if path not in seen:
+                    seen.add(path)
+                    ordered.append((path, side, rank))
+            if len(seen) >= total:
+                break
+        return ordered
+
+    def neighbors(self, active: Path, rank: int = DB_PREFETCH_RANK) -> list[Path]:
+        return [path for path, _side, path_rank in self.side_order(active) if path_rank <= rank]
+
+
+class AliasIndex:
+    def __init__(self, catalog: DbCatalog, cache_path: Path = ALIAS_INDEX_PATH, writer: StateWriter | None = None) -> None:
+        self.catalog = catalog
+        self.cache_path = cache_path
+        self.writer = writer or StateWriter()
+        self._catalog_paths: list[Path] | None = None
+        self._exact: dict[str, Path] = {}
+        self._aliases: dict[str, Path] = {}
+        # db identity -> (mtime_ns, size, {record token: record id}); filled per file on first use.
+        self._files: dict[str, tuple[int, int, dict[str, str]]] | None = None
+
+    def resolve(self, alias: str | None, token: str, active: Path) -> tuple[Path, str] | None:
+        path = active if alias is None else self.resolve_db(alias)
+        if path is None:
+            return None
+        record_id = self.record_id(path, token)
+        return (path, record_id) if record_id is not None else None
+
+    def resolve_db(self, alias: str) -> Path | None:
+        value = alias.strip().strip("/")
+        if not value or "?" in value or "#" in value or re.match(r"^[A-Za-z][A-Za-z0-9+.-]*:", value):
+            return None
+        self._sync_catalog()
+        lowered = value.lower()
+        bare = re.sub(r"\.(md|latex)$", "", lowered)
+        # Only the file path or its stem aliases name a DB (TTCP-RFC-0003 §2); a bare prefix is ambiguous.
+        return self._exact.get(lowered) or self._aliases.get(bare)
+
+    def record_id(self, path: Path, token: str) -> str | None:
+        return self.tokens(path).get(record_token(token))
+
+    def tokens(self, path: Path) -> dict[str, str]:
+        files = self._load()
+        key = db_identity(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return {}
+        entry = files.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        try:
+            record_ids = scan_record_ids(path)
+        except OSError:
+            return {}
+        tokens: dict[str, str] = {}
+        for record_id in record_ids:
+            tokens.setdefault(record_token(record_id), record_id)
+        files[key] = (stat.st_mtime_ns, stat.st_size, tokens)
+        # Write-behind: a burst of cold lookups costs one background write, never a write on the Tk thread.
+        self._save()
+        return tokens
+
+    def close(self) -> None:
+        self.writer.close()
+
+    def _sync_catalog(self) -> None:
+        paths = self.catalog.paths
+        if paths is self._catalog_paths:
+            return
+        self._catalog_paths = paths
+        # Exact paths win over stems, and earlier catalog entries win ties (TTCP-RFC-0003 §2.3).
+        self._exact = {}
+        self._aliases = {}
+        for path in paths:
+            self._exact.setdefault(str(path).lower(), path)
+            self._exact.setdefault(path.name.lower(), path)
+            for alias in db_aliases(path):
+                self._aliases.setdefault(alias, path)
+
+    def _load(self) -> dict[str, tuple[int, int, dict[str, str]]]:
+        if self._files is not None:
+            return self._files
+        self._files = {}
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            return self._files
+        if not isinstance(payload, dict) or payload.get("version") != ALIAS_INDEX_VERSION:
+            return self._files
+        for key, entry in (payload.get("files") or {}).items():
+            try:
+                self._files[key] = (int(entry["mtime_ns"]), int(entry["size"]), dict(entry["tokens"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return self._files
+
+    def _save(self) -> None:
+        files = self._files or {}
+        payload = {
+            "version": ALIAS_INDEX_VERSION,
+            "files": {
+                key: {"mtime_ns": mtime_ns, "size": size, "tokens": tokens}
+                for key, (mtime_ns, size, tokens) in files.items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        self.writer.schedule(self.cache_path, payload)
+
+
+class DbSnapshotCache:
+    def __init__(self, build: Callable[[Path], DbSnapshot], budget: int = DB_SNAPSHOT_BUDGET_BYTES) -> None:
+        self._build = build
+        self._lru = BudgetedLRU(budget)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[str, Future] = {}
+
+    @property
+    def total_cost(self) -> int:
+        return self._lru.total_cost
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def get(self, path: Path, mtime: float | None = None) -> DbSnapshot | None:
+        snapshot = self._lru.get(db_identity(path))
+        if not isinstance(snapshot, DbSnapshot):
+            return None
+        if mtime is None:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                return None
+        return snapshot if snapshot.mtime == mtime else None
+
+    def put(self, snapshot: DbSnapshot) -> None:
+        if not snapshot.cost:
+            snapshot.cost = estimate_snapshot_cost(snapshot)
+        self._lru.put(db_identity(snapshot.path), snapshot, snapshot.cost)
+
+    def lookup(self, path: Path, mtime: float) -> DbSnapshot | None:
+        # A switch can land while that DB is still loading in the background; wait for it rather than parse twice.
+        future = self._pending.pop(db_identity(path), None)
+        if future is not None:
+            try:
+                self.put(future.result())
+            except Exception:
+                pass
+        return self.get(path, mtime)
+
+    def prefetch(self, paths: list[Path]) -> None:
+        for path in paths:
+            key = db_identity(path)
+            if key in self._pending or self.get(path) is not None:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=DB_SNAPSHOT_WORKERS, thread_name_prefix="ttdb-snapshot")
+            self._pending[key] = self._executor.submit(self._load, path)
+
+    def collect(self) -> int:
+        finished = [key for key, future in self._pending.items() if future.done()]
+        for key in finished:
+            try:
+                self.put(self._pending.pop(key).result())
+            except Exception:
+                continue
+        return len(finished)
+
+    def costs(self) -> list[tuple[str, int]]:
+        return [(str(key), cost) for key, cost in self._lru.costs()]
+
+    def shutdown(self) -> None:
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _load(self, path: Path) -> DbSnapshot:
+        snapshot = self._build(path)
+        snapshot.cost = estimate_snapshot_cost(snapshot)
+        return snapshot
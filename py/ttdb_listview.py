@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Listbox view model that applies minimal insert/delete edits between visible record sequences."""
+
+from __future__ import annotations
+
+import bisect
+from typing import Callable
+
+import tkinter as tk
+
+FULL_REPLACE_THRESHOLD = 256
+COMPARE_BLOCK = 1024
+
+
+class ListboxModel:
+    def __init__(self, listbox: tk.Listbox, label_for: Callable[[str], str]) -> None:
+        self.listbox = listbox
+        self.ids: list[str] = []
+        self._label_for = label_for
+        self._labels: dict[str, str] = {}
+        self._rows: dict[str, int] | None = {}
+        self._placeholder: str | None = None
+        self._stale = False
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, record_id: object) -> bool:
+        return record_id in self._row_map()
+
+    def row_of(self, record_id: str | None) -> int | None:
+        if record_id is None:
+            return None
+        return self._row_map().get(record_id)
+
+    def id_at(self, row: int) -> str | None:
+        if 0 <= row < len(self.ids):
+            return self.ids[row]
+        return None
+
+    def invalidate_labels(self) -> None:
+        self._stale = True
+
+    def update(self, ids: list[str], placeholder: str | None = None) -> None:
+        if not ids:
+            if self._placeholder != placeholder or self.ids:
+                self.listbox.delete(0, "end")
+                if placeholder is not None:
+                    self.listbox.insert("end", placeholder)
+            self._set_rows([], placeholder)
+            return
+
+        if self._placeholder is not None:
+            self._labels = {}
+            self._replace_all(ids)
+            return
+        relabeled = self._refresh_labels() if self._stale else set()
+        if len(relabeled) > FULL_REPLACE_THRESHOLD:
+            self._replace_all(ids)
+            return
+        if ids == self.ids and not relabeled:
+            return
+
+        old = self.ids
+        head = 0
+        limit = min(len(old), len(ids))
+        while head < limit:
+            # Compare whole blocks at C speed before narrowing down row by row.
+            size = min(COMPARE_BLOCK, limit - head)
+            if old[head : head + size] == ids[head : head + size]:
+                head += size
+                continue
+            while old[head] == ids[head]:
+                head += 1
+            break
+        old_end = len(old)
+        new_end = len(ids)
+        while old_end > head and new_end > head:
+            size = min(COMPARE_BLOCK, old_end - head, new_end - head)
+            if old[old_end - size : old_end] == ids[new_end - size : new_end]:
+                old_end -= size
+                new_end -= size
+                continue
+            while old[old_end - 1] == ids[new_end - 1]:
+                old_end -= 1
+                new_end -= 1
+            break
+
+        kept = self._common_rows(ids, head, new_end)
+        deletes = self._gaps([old_row for old_row, _new_row in kept], head, old_end)
+        inserts = self._gaps([new_row for _old_row, new_row in kept], head, new_end)
+        if len(deletes) + len(inserts) > FULL_REPLACE_THRESHOLD:
+            self._replace_all(ids)
+            return
+
+        for first, last in reversed(deletes):
+            self.listbox.delete(first, last)
+        for first, last in inserts:
+            self.listbox.insert(first, *[self._label(record_id) for record_id in ids[first : last + 1]])
+        self._set_rows(ids, None)
+        for record_id in relabeled:
+            row = self.row_of(record_id)
+            if row is not None:
+                self.listbox.delete(row)
+                self.listbox.insert(row, self._label(record_id))
+
+    def select(self, record_id: str | None) -> bool:
+        row = self.row_of(record_id)
+        self.listbox.selection_clear(0, "end")
+        if row is None:
+            return False
+        self.listbox.selection_set(row)
+        self.listbox.activate(row)
+        self.listbox.see(row)
+        return True
+
+    def _replace_all(self, ids: list[str]) -> None:
+        if self._stale:
+            self._labels = {}
+            self._stale = False
+        self.listbox.delete(0, "end")
+        self.listbox.insert("end", *[self._label(record_id) for record_id in ids])
+        self._set_rows(ids, None)
+
+    def _refresh_labels(self) -> set[str]:
+        shown = self._labels
+        self._labels = {}
+        self._stale = False
+        return {record_id for record_id in self.ids if shown.get(record_id) != self._label(record_id)}
+
+    def _label(self, record_id: str) -> str:
+        label = self._labels.get(record_id)
+        if label is None:
+            label = self._label_for(record_id)
+            self._labels[record_id] = label
+        return label
+
+    def _set_rows(self, ids: list[str], placeholder: str | None) -> None:
+        self.ids = list(ids)
+        self._rows = None
+        self._placeholder = placeholder if not ids else None
+
+    def _row_map(self) -> dict[str, int]:
+        if self._rows is None:
+            self._rows = dict(zip(self.ids, range(len(self.ids))))
+        return self._rows
+
+    def _common_rows(self, ids: list[str], head: int, new_end: int) -> list[tuple[int, int]]:
+        if head >= new_end:
+            return []
+        rows = self._row_map()
+        pairs = [(rows[ids[new_row]], new_row) for new_row in range(head, new_end) if ids[new_row] in rows]
+        if all(pairs[index][0] < pairs[index + 1][0] for index in range(len(pairs) - 1)):
+            return pairs
+
+        # Record ids are unique, so the longest common subsequence is the longest
+        # increasing run of old rows taken in new order.
+        tails: list[int] = []
+        tail_index: list[int] = []
+        parents = [-1] * len(pairs)
+        for index, (old_row, _new_row) in enumerate(pairs):
+            slot = bisect.bisect_left(tails, old_row)
+            if slot == len(tails):
+                tails.append(old_row)
+                tail_index.append(index)
+            else:
+                tails[slot] = old_row
+                tail_index[slot] = index
+            parents[index] = tail_index[slot - 1] if slot > 0 else -1
+        kept: list[tuple[int, int]] = []
+        index = tail_index[-1] if tail_index else -1
+        while index >= 0:
+            kept.append(pairs[index])
+            index = parents[index]
+        kept.reverse()
+        return kept
+
+    @staticmethod
+    def _gaps(kept_rows: list[int], start: int, end: int) -> list[tuple[int, int]]:
+        ranges: list[tuple[int, int]] = []
+        cursor = start
+        for row in kept_rows:
+            if row > cursor:
+                ranges.append((cursor, row - 1))
+            cursor = row + 1
+        if cursor < end:
+            ranges.append((cursor, end - 1))
+        return ranges
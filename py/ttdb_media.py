@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Media caches shared by the TTDB viewers: byte-budgeted LRUs, image decoding, SVG rasterization and asset paths."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+try:
+    from PIL import Image
+except Exception:  # pragma: no cover - optional dependency for background image decoding
+    Image = None
+
+
+DECODE_AVAILABLE = Image is not None
+SVG_AVAILABLE = importlib.util.find_spec("cairosvg") is not None
+IMAGE_DECODE_WORKERS = 2
+MIPMAP_MIN_WIDTH = 128
+SVG_CACHE_DIR = Path(".ttdb_cache") / "svg"
+SVG_RASTER_SIZE = (800, 600)
+SVG_RASTER_WORKERS = 2
+SVG_MEMORY_BUDGET_BYTES = 24 * 1024 * 1024
+SVG_DISK_BUDGET_BYTES = 128 * 1024 * 1024
+SVG_DISK_PRUNE_EVERY = 32
+ASSET_PATH_TTL_S = 30.0
+ASSET_PATH_CACHE_SIZE = 4096
+
+ThumbnailKey = tuple[str, int, tuple[int, int]]
+
+
+class BudgetedLRU:
+    def __init__(self, budget: int) -> None:
+        self.budget = max(0, budget)
+        self.total_cost = 0
+        self._entries: OrderedDict[object, tuple[object, int]] = OrderedDict()
+
+    def get(self, key: object) -> object | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: object, value: object, cost: int) -> None:
+        self.discard(key)
+        if cost > self.budget:
+            return
+        self._entries[key] = (value, cost)
+        self.total_cost += cost
+        while self.total_cost > self.budget and self._entries:
+            _key, (_value, evicted) = self._entries.popitem(last=False)
+            self.total_cost -= evicted
+
+    def discard(self, key: object) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_cost -= entry[1]
+
+    def retain(self, keep: Callable[[object], bool]) -> None:
+        for key in [key for key in self._entries if not keep(key)]:
+            self.discard(key)
+
+    def costs(self) -> list[tuple[object, int]]:
+        return [(key, cost) for key, (_value, cost) in self._entries.items()]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AssetPathCache:
+    def __init__(self, ttl: float = ASSET_PATH_TTL_S, max_entries: int = ASSET_PATH_CACHE_SIZE) -> None:
+        self.ttl = ttl
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str, str], tuple[object, float]] = OrderedDict()
+        self._watched: dict[str, dict[Path, int]] = {}
+
+    def lookup(self, base: str, kind: str, raw: str, resolve: Callable[[], object]) -> object:
+        key = (base, kind, raw)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            self._entries.move_to_end(key)
+            return entry[0]
+        value = resolve()
+        self._entries[key] = (value, now + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def watch(self, base: str, directory: Path) -> None:
+        # Every directory a lookup probed is watched, so a file added under images/ or boi_plates/
+        # drops the cached miss on the next poll instead of after the TTL.
+        watched = self._watched.setdefault(base, {})
+        if directory in watched:
+            return
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        watched[directory] = mtime
+
+    def poll_watches(self) -> None:
+        for base, watched in list(self._watched.items()):
+            changed = False
+            for directory, mtime in watched.items():
+                try:
+                    current = directory.stat().st_mtime_ns
+                except OSError:
+                    current = 0
+                if current != mtime:
+                    watched[directory] = current
+                    changed = True
+            if changed:
+                self.invalidate(base)
+
+    def invalidate(self, base: str | None = None) -> None:
+        if base is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == base]:
+            del self._entries[key]
+
+
+def image_cost(image: object) -> int:
+    width, height = image.size  # type: ignore[attr-defined]
+    return width * height * len(image.getbands())  # type: ignore[attr-defined]
+
+
+def thumbnail_key(path: Path, size: tuple[int, int]) -> ThumbnailKey | None:
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return str(path), mtime, size
+
+
+def decode_thumbnail(source_file: Path | BinaryIO, size: tuple[int, int]) -> object:
+    if Image is None:
+        raise RuntimeError("Pillow is required for background image decoding.")
+    with Image.open(source_file) as source:
+        source.draft("RGB", size)
+        if source.mode not in ("RGB", "RGBA"):
+            image = source.convert("RGBA")
+        else:
+            source.load()
+            image = source
+        image.thumbnail(size, Image.LANCZOS)
+        return image.copy() if image is source else image
+
+
+class ImagePipeline:
+    def __init__(self, budget: int, workers: int = IMAGE_DECODE_WORKERS) -> None:
+        self._cache = BudgetedLRU(budget)
+        self._pending: dict[ThumbnailKey, Future] = {}
+        self._lock = threading.Lock()
+        self._workers = max(1, workers)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def cached(self, path: Path, size: tuple[int, int]) -> object | None:
+        key = thumbnail_key(path, size)
+        if key is None:
+            return None
+        with self._lock:
+            return self._cache.get(key)
+
+    def submit(self, path: Path, size: tuple[int, int]) -> Future | None:
+        key = thumbnail_key(path, size)
+        if key is None or not DECODE_AVAILABLE:
+            return None
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                future: Future = Future()
+                future.set_result(hit)
+                return future
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="ttdb-decode")
+            future = self._executor.submit(self._decode, key, path, size)
+            self._pending[key] = future
+        future.add_done_callback(lambda _future, key=key: self._forget(key))
+        return future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def total_cost(self) -> int:
+        return self._cache.total_cost
+
+    def _decode(self, key: ThumbnailKey, path: Path, size: tuple[int, int]) -> object:
+        image = decode_thumbnail(path, size)
+        with self._lock:
+            self._cache.put(key, image, image_cost(image))
+        return image
+
+    def _forget(self, key: ThumbnailKey) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+
+class MipmapPyramid:
+    def __init__(self, image: object, min_width: int = MIPMAP_MIN_WIDTH) -> None:
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):  # type: ignore[attr-defined]
+            image = image.convert("RGBA")  # type: ignore[attr-defined]
+        else:
+            image.load()  # type: ignore[attr-defined]
+        self.levels: list[object] = [image]
+        while True:
+            width, height = self.levels[-1].size  # type: ignore[attr-defined]
+            if width // 2 < min_width or height // 2 < 1:
+                break
+            self.levels.append(self.levels[-1].reduce(2))  # type: ignore[attr-defined]
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.levels[0].size  # type: ignore[attr-defined]
+
+    @property
+    def cost(self) -> int:
+        return sum(image_cost(level) for level in self.levels)
+
+    def source_for(self, width: int) -> object:
+        for level in reversed(self.levels):
+            if level.size[0] >= width:  # type: ignore[attr-defined]
+                return level
+        return self.levels[0]
+
+    def resize(self, size: tuple[int, int], resample: int) -> object:
+        source = self.source_for(size[0])
+        if source.size == size:  # type: ignore[attr-defined]
+            return source
+        return source.resize(size, resample)  # type: ignore[attr-defined]
+
+
+def rasterize_svg_file(path: str, width: int, height: int) -> bytes:
+    import cairosvg
+
+    return cairosvg.svg2png(url=path, output_width=width, output_height=height)
+
+
+class SvgRasterCache:
+    def __init__(
+        self,
+        cache_dir: Path = SVG_CACHE_DIR,
+        budget: int = SVG_MEMORY_BUDGET_BYTES,
+        disk_budget: int = SVG_DISK_BUDGET_BYTES,
+        workers: int = SVG_RASTER_WORKERS,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.disk_budget = disk_budget
+        self._memory = BudgetedLRU(budget)
+        self._hashes: dict[tuple[str, int], str] = {}
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._workers = max(1, workers)
+        self._executor: ProcessPoolExecutor | None = None
+        self._disk_writes = 0
+
+    def key(self, path: Path, size: tuple[int, int] = SVG_RASTER_SIZE) -> str | None:
+        try:
+            stat_key = (str(path.resolve()), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        digest = self._hashes.get(stat_key)
+        if digest is None:
+            try:
+                digest = hashlib.sha1(path.read_bytes()).hexdigest()
+            except OSError:
+                return None
+            self._hashes[stat_key] = digest
+        return f"{digest}_{size[0]}x{size[1]}"
+
+    def cached(self, path: Path, size: tuple[int, int] = SVG_RASTER_SIZE) -> bytes | None:
+        key = self.key(path, size)
+        if key is None:
+            return None
+        return self._lookup(key)
+
+    def submit(self, path: Path, size: tuple[int, int] = SVG_RASTER_SIZE) -> Future | None:
+        key = self.key(path, size)
+        if key is None:
+            return None
+        png_bytes = self._lookup(key)
+        if png_bytes is not None:
+            future: Future = Future()
+            future.set_result(png_bytes)
+            return future
+        if not SVG_AVAILABLE:
+            return None
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            future = self._executor.submit(rasterize_svg_file, str(path), size[0], size[1])
+            self._pending[key] = future
+        future.add_done_callback(lambda done, key=key: self._store(key, done))
+        return future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _lookup(self, key: str) -> bytes | None:
+        with self._lock:
+            png_bytes = self._memory.get(key)
+        if png_bytes is not None:
+            return png_bytes  # type: ignore[return-value]
+        try:
+            png_bytes = (self.cache_dir / f"{key}.png").read_bytes()
+        except OSError:
+            return None
+        with self._lock:
+            self._memory.put(key, png_bytes, len(png_bytes))
+        return png_bytes
+
+    def _store(self, key: str, future: Future) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        png_bytes = future.result()
+        with self._lock:
+            self._memory.put(key, png_bytes, len(png_bytes))
+        target = self.cache_dir / f"{key}.png"
+        temp_name: str | None = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp name per write keeps concurrent viewers from replacing each other's half-written files.
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+            ) as handle:
+                temp_name = handle.name
+                handle.write(png_bytes)
+            os.replace(temp_name, target)
+        except OSError:
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+            return
+        self._disk_writes += 1
+        if self._disk_writes % SVG_DISK_PRUNE_EVERY == 1:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        try:
+            entries = [(entry.stat().st_mtime, entry.stat().st_size, entry) for entry in self.cache_dir.glob("*.png")]
+        except OSError:
+            return
+        total = sum(size for _mtime, size, _entry in entries)
+        for _mtime, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.disk_budget:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
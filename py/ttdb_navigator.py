@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import hashlib
 import math
 import os
 import re
@@ -9,8 +10,11 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import font as tkfont
 import webbrowser
-from PIL import Image, ImageTk
-import cairosvg
+from PIL import Image, ImageDraw, ImageTk
+
+from globe_raster import GraticuleCache, edge_star_lines, group_edge_hubs
+from ttdb_listview import ListboxModel
+from ttdb_media import AssetPathCache, BudgetedLRU, MipmapPyramid, SvgRasterCache
 
 DB_PATH = Path("BOI_approach_plates.md")
 
@@ -19,12 +23,20 @@ ANIMATION_MS = 16
 DRAG_SENSITIVITY = 0.005
 DRAG_THRESHOLD = 6
 DRAG_LAT_LIMIT = math.pi / 2 - 0.08
-SVG_MAX_WIDTH = 800
-SVG_MAX_HEIGHT = 600
 TTDB_EXTENSIONS = {".md", ".tex", ".ttdb"}
 Z_SCALE = 0.1
 Z_MIN_SCALE = 0.5
 Z_MAX_SCALE = 1.5
+LAUNCHER_CACHE_DIR = Path(".ttdb_cache") / "launcher"
+LAUNCHER_CACHE_BUDGET_BYTES = 32 * 1024 * 1024
+LAUNCHER_SIZE_BUCKET = 32
+LAUNCHER_MIN_SIZE = 200
+LAUNCHER_RENDER_DEBOUNCE_MS = 200
+IMAGE_WIDTH_BUCKET = 8
+IMAGE_RESIZE_SETTLE_MS = 180
+IMAGE_PYRAMID_BUDGET_BYTES = 128 * 1024 * 1024
+IMAGE_RENDER_BUDGET_BYTES = 48 * 1024 * 1024
+SVG_POLL_MS = 40
 
 
 class NavigatorApp(tk.Tk):
@@ -42,8 +54,17 @@ class NavigatorApp(tk.Tk):
         self._db_selected_id: str | None = None
         self._db_coords: dict[str, tuple[float, float, float]] = {}
         self._db_view_image: tk.PhotoImage | None = None
-        self._svg_cache: dict[str, bytes] = {}
+        self._svg_rasters = SvgRasterCache()
+        self._asset_paths = AssetPathCache()
+        self._svg_request: tuple[object, Path, int] | None = None
+        self._svg_poll_after_id: str | None = None
+        self._image_request_token = 0
         self._image_original: Image.Image | None = None
+        self._image_key: tuple[str, int] | None = None
+        self._image_pyramids = BudgetedLRU(IMAGE_PYRAMID_BUDGET_BYTES)
+        self._image_pyramid_current: tuple[tuple[str, int], MipmapPyramid] | None = None
+        self._image_renders = BudgetedLRU(IMAGE_RENDER_BUDGET_BYTES)
+        self._image_settle_after_id: str | None = None
         self._image_canvas_id: int | None = None
         self._image_text_mode = False
         self._link_counter = 0
@@ -55,6 +76,9 @@ class NavigatorApp(tk.Tk):
         self._globe_animating = False
         self._globe_zoom = 1.0
         self._globe_items: dict[int, str] = {}
+        self._globe_node_ids: list[str] | None = None
+        self._globe_edge_hubs: list[tuple[int, list[int]]] = []
+        self._graticule_cache = GraticuleCache()
         self._globe_drag_active = False
         self._globe_drag_start = (0, 0)
         self._globe_drag_last = (0, 0)
@@ -65,6 +89,14 @@ class NavigatorApp(tk.Tk):
         self._build_main_ui()
         self._show_launcher()
         self._polling_active = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        if self._svg_poll_after_id:
+            self.after_cancel(self._svg_poll_after_id)
+            self._svg_poll_after_id = None
+        self._svg_rasters.shutdown()
+        self.destroy()
 
     def _init_fonts(self) -> None:
         base = tkfont.nametofont("TkDefaultFont")
@@ -136,6 +168,7 @@ class NavigatorApp(tk.Tk):
         list_scroll.pack(side="right", fill="y")
         self.db_listbox.configure(yscrollcommand=list_scroll.set)
         self.db_listbox.bind("<<ListboxSelect>>", self._on_db_list_select)
+        self._db_list_model = ListboxModel(self.db_listbox, self._db_list_label)
 
         self.right_pane = ttk.Panedwindow(right, orient="vertical")
         self.right_pane.pack(fill="both", expand=True)
@@ -236,6 +269,9 @@ class NavigatorApp(tk.Tk):
             pass
 
     def _load_launcher_globes(self) -> None:
+        for data in self._launcher_data:
+            if data.get("render_after_id"):
+                self.after_cancel(data["render_after_id"])
         for canvas in self._launcher_canvases:
             canvas.destroy()
         self._launcher_canvases = []
@@ -248,6 +284,7 @@ class NavigatorApp(tk.Tk):
         for path in ttdb_files:
             data = self._load_launcher_data(path)
             self._launcher_data.append(data)
+        self._prune_launcher_cache()
 
         if not self._launcher_data:
             self.launcher_hint.configure(text="No TTDB files found in this directory.")
@@ -277,7 +314,7 @@ class NavigatorApp(tk.Tk):
             )
             canvas.bind(
                 "<Configure>",
-                lambda _event, cvs=canvas, payload=data: self._render_launcher_globe(cvs, payload),
+                lambda _event, cvs=canvas, payload=data: self._on_launcher_configure(cvs, payload),
             )
             self._launcher_canvases.append(canvas)
 
@@ -309,18 +346,33 @@ class NavigatorApp(tk.Tk):
 
     def _load_launcher_data(self, path: Path) -> dict:
         try:
-            content = path.read_text(encoding="utf-8")
+            raw = path.read_bytes()
         except Exception:
-            content = ""
+            raw = b""
+        content = raw.decode("utf-8", errors="ignore")
         db_name = self._extract_db_name(content) or path.stem
-        records, order, selected, coords = self._parse_db_records(content)
         return {
             "path": path,
             "name": db_name,
-            "coords": coords,
-            "selected": selected if selected in coords else (order[0] if order else None),
+            "content_hash": hashlib.sha1(raw).hexdigest(),
+            "coords": None,
+            "selected": None,
+            "photo": None,
+            "photo_size": None,
+            "render_after_id": None,
         }
 
+    def _ensure_launcher_coords(self, data: dict) -> None:
+        if data["coords"] is not None:
+            return
+        try:
+            content = data["path"].read_text(encoding="utf-8")
+        except Exception:
+            content = ""
+        _records, order, selected, coords = self._parse_db_records(content)
+        data["coords"] = coords
+        data["selected"] = selected if selected in coords else (order[0] if order else None)
+
     def _extract_db_name(self, content: str) -> str | None:
         match = re.search(r"```mmpdb(.*?)```", content, flags=re.S)
         if not match:
@@ -331,110 +383,150 @@ class NavigatorApp(tk.Tk):
                 return name_match.group(1).strip().strip('"').strip("'")
         return None
 
-    def _render_launcher_globe(self, canvas: tk.Canvas, data: dict) -> None:
-        canvas.delete("all")
-        width = max(canvas.winfo_width(), 200)
-        height = max(canvas.winfo_height(), 200)
-        padding = 14
-        radius = min(width, height) / 2 - padding
-        if radius <= 10:
-            return
-        cx = width / 2
-        cy = height / 2
-
-        canvas.create_oval(
-            cx - radius,
-            cy - radius,
-            cx + radius,
-            cy + radius,
-            fill="#0e1117",
-            outline="#2a2f3a",
-            width=2,
-        )
-        canvas.create_oval(
-            cx - radius * 0.92,
-            cy - radius * 0.92,
-            cx + radius * 0.92,
-            cy + radius * 0.92,
-            outline="#141824",
-            width=1,
+    def _launcher_size_bucket(self, canvas: tk.Canvas) -> tuple[int, int]:
+        width = max(canvas.winfo_width(), LAUNCHER_MIN_SIZE)
+        height = max(canvas.winfo_height(), LAUNCHER_MIN_SIZE)
+        return (
+            width // LAUNCHER_SIZE_BUCKET * LAUNCHER_SIZE_BUCKET,
+            height // LAUNCHER_SIZE_BUCKET * LAUNCHER_SIZE_BUCKET,
         )
 
-        self._draw_graticule_static(canvas, cx, cy, radius)
-
-        coords: dict[str, tuple[float, float, float]] = data.get("coords", {})
-        selected = data.get("selected")
-        if coords:
-            nodes_front = []
-            nodes_back = []
-            selected_point = None
-            for record_id, (lat, lon, depth) in coords.items():
-                x, y, z = self._project_point_static(lat, lon, depth, 0.0, 0.0)
-                if record_id == selected:
-                    selected_point = (record_id, x, y, z)
-                elif z > 0:
-                    nodes_front.append((record_id, x, y, z))
-                else:
-                    nodes_back.append((record_id, x, y, z))
-
-            for _record_id, x, y, _z in nodes_back:
-                px = cx + x * radius
-                py = cy - y * radius
-                size = 3
-                canvas.create_oval(
-                    px - size,
-                    py - size,
-                    px + size,
-                    py + size,
-                    fill="#2b303b",
-                    outline="",
-                )
+    def _launcher_cache_prefix(self, data: dict) -> str:
+        stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", data["path"].stem)
+        return f"{stem}-{data['content_hash'][:16]}"
 
-            for _record_id, x, y, _z in nodes_front:
-                px = cx + x * radius
-                py = cy - y * radius
-                size = 5
-                canvas.create_oval(
-                    px - size,
-                    py - size,
-                    px + size,
-                    py + size,
-                    fill="#7cc7ff",
-                    outline="#0b0b10",
-                    width=2,
-                )
+    def _launcher_cache_path(self, data: dict, size: tuple[int, int]) -> Path:
+        return LAUNCHER_CACHE_DIR / f"{self._launcher_cache_prefix(data)}-{size[0]}x{size[1]}.png"
 
-            if selected_point:
-                _record_id, x, y, _z = selected_point
-                px = cx + x * radius
-                py = cy - y * radius
-                size = 7
-                canvas.create_oval(
-                    px - size,
-                    py - size,
-                    px + size,
-                    py + size,
-                    fill="#ffd166",
-                    outline="#f4a261",
-                    width=2,
-                )
-        else:
-            canvas.create_text(
-                cx,
-                cy,
-                text="No TTDB coords",
-                fill="#6c7a89",
-                font=("TkDefaultFont", 10, "bold"),
-            )
+    def _prune_launcher_cache(self) -> None:
+        # Renders of edited or removed TTDBs are never read again; the rest are capped oldest-first.
+        live = {self._launcher_cache_prefix(data) for data in self._launcher_data}
+        entries = []
+        try:
+            paths = list(LAUNCHER_CACHE_DIR.glob("*.png"))
+        except OSError:
+            return
+        for entry in paths:
+            try:
+                if entry.name.rsplit("-", 1)[0] not in live:
+                    entry.unlink()
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        total = sum(size for _mtime, size, _entry in entries)
+        for _mtime, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= LAUNCHER_CACHE_BUDGET_BYTES:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def _on_launcher_configure(self, canvas: tk.Canvas, data: dict) -> None:
+        size = self._launcher_size_bucket(canvas)
+        if data["photo_size"] != size:
+            cache_path = self._launcher_cache_path(data, size)
+            if cache_path.exists():
+                try:
+                    data["photo"] = tk.PhotoImage(master=canvas, file=str(cache_path))
+                    data["photo_size"] = size
+                except tk.TclError:
+                    pass
+        self._paint_launcher_canvas(canvas, data)
+        if data["photo_size"] != size:
+            self._schedule_launcher_render(canvas, data)
+
+    def _schedule_launcher_render(self, canvas: tk.Canvas, data: dict) -> None:
+        if data.get("render_after_id"):
+            self.after_cancel(data["render_after_id"])
+        data["render_after_id"] = self.after(
+            LAUNCHER_RENDER_DEBOUNCE_MS,
+            lambda: self._render_launcher_globe(canvas, data),
+        )
 
+    def _paint_launcher_canvas(self, canvas: tk.Canvas, data: dict) -> None:
+        canvas.delete("all")
+        width = max(canvas.winfo_width(), LAUNCHER_MIN_SIZE)
+        height = max(canvas.winfo_height(), LAUNCHER_MIN_SIZE)
+        if data["photo"] is not None:
+            canvas.create_image(width / 2, height / 2, image=data["photo"])
         canvas.create_text(
-            cx,
+            width / 2,
             height - 16,
             text=data.get("name") or "TTDB",
             fill="#e9e9f0",
             font=("TkDefaultFont", 10, "bold"),
         )
 
+    def _render_launcher_globe(self, canvas: tk.Canvas, data: dict) -> None:
+        data["render_after_id"] = None
+        if not canvas.winfo_exists():
+            return
+        size = self._launcher_size_bucket(canvas)
+        if data["photo_size"] != size:
+            image = self._render_launcher_image(data, size)
+            cache_path = self._launcher_cache_path(data, size)
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                image.save(cache_path, format="PNG")
+            except Exception:
+                pass
+            else:
+                self._prune_launcher_cache()
+            data["photo"] = ImageTk.PhotoImage(image, master=canvas)
+            data["photo_size"] = size
+        self._paint_launcher_canvas(canvas, data)
+
+    def _render_launcher_image(self, data: dict, size: tuple[int, int]) -> Image.Image:
+        width, height = size
+        image = Image.new("RGB", (width, height), "#08090c")
+        draw = ImageDraw.Draw(image)
+        padding = 14
+        radius = min(width, height) / 2 - padding
+        if radius <= 10:
+            return image
+        cx = width / 2
+        cy = height / 2
+
+        draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill="#0e1117", outline="#2a2f3a", width=2)
+        inner = radius * 0.92
+        draw.ellipse((cx - inner, cy - inner, cx + inner, cy + inner), outline="#141824", width=1)
+        for segment in self._graticule_cache.segments(0.0, 0.0, cx, cy, radius):
+            draw.line(segment, fill="#1a1f2a", width=1)
+
+        self._ensure_launcher_coords(data)
+        coords: dict[str, tuple[float, float, float]] = data["coords"]
+        selected = data["selected"]
+        if not coords:
+            draw.text((cx, cy), "No TTDB coords", fill="#6c7a89", anchor="mm")
+            return image
+
+        nodes_front = []
+        nodes_back = []
+        selected_point = None
+        for record_id, (lat, lon, depth) in coords.items():
+            x, y, z = self._project_point_static(lat, lon, depth, 0.0, 0.0)
+            px = cx + x * radius
+            py = cy - y * radius
+            if record_id == selected:
+                selected_point = (px, py)
+            elif z > 0:
+                nodes_front.append((px, py))
+            else:
+                nodes_back.append((px, py))
+
+        for px, py in nodes_back:
+            draw.ellipse((px - 3, py - 3, px + 3, py + 3), fill="#2b303b")
+        for px, py in nodes_front:
+            draw.ellipse((px - 5, py - 5, px + 5, py + 5), fill="#7cc7ff", outline="#0b0b10", width=2)
+        if selected_point:
+            px, py = selected_point
+            draw.ellipse((px - 7, py - 7, px + 7, py + 7), fill="#ffd166", outline="#f4a261", width=2)
+        return image
+
     def _project_point_static(
         self, lat: float, lon: float, depth: float, rot_lat: float, rot_lon: float
     ) -> tuple[float, float, float]:
@@ -462,53 +554,8 @@ class NavigatorApp(tk.Tk):
         return x1, y1, z2
 
     def _draw_graticule_static(self, canvas: tk.Canvas, cx: float, cy: float, radius: float) -> None:
-        for lon in range(-150, 180, 30):
-            points = []
-            for lat in range(-90, 91, 6):
-                x, y, z = self._project_point_static(lat, lon, 0.0, 0.0, 0.0)
-                visible = z > 0
-                if visible:
-                    px = cx + x * radius
-                    py = cy - y * radius
-                    points.append((px, py, visible))
-                else:
-                    points.append((0, 0, visible))
-            self._draw_visible_line_static(canvas, points)
-
-        for lat in range(-60, 90, 30):
-            points = []
-            for lon in range(-180, 181, 6):
-                x, y, z = self._project_point_static(lat, lon, 0.0, 0.0, 0.0)
-                visible = z > 0
-                if visible:
-                    px = cx + x * radius
-                    py = cy - y * radius
-                    points.append((px, py, visible))
-                else:
-                    points.append((0, 0, visible))
-            self._draw_visible_line_static(canvas, points)
-
-    def _draw_visible_line_static(
-        self, canvas: tk.Canvas, points: list[tuple[float, float, bool]]
-    ) -> None:
-        line = []
-        for px, py, visible in points:
-            if visible:
-                line.append((px, py))
-            elif line:
-                if len(line) >= 2:
-                    canvas.create_line(
-                        *self._flatten(line),
-                        fill="#1a1f2a",
-                        width=1,
-                    )
-                line = []
-        if len(line) >= 2:
-            canvas.create_line(
-                *self._flatten(line),
-                fill="#1a1f2a",
-                width=1,
-            )
+        for segment in self._graticule_cache.segments(0.0, 0.0, cx, cy, radius):
+            canvas.create_line(*segment, fill="#1a1f2a", width=1)
 
     def _apply_text_tags(self, text: tk.Text) -> None:
         text.tag_configure("h1", font=self.font_h1, foreground="#ffd166")
@@ -528,6 +575,7 @@ class NavigatorApp(tk.Tk):
             self._polling_active = False
             return
         if self._auto_refresh.get():
+            self._asset_paths.poll_watches()
             self._refresh_all()
         self.after(REFRESH_MS, self._poll_files)
 
@@ -676,6 +724,7 @@ class NavigatorApp(tk.Tk):
             self._db_order = []
             self._db_selected_id = None
             self._db_coords = {}
+            self._globe_node_ids = None
             self._populate_db_list()
             self._render_markdown(self.db_view, content)
             self._render_globe()
@@ -686,6 +735,7 @@ class NavigatorApp(tk.Tk):
         self._db_records = records
         self._db_order = order
         self._db_coords = coords
+        self._globe_node_ids = None
 
         if self._db_selected_id not in self._db_records:
             self._db_selected_id = selected or (order[0] if order else None)
@@ -781,23 +831,19 @@ class NavigatorApp(tk.Tk):
         return lat, lon, z
 
     def _populate_db_list(self) -> None:
-        self.db_listbox.delete(0, "end")
-        for record_id in self._db_order:
-            title = self._db_records.get(record_id, {}).get("title")
-            label = title if title else record_id
-            self.db_listbox.insert("end", label)
-
-        if self._db_selected_id in self._db_order:
-            idx = self._db_order.index(self._db_selected_id)
-            self.db_listbox.selection_set(idx)
-            self.db_listbox.activate(idx)
-            self.db_listbox.see(idx)
+        self._db_list_model.invalidate_labels()
+        self._db_list_model.update(self._db_order)
+        self._db_list_model.select(self._db_selected_id)
+
+    def _db_list_label(self, record_id: str) -> str:
+        title = self._db_records.get(record_id, {}).get("title")
+        return title if title else record_id
 
     def _on_db_list_select(self, event: tk.Event) -> None:
         selection = self.db_listbox.curselection()
         if not selection:
             return
-        record_id = self._db_order[selection[0]]
+        record_id = self._db_list_model.id_at(selection[0])
         self._select_db_record(record_id, from_list=True)
 
     def _select_db_record(self, record_id: str | None, from_list: bool = False) -> None:
@@ -805,12 +851,8 @@ class NavigatorApp(tk.Tk):
             self._render_markdown(self.db_view, "No records available.")
             return
         self._db_selected_id = record_id
-        if not from_list and record_id in self._db_order:
-            idx = self._db_order.index(record_id)
-            self.db_listbox.selection_clear(0, "end")
-            self.db_listbox.selection_set(idx)
-            self.db_listbox.activate(idx)
-            self.db_listbox.see(idx)
+        if not from_list and record_id in self._db_list_model:
+            self._db_list_model.select(record_id)
         self._render_db_record(record_id)
         self._update_header()
         self._center_on_selected()
@@ -824,6 +866,8 @@ class NavigatorApp(tk.Tk):
         widget = self.db_view
         widget.configure(state="normal")
         widget.delete("1.0", "end")
+        self._image_request_token += 1
+        self._svg_request = None
 
         body = record.get("body", "")
         image_path = self._extract_markdown_image(body)
@@ -865,13 +909,29 @@ class NavigatorApp(tk.Tk):
     def _render_image_with_text(self, image_path: str) -> bool:
         if image_path.startswith(("http://", "https://")):
             return False
+        db_path = self._db_path or DB_PATH
+        path = self._asset_paths.lookup(
+            str(db_path), "image", image_path, lambda: self._find_image_path(db_path, image_path)
+        )
+        if path is None:
+            return False
+        if path.suffix.lower() == ".svg":
+            return self._render_svg_with_text(path)
+        try:
+            image = Image.open(path)
+        except Exception:
+            return False
+        self._set_image_original(path, image)
+        return True
+
+    def _find_image_path(self, db_path: Path, image_path: str) -> Path | None:
         if os.name == "posix":
             win_drive = re.match(r"^([A-Za-z]):[\\/](.*)$", image_path)
             if win_drive:
                 drive = win_drive.group(1).lower()
                 rest = win_drive.group(2).replace("\\", "/")
                 image_path = f"/mnt/{drive}/{rest}"
-        base_dir = (self._db_path or DB_PATH).resolve().parent
+        base_dir = db_path.resolve().parent
         candidates: list[Path] = []
         raw_path = Path(image_path)
         candidates.append(raw_path)
@@ -880,42 +940,70 @@ class NavigatorApp(tk.Tk):
             if base_dir.drive:
                 candidates.append(Path(f"{base_dir.drive}{image_path}"))
         candidates.append(base_dir / raw_path)
-        path = next((p for p in candidates if p.exists()), None)
-        if path is None:
-            return False
-        image = None
-        if path.suffix.lower() == ".svg":
-            image = self._rasterize_svg(path)
-        else:
+        for candidate in candidates:
+            self._asset_paths.watch(str(db_path), candidate.absolute().parent)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _set_image_original(self, path: Path, image: Image.Image) -> None:
+        try:
+            self._image_key = (str(path.resolve()), path.stat().st_mtime_ns)
+        except OSError:
+            self._image_key = (str(path), 0)
+        self._image_original = image
+        self._show_image_with_text()
+        self._update_image_view(settled=True)
+
+    def _render_svg_with_text(self, path: Path) -> bool:
+        png_bytes = self._svg_rasters.cached(path)
+        if png_bytes is not None:
             try:
-                image = Image.open(path)
+                image = Image.open(BytesIO(png_bytes))
             except Exception:
                 return False
-        if image is None:
+            self._set_image_original(path, image)
+            return True
+        future = self._svg_rasters.submit(path)
+        if future is None:
             return False
-        self._image_original = image
+        self._svg_request = (future, path, self._image_request_token)
+        self._image_original = None
+        self._image_pyramid_current = None
         self._show_image_with_text()
-        self._update_image_view()
+        self.image_view.delete("all")
+        self.image_view.create_text(
+            12,
+            12,
+            text="Rendering illustration...",
+            anchor="nw",
+            fill="#9da8bd",
+            font=self.font_body,
+        )
+        self.image_view.configure(height=48)
+        if self._svg_poll_after_id is None:
+            self._svg_poll_after_id = self.after(SVG_POLL_MS, self._poll_svg_request)
         return True
 
-    def _rasterize_svg(self, path: Path) -> Image.Image | None:
-        cache_key = str(path.resolve())
-        png_bytes = self._svg_cache.get(cache_key)
-        if png_bytes is None:
-            try:
-                png_bytes = cairosvg.svg2png(
-                    url=str(path),
-                    output_width=SVG_MAX_WIDTH,
-                    output_height=SVG_MAX_HEIGHT,
-                )
-            except Exception:
-                return None
-            self._svg_cache[cache_key] = png_bytes
+    def _poll_svg_request(self) -> None:
+        self._svg_poll_after_id = None
+        request = self._svg_request
+        if request is None:
+            return
+        future, path, token = request
+        if not future.done():
+            self._svg_poll_after_id = self.after(SVG_POLL_MS, self._poll_svg_request)
+            return
+        self._svg_request = None
+        if token != self._image_request_token:
+            return
         try:
-            image = Image.open(BytesIO(png_bytes))
+            image = Image.open(BytesIO(future.result()))
         except Exception:
-            return None
-        return image
+            self.image_view.delete("all")
+            self._show_text_view()
+            return
+        self._set_image_original(path, image)
 
     def _show_image_with_text(self) -> None:
         if self._image_view_visible and self._image_text_mode:
@@ -936,9 +1024,9 @@ class NavigatorApp(tk.Tk):
         self._image_text_mode = False
 
     def _on_image_view_resize(self, _event: tk.Event) -> None:
-        self._update_image_view()
+        self._update_image_view(settled=False)
 
-    def _update_image_view(self) -> None:
+    def _update_image_view(self, settled: bool = True) -> None:
         if not self._image_original:
             return
         canvas_w = max(self.image_view.winfo_width(), 1)
@@ -947,15 +1035,55 @@ class NavigatorApp(tk.Tk):
         img_w, img_h = self._image_original.size
         if img_w <= 0 or img_h <= 0:
             return
-        scale = canvas_w / img_w
-        new_w = max(1, int(img_w * scale))
-        new_h = max(1, int(img_h * scale))
-        resized = self._image_original.resize((new_w, new_h), Image.LANCZOS)
-        photo = ImageTk.PhotoImage(resized)
+        bucket_w = max(IMAGE_WIDTH_BUCKET, canvas_w - canvas_w % IMAGE_WIDTH_BUCKET)
+        render_key = (self._image_key, bucket_w)
+        photo = self._image_renders.get(render_key)
+        if photo is not None:
+            self._cancel_image_settle()
+            self._show_image_photo(photo, canvas_w)
+            return
+
+        new_h = max(1, int(img_h * bucket_w / img_w))
+        pyramid = self._image_pyramid()
+        if not settled:
+            preview = pyramid.resize((bucket_w, new_h), Image.BILINEAR)
+            self._show_image_photo(ImageTk.PhotoImage(preview), canvas_w)
+            self._cancel_image_settle()
+            self._image_settle_after_id = self.after(IMAGE_RESIZE_SETTLE_MS, self._settle_image_view)
+            return
+
+        self._cancel_image_settle()
+        photo = ImageTk.PhotoImage(pyramid.resize((bucket_w, new_h), Image.LANCZOS))
+        self._image_renders.put(render_key, photo, bucket_w * new_h * 4)
+        self._show_image_photo(photo, canvas_w)
+
+    def _image_pyramid(self) -> MipmapPyramid:
+        # The shown image's pyramid is pinned outside the LRU, so one larger than the whole
+        # budget is still built once per image rather than on every resize.
+        current = self._image_pyramid_current
+        if current is not None and current[0] == self._image_key:
+            return current[1]
+        pyramid = self._image_pyramids.get(self._image_key)
+        if pyramid is None:
+            pyramid = MipmapPyramid(self._image_original)
+            self._image_pyramids.put(self._image_key, pyramid, pyramid.cost)
+        self._image_pyramid_current = (self._image_key, pyramid)  # type: ignore[assignment]
+        return pyramid  # type: ignore[return-value]
+
+    def _settle_image_view(self) -> None:
+        self._image_settle_after_id = None
+        self._update_image_view(settled=True)
+
+    def _cancel_image_settle(self) -> None:
+        if self._image_settle_after_id:
+            self.after_cancel(self._image_settle_after_id)
+            self._image_settle_after_id = None
+
+    def _show_image_photo(self, photo: ImageTk.PhotoImage, canvas_w: int) -> None:
         self._db_view_image = photo
         self.image_view.delete("all")
-        self.image_view.create_image(0, 0, image=photo, anchor="nw")
-        self.image_view.configure(height=new_h)
+        self.image_view.create_image(canvas_w // 2, 0, image=photo, anchor="n")
+        self.image_view.configure(height=photo.height())
 
     def _update_header(self) -> None:
         if self._db_selected_id:
@@ -1145,15 +1273,22 @@ class NavigatorApp(tk.Tk):
             return
 
         selected = self._db_selected_id
+        node_ids, edge_hubs = self._ensure_globe_edges()
         nodes_front = []
         nodes_back = []
         selected_point = None
-        projections: dict[str, tuple[float, float, float]] = {}
-        for record_id, (lat, lon, depth) in self._db_coords.items():
+        selected_index = -1
+        screen_xy: list[float] = []
+        front: list[bool] = []
+        for index, record_id in enumerate(node_ids):
+            lat, lon, depth = self._db_coords[record_id]
             x, y, z = self._project_point(lat, lon, depth)
-            projections[record_id] = (x, y, z)
+            screen_xy.append(cx + x * radius)
+            screen_xy.append(cy - y * radius)
+            front.append(z > 0)
             if record_id == selected:
                 selected_point = (record_id, x, y, z)
+                selected_index = index
             elif z > 0:
                 nodes_front.append((record_id, x, y, z))
             else:
@@ -1172,35 +1307,12 @@ class NavigatorApp(tk.Tk):
                 outline="",
             )
 
-        # Draw typed edges for visible nodes.
-        for source_id, record in self._db_records.items():
-            edges = record.get("edges", [])
-            if not edges:
-                continue
-            source_proj = projections.get(source_id)
-            if not source_proj:
-                continue
-            sx, sy, sz = source_proj
-            if sz <= 0:
-                continue
-            sxp = cx + sx * radius
-            syp = cy - sy * radius
-            for edge in edges:
-                target_id = edge.get("target")
-                if not target_id:
-                    continue
-                target_proj = projections.get(target_id)
-                if not target_proj:
-                    continue
-                tx, ty, tz = target_proj
-                if tz <= 0:
-                    continue
-                txp = cx + tx * radius
-                typ = cy - ty * radius
-                is_selected_edge = source_id == selected or target_id == selected
-                color = "#2a3a4d" if not is_selected_edge else "#7cc7ff"
-                width = 1 if not is_selected_edge else 2
-                globe.create_line(sxp, syp, txp, typ, fill=color, width=width)
+        # Draw typed edges for visible nodes, one polyline per hub.
+        stars, selected_star = edge_star_lines(edge_hubs, screen_xy, front, selected_index)
+        for star in stars:
+            globe.create_line(*star, fill="#2a3a4d", width=1)
+        if selected_star:
+            globe.create_line(*selected_star, fill="#7cc7ff", width=2)
 
         for record_id, x, y, z in nodes_front:
             px = cx + x * radius
@@ -1245,58 +1357,23 @@ class NavigatorApp(tk.Tk):
                 font=("TkDefaultFont", 9, "bold"),
             )
 
-    def _draw_graticule(self, cx: float, cy: float, radius: float) -> None:
-        for lon in range(-150, 180, 30):
-            points = []
-            for lat in range(-90, 91, 6):
-                x, y, z = self._project_point(lat, lon, 0.0)
-                visible = z > 0
-                if visible:
-                    px = cx + x * radius
-                    py = cy - y * radius
-                    points.append((px, py, visible))
-                else:
-                    points.append((0, 0, visible))
-            self._draw_visible_line(points)
-
-        for lat in range(-60, 90, 30):
-            points = []
-            for lon in range(-180, 181, 6):
-                x, y, z = self._project_point(lat, lon, 0.0)
-                visible = z > 0
-                if visible:
-                    px = cx + x * radius
-                    py = cy - y * radius
-                    points.append((px, py, visible))
-                else:
-                    points.append((0, 0, visible))
-            self._draw_visible_line(points)
-
-    def _draw_visible_line(self, points: list[tuple[float, float, bool]]) -> None:
-        line = []
-        for px, py, visible in points:
-            if visible:
-                line.append((px, py))
-            elif line:
-                if len(line) >= 2:
-                    self.globe.create_line(
-                        *self._flatten(line),
-                        fill="#1a1f2a",
-                        width=1,
-                    )
-                line = []
-        if len(line) >= 2:
-            self.globe.create_line(
-                *self._flatten(line),
-                fill="#1a1f2a",
-                width=1,
-            )
+    def _ensure_globe_edges(self) -> tuple[list[str], list[tuple[int, list[int]]]]:
+        if self._globe_node_ids is not None:
+            return self._globe_node_ids, self._globe_edge_hubs
+        node_ids = list(self._db_coords.keys())
+        positions = {record_id: idx for idx, record_id in enumerate(node_ids)}
+        self._globe_node_ids = node_ids
+        self._globe_edge_hubs = group_edge_hubs(
+            node_ids,
+            positions,
+            lambda record_id: [edge.get("target") for edge in self._db_records.get(record_id, {}).get("edges", [])],
+        )
+        return node_ids, self._globe_edge_hubs
 
-    def _flatten(self, points: list[tuple[float, float]]) -> list[float]:
-        flat: list[float] = []
-        for x, y in points:
-            flat.extend([x, y])
-        return flat
+    def _draw_graticule(self, cx: float, cy: float, radius: float) -> None:
+        segments = self._graticule_cache.segments(self._globe_rot_lat, self._globe_rot_lon, cx, cy, radius)
+        for segment in segments:
+            self.globe.create_line(*segment, fill="#1a1f2a", width=1)
 
     def _clamp_z_scale(self, scale: float) -> float:
         return max(Z_MIN_SCALE, min(Z_MAX_SCALE, scale))
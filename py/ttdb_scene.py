@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Parse `ttdb-scene` blocks (TTCP-RFC-0002 §10) and compile them into timelines played from one monotonic clock."""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Callable
+
+SCENE_BLOCK_LANG = "ttdb-scene"
+SCENE_RECORD_TYPE = "scene"
+SCENE_DEFAULT_EDGE_HOLD_MS = 1400
+SCENE_MIN_CYCLE_MS = 250
+SCENE_MAX_CUES_PER_DUE = 32
+
+# Edge names map to transition presets, matching the web renderer in js/index.js:
+# name -> (hold_ms, dir_x, dir_y, duration_ms, travel_px, direction_fixed)
+SCENE_EDGE_PRESETS: dict[str, tuple[int, float, float, int, int, bool]] = {
+    "down": (3000, 0.0, 1.0, 3000, 3000, False),
+    "next": (5000, 1.0, 0.0, 960, 320, True),
+    "bloom": (1700, -0.58, -0.82, 1300, 300, False),
+    "return_home": (1900, -0.96, 0.16, 1180, 280, False),
+    "default": (SCENE_DEFAULT_EDGE_HOLD_MS, 1.0, 0.0, 900, 260, False),
+}
+
+
+@dataclass
+class SceneEdge:
+    name: str
+    from_id: str
+    to_id: str
+    hold_ms: int | None = None
+    params: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Scene:
+    edges: list[SceneEdge]
+    start_node: str | None = None
+    audio_path: str | None = None
+    loop: bool = False
+
+
+@dataclass
+class SceneCue:
+    at_ms: float
+    kind: str  # "select" or "stop"
+    record_id: str | None = None
+    transition: dict[str, float] | None = None
+
+
+@dataclass
+class SceneTimeline:
+    cues: list[SceneCue]
+    record_ids: list[str]
+    audio_path: str | None = None
+    loop_from: int | None = None  # cue index playback wraps back to after the last cue
+    cycle_ms: float = 0.0
+
+
+def _strip_quotes(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def parse_scene_edge(line: str) -> SceneEdge | None:
+    segments = [segment.strip() for segment in line.split("|")]
+    match = re.match(r"^edge\s*:\s*([A-Za-z0-9._-]+)$", segments[0], re.I)
+    if not match:
+        return None
+    values: dict[str, str] = {}
+    for segment in segments[1:]:
+        entry = re.match(r"^([A-Za-z0-9._-]+)\s*:\s*(.+)$", segment)
+        if entry:
+            values[entry.group(1).lower()] = _strip_quotes(entry.group(2))
+    from_id = values.pop("from", "").strip()
+    to_id = values.pop("to", "").strip()
+    if not from_id or not to_id:
+        return None
+    hold = _number(values.pop("hold_ms", None) or values.pop("pause_ms", None))
+    return SceneEdge(
+        name=match.group(1).lower(),
+        from_id=from_id,
+        to_id=to_id,
+        hold_ms=None if hold is None else max(0, round(hold)),
+        params=values,
+    )
+
+
+def parse_scene_block(text: str) -> Scene | None:
+    scene = Scene(edges=[])
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or stripped.startswith("%"):
+            continue
+        if re.match(r"^edge\s*:", stripped, re.I):
+            edge = parse_scene_edge(stripped)
+            if edge is not None:
+                scene.edges.append(edge)
+            continue
+        entry = re.match(r"^([A-Za-z0-9._-]+)\s*:\s*(.+)$", stripped)
+        if not entry:
+            continue
+        key = entry.group(1).lower()
+        value = _strip_quotes(entry.group(2))
+        if key == "audio_path":
+            scene.audio_path = value or None
+        elif key in {"start", "start_node"}:
+            scene.start_node = value or None
+        elif key == "loop":
+            scene.loop = value.lower() in {"1", "true", "yes", "on"}
+    if not scene.edges:
+        return None
+    if not scene.start_node:
+        scene.start_node = scene.edges[0].from_id
+    return scene
+
+
+def parse_scene_body(body: str) -> tuple[Scene | None, str]:
+    match = re.search(rf"```{re.escape(SCENE_BLOCK_LANG)}([\s\S]*?)```", body, re.I)
+    if not match:
+        return None, body
+    scene = parse_scene_block(match.group(1))
+    if scene is None:
+        return None, body
+    before = body[: match.start()].rstrip()
+    after = body[match.end() :].lstrip()
+    return scene, "\n\n".join(part for part in (before, after) if part).strip()
+
+
+def edge_step(edge: SceneEdge) -> tuple[int, dict[str, float]]:
+    preset = SCENE_EDGE_PRESETS.get(edge.name, SCENE_EDGE_PRESETS["default"])
+    hold_ms, dir_x, dir_y, duration_ms, travel_px, direction_fixed = preset
+    hold = edge.hold_ms if edge.hold_ms is not None else hold_ms
+    if not direction_fixed:
+        param_x = _number(edge.params.get("dir_x"))
+        param_y = _number(edge.params.get("dir_y"))
+        dir_x = dir_x if param_x is None else param_x
+        dir_y = dir_y if param_y is None else param_y
+    magnitude = math.hypot(dir_x, dir_y)
+    if magnitude < 0.0001:
+        dir_x, dir_y = 1.0, 0.0
+    else:
+        dir_x, dir_y = dir_x / magnitude, dir_y / magnitude
+    duration = _number(edge.params.get("duration_ms"))
+    travel = _number(edge.params.get("travel_px"))
+    return max(0, hold), {
+        "dir_x": dir_x,
+        "dir_y": dir_y,
+        "duration_ms": float(round(duration if duration is not None else duration_ms)),
+        "travel_px": float(round(travel if travel is not None else travel_px)),
+    }
+
+
+def compile_scene(scene: Scene, has_record: Callable[[str], bool]) -> SceneTimeline | None:
+    start = scene.start_node if scene.start_node and has_record(scene.start_node) else None
+    if start is None:
+        start = next((edge.from_id for edge in scene.edges if has_record(edge.from_id)), None)
+    if start is None:
+        return None
+
+    outgoing: dict[str, SceneEdge] = {}
+    for edge in scene.edges:
+        outgoing.setdefault(edge.from_id, edge)
+
+    cues = [SceneCue(0.0, "select", start)]
+    visited = {start: 0}
+    at_ms = 0.0
+    current = start
+    timeline = SceneTimeline(cues=cues, record_ids=[start], audio_path=scene.audio_path)
+    while True:
+        edge = outgoing.get(current)
+        if edge is None or not has_record(edge.to_id):
+            if edge is None and scene.loop and current != start:
+                at_ms += SCENE_DEFAULT_EDGE_HOLD_MS
+                cues.append(SceneCue(at_ms, "select", start))
+                timeline.loop_from, timeline.cycle_ms = 1, at_ms
+            else:
+                cues.append(SceneCue(at_ms, "stop"))
+            return timeline
+        hold_ms, transition = edge_step(edge)
+        at_ms += hold_ms
+        cues.append(SceneCue(at_ms, "select", edge.to_id, transition))
+        current = edge.to_id
+        if current in visited:
+            # Each node has one outgoing edge, so reaching a node twice closes the loop.
+            # A loop of zero-hold edges (or a zero-hold self-loop) is stretched to a minimum
+            # cycle so playback never spins on cues that are all due at once.
+            first = visited[current]
+            cycle_ms = at_ms - cues[first].at_ms
+            if cycle_ms < SCENE_MIN_CYCLE_MS:
+                cues[-1].at_ms += SCENE_MIN_CYCLE_MS - cycle_ms
+                cycle_ms = SCENE_MIN_CYCLE_MS
+            timeline.loop_from, timeline.cycle_ms = first + 1, cycle_ms
+            return timeline
+        visited[current] = len(cues) - 1
+        timeline.record_ids.append(current)
+
+
+class ScenePlayer:
+    def __init__(self, timeline: SceneTimeline, started_at: float) -> None:
+        self.timeline = timeline
+        self.started_at = started_at
+        self.cycle = 0
+        self.index = 0
+        self.max_late_ms = 0.0
+
+    def cue_time(self) -> float:
+        cue = self.timeline.cues[self.index]
+        return self.started_at + (self.cycle * self.timeline.cycle_ms + cue.at_ms) / 1000.0
+
+    def due(self, now: float) -> list[tuple[SceneCue, float]]:
+        fired: list[tuple[SceneCue, float]] = []
+        timeline = self.timeline
+        cues = timeline.cues
+        while self.index < len(cues) and len(fired) < SCENE_MAX_CUES_PER_DUE:
+            scheduled = self.cue_time()
+            if scheduled > now:
+                break
+            fired.append((cues[self.index], scheduled))
+            self.max_late_ms = max(self.max_late_ms, (now - scheduled) * 1000.0)
+            self.index += 1
+            if self.index >= len(cues) and timeline.loop_from is not None:
+                self.cycle += 1
+                self.index = timeline.loop_from
+                # After a long stall, skip whole missed cycles rather than replaying each of them.
+                behind_ms = (now - self.cue_time()) * 1000.0
+                if timeline.cycle_ms > 0 and behind_ms > timeline.cycle_ms:
+                    self.cycle += int(behind_ms // timeline.cycle_ms)
+        return fired
+
+    def next_delay_ms(self, now: float) -> int | None:
+        if self.index >= len(self.timeline.cues):
+            return None
+        return max(0, math.ceil((self.cue_time() - now) * 1000.0))
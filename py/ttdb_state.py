@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""Write-behind persistence for TTDB viewer state: JSON files by default, or a shared SQLite (WAL) store."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+WRITE_BEHIND_DELAY_S = 0.75
+STATE_DB_PATH = Path(".index_state.sqlite3")
+STATE_PROFILE = "default"
+_REMOVE = object()
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS discovery (
+    profile TEXT NOT NULL,
+    db_id TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    discovered_at REAL NOT NULL,
+    PRIMARY KEY (profile, db_id, record_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS visit_counts (
+    profile TEXT NOT NULL,
+    db_id TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    visit_count INTEGER NOT NULL,
+    last_visited_at REAL NOT NULL,
+    PRIMARY KEY (profile, db_id, record_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS preferences (
+    profile TEXT NOT NULL,
+    db_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (profile, db_id, key)
+) WITHOUT ROWID;
+"""
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    # A unique temp name per write keeps concurrent writers from tearing each other's files.
+    temp_name: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            temp_name = handle.name
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+        raise
+
+
+def db_identity(db_path: Path) -> str:
+    try:
+        return str(db_path.resolve())
+    except OSError:
+        return str(db_path.absolute())
+
+
+class StateWriter:
+    def __init__(
+        self,
+        delay: float = WRITE_BEHIND_DELAY_S,
+        write_batch: Callable[[dict[object, object]], None] | None = None,
+    ) -> None:
+        self.delay = max(0.0, delay)
+        self.last_error: Exception | None = None
+        self._batch_writer = write_batch
+        self._pending: dict[object, object] = {}
+        self._writing: dict[object, object] = {}
+        self._written: dict[object, bytes] = {}
+        self._first_pending_at: float | None = None
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, path: object, payload: object) -> None:
+        with self._cond:
+            if self._closed:
+                self._write_batch({path: payload})
+                return
+            self._pending[path] = payload
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ttdb-state-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def merge(self, path: object, payload: object, combine: Callable[[object, object], object]) -> None:
+        with self._cond:
+            if path in self._pending:
+                payload = combine(self._pending[path], payload)
+            self.schedule(path, payload)
+
+    def remove(self, path: object) -> None:
+        self.schedule(path, _REMOVE)
+
+    def discard(self, match: Callable[[object], bool]) -> None:
+        with self._cond:
+            for path in [path for path in self._pending if match(path)]:
+                del self._pending[path]
+
+    def pending(self, path: object) -> tuple[bool, object | None]:
+        with self._cond:
+            for queue in (self._pending, self._writing):
+                if path in queue:
+                    payload = queue[path]
+                    return True, None if payload is _REMOVE else payload
+        return False, None
+
+    def queued(self) -> list[tuple[object, object]]:
+        # Batch being written first, then newer pending entries, each in schedule order.
+        with self._cond:
+            return [*self._writing.items(), *self._pending.items()]
+
+    def flush(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                if self._thread is None:
+                    self._drain_locked()
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._flush_requested = False
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                due = (self._first_pending_at or 0.0) + self.delay
+                now = time.monotonic()
+                if not self._flush_requested and now < due:
+                    self._cond.wait(due - now)
+                    continue
+                self._drain_locked()
+
+    def _drain_locked(self) -> None:
+        self._writing, self._pending = self._pending, {}
+        self._first_pending_at = None
+        batch = self._writing
+        self._cond.release()
+        try:
+            self._write_batch(batch)
+        finally:
+            self._cond.acquire()
+            self._writing = {}
+            self._cond.notify_all()
+
+    def _write_batch(self, batch: dict[object, object]) -> None:
+        if self._batch_writer is not None:
+            self._batch_writer(batch)
+            return
+        for path, payload in batch.items():
+            self._write(path, payload)  # type: ignore[arg-type]
+
+    def _write(self, path: Path, payload: object) -> None:
+        try:
+            if payload is _REMOVE:
+                self._written.pop(path, None)
+                path.unlink(missing_ok=True)
+                return
+            data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            if self._written.get(path) == data and path.exists():
+                return
+            write_atomic(path, data)
+            self._written[path] = data
+        except Exception as err:
+            self.last_error = err
+
+
+class JsonStateStore:
+    def __init__(
+        self,
+        discovery_path: Path,
+        preferences_path: Path,
+        writer: StateWriter | None = None,
+        home_db_id: str | None = None,
+    ) -> None:
+        self.discovery_path = discovery_path
+        self.preferences_path = preferences_path
+        self.writer = writer or StateWriter()
+        self.home_db_id = home_db_id
+
+    def load_discovery(self, db_id: str) -> list[str]:
+        payload = self._read(self._discovery_file(db_id))
+        if not isinstance(payload, list):
+            return []
+        return [value for value in payload if isinstance(value, str)]
+
+    def save_discovery(self, db_id: str, ids: list[str], _added: list[str]) -> None:
+        self.writer.schedule(self._discovery_file(db_id), ids)
+
+    def clear_discovery(self, db_id: str) -> None:
+        self.writer.remove(self._discovery_file(db_id))
+
+    def record_visit(self, _db_id: str, _record_id: str) -> None:
+        return
+
+    def load_preferences(self, _db_id: str) -> dict[str, object]:
+        payload = self._read(self.preferences_path)
+        return payload if isinstance(payload, dict) else {}
+
+    def save_preferences(self, _db_id: str, preferences: dict[str, object]) -> None:
+        self.writer.schedule(self.preferences_path, preferences)
+
+    def close(self) -> None:
+        self.writer.close()
+
+    def _discovery_file(self, db_id: str) -> Path:
+        if self.home_db_id is None or db_id == self.home_db_id:
+            return self.discovery_path
+        # Other databases get a sibling file, e.g. .index_discovery.feelings_ttdb.json.
+        path = self.discovery_path
+        return path.with_name(f"{path.stem}.{Path(db_id).stem}{path.suffix}")
+
+    def _read(self, path: Path) -> object:
+        queued, payload = self.writer.pending(path)
+        if queued:
+            return payload
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+
+class SqliteStateStore:
+    def __init__(self, path: Path = STATE_DB_PATH, profile: str = STATE_PROFILE, delay: float = WRITE_BEHIND_DELAY_S) -> None:
+        self.path = path
+        self.profile = profile
+        self.writer = StateWriter(delay, write_batch=self._write_batch)
+        self._reader: sqlite3.Connection | None = None
+        self._writer: sqlite3.Connection | None = None
+
+    def load_discovery(self, db_id: str) -> list[str]:
+        # Committed rows plus whatever is still queued, so the Tk thread never waits on the writer.
+        rows = self._read(
+            "SELECT record_id FROM discovery WHERE profile = ? AND db_id = ? ORDER BY discovered_at",
+            (self.profile, db_id),
+        )
+        ids = [row[0] for row in rows]
+        for key, _payload in self.writer.queued():
+            kind = key[0]  # type: ignore[index]
+            if key[1] != db_id:  # type: ignore[index]
+                continue
+            if kind == "clear":
+                ids = []
+            elif kind == "discovery" and key[2] not in ids:  # type: ignore[index]
+                ids.append(key[2])  # type: ignore[index]
+        return ids
+
+    def save_discovery(self, db_id: str, _ids: list[str], added: list[str]) -> None:
+        now = time.time()
+        for record_id in added:
+            self.writer.schedule(("discovery", db_id, record_id), now)
+
+    def clear_discovery(self, db_id: str) -> None:
+        self.writer.discard(lambda key: key[0] == "discovery" and key[1] == db_id)  # type: ignore[index]
+        self.writer.schedule(("clear", db_id), None)
+
+    def record_visit(self, db_id: str, record_id: str) -> None:
+        # Visits are kept as one counter row per record, so the table stays bounded by the record count.
+        self.writer.merge(
+            ("visit", db_id, record_id),
+            (1, time.time()),
+            lambda queued, visit: (queued[0] + visit[0], visit[1]),  # type: ignore[index]
+        )
+
+    def load_preferences(self, db_id: str) -> dict[str, object]:
+        queued, payload = self.writer.pending(("preferences", db_id))
+        if queued and isinstance(payload, dict):
+            return dict(payload)
+        preferences: dict[str, object] = {}
+        for key, value in self._read(
+            "SELECT key, value FROM preferences WHERE profile = ? AND db_id = ?", (self.profile, db_id)
+        ):
+            try:
+                preferences[key] = json.loads(value)
+            except ValueError:
+                continue
+        return preferences
+
+    def save_preferences(self, db_id: str, preferences: dict[str, object]) -> None:
+        self.writer.schedule(("preferences", db_id), dict(preferences))
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        self.writer.close(timeout)
+        for connection in (self._reader, self._writer):
+            if connection is not None:
+                connection.close()
+        self._reader = None
+        self._writer = None
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SQLITE_SCHEMA)
+        return connection
+
+    def _read(self, query: str, params: tuple[object, ...]) -> list[tuple]:
+        try:
+            if self._reader is None:
+                self._reader = self._connect()
+            return self._reader.execute(query, params).fetchall()
+        except sqlite3.Error as err:
+            self.writer.last_error = err
+            return []
+
+    def _write_batch(self, batch: dict[object, object]) -> None:
+        try:
+            if self._writer is None:
+                self._writer = self._connect()
+            with self._writer:
+                for key, payload in batch.items():
+                    self._apply(self._writer, key, payload)  # type: ignore[arg-type]
+        except sqlite3.Error as err:
+            self.writer.last_error = err
+
+    def _apply(self, connection: sqlite3.Connection, key: tuple, payload: object) -> None:
+        kind, db_id = key[0], key[1]
+        if kind == "discovery":
+            connection.execute(
+                "INSERT OR IGNORE INTO discovery (profile, db_id, record_id, discovered_at) VALUES (?, ?, ?, ?)",
+                (self.profile, db_id, key[2], payload),
+            )
+        elif kind == "clear":
+            connection.execute("DELETE FROM discovery WHERE profile = ? AND db_id = ?", (self.profile, db_id))
+        elif kind == "visit":
+            count, visited_at = payload  # type: ignore[misc]
+            connection.execute(
+                "INSERT INTO visit_counts (profile, db_id, record_id, visit_count, last_visited_at)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (profile, db_id, record_id) DO UPDATE SET"
+                " visit_count = visit_count + excluded.visit_count,"
+                " last_visited_at = MAX(last_visited_at, excluded.last_visited_at)",
+                (self.profile, db_id, key[2], count, visited_at),
+            )
+        elif kind == "preferences":
+            connection.executemany(
+                "INSERT OR REPLACE INTO preferences (profile, db_id, key, value) VALUES (?, ?, ?, ?)",
+                [(self.profile, db_id, name, json.dumps(value)) for name, value in payload.items()],  # type: ignore[attr-defined]
+            )
+
+
+def open_state_store(
+    backend: str,
+    discovery_path: Path,
+    preferences_path: Path,
+    profile: str = STATE_PROFILE,
+    home_db_id: str | None = None,
+) -> JsonStateStore | SqliteStateStore:
+    if backend == "sqlite":
+        return SqliteStateStore(STATE_DB_PATH, profile)
+    return JsonStateStore(discovery_path, preferences_path, home_db_id=home_db_id)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Guided tour routes over discovered TTDB records that keep great-circle travel between stops short."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable
+
+TOUR_NN_LIMIT = 512
+TOUR_TWO_OPT_WINDOW = 48
+TOUR_PLAN_BUDGET_S = 0.06
+
+Vector = tuple[float, float, float]
+
+
+def unit_vector(lat: float, lon: float) -> Vector:
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    cos_lat = math.cos(lat_r)
+    return cos_lat * math.cos(lon_r), cos_lat * math.sin(lon_r), math.sin(lat_r)
+
+
+def arc(a: Vector, b: Vector) -> float:
+    dot = a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+    return math.acos(max(-1.0, min(1.0, dot)))
+
+
+def loop_length(points: list[Vector]) -> float:
+    if len(points) < 2:
+        return 0.0
+    # Closed loop: the first leg runs from the last stop back to the first.
+    total = 0.0
+    previous = points[-1]
+    for current in points:
+        total += arc(previous, current)
+        previous = current
+    return total
+
+
+class TourPlanner:
+    def __init__(
+        self,
+        nn_limit: int = TOUR_NN_LIMIT,
+        window: int = TOUR_TWO_OPT_WINDOW,
+        budget: float = TOUR_PLAN_BUDGET_S,
+    ) -> None:
+        self.nn_limit = nn_limit
+        self.window = max(2, window)
+        self.budget = budget
+        self._route: list[str] = []
+        self._unplaced: list[str] = []
+        self._points: dict[str, Vector] = {}
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._route) + len(self._unplaced)
+
+    def __contains__(self, record_id: object) -> bool:
+        return record_id in self._positions
+
+    @property
+    def order(self) -> list[str]:
+        return self._route + self._unplaced
+
+    def rebuild(self, record_ids: list[str], locate: Callable[[str], tuple[float, float] | None]) -> bool:
+        points: dict[str, Vector] = {}
+        unplaced: list[str] = []
+        for record_id in record_ids:
+            coords = locate(record_id)
+            if coords is None:
+                unplaced.append(record_id)
+            else:
+                points[record_id] = unit_vector(coords[0], coords[1])
+        if points == self._points and unplaced == self._unplaced:
+            return False
+        self._points = points
+        self._unplaced = unplaced
+        self._route = self._construct(list(points))
+        window = len(self._route) if len(self._route) <= self.nn_limit else self.window
+        self._improve(0, len(self._route), window)
+        self._reindex()
+        return True
+
+    def add(self, record_id: str, coords: tuple[float, float] | None) -> None:
+        if record_id in self._positions:
+            return
+        if coords is None:
+            self._unplaced.append(record_id)
+            self._positions[record_id] = len(self) - 1
+            return
+        point = unit_vector(coords[0], coords[1])
+        self._points[record_id] = point
+        route = self._route
+        slot = len(route)
+        if len(route) >= 2:
+            points = self._points
+            best = math.inf
+            for index, current in enumerate(route):
+                a = points[current]
+                b = points[route[(index + 1) % len(route)]]
+                cost = arc(a, point) + arc(point, b) - arc(a, b)
+                if cost < best:
+                    best = cost
+                    slot = index + 1
+        route.insert(slot, record_id)
+        self._improve(max(0, slot - self.window), min(len(route), slot + self.window), self.window)
+        self._reindex()
+
+    def successor(self, record_id: str | None) -> str | None:
+        total = len(self)
+        if total == 0:
+            return None
+        position = self._positions.get(record_id, -1) if record_id else -1
+        return self._at((position + 1) % total)
+
+    def route_length(self) -> float:
+        return loop_length([self._points[record_id] for record_id in self._route])
+
+    def _at(self, position: int) -> str:
+        if position < len(self._route):
+            return self._route[position]
+        return self._unplaced[position - len(self._route)]
+
+    def _reindex(self) -> None:
+        self._positions = dict(zip(self.order, range(len(self))))
+
+    def _construct(self, record_ids: list[str]) -> list[str]:
+        if len(record_ids) <= 2:
+            return record_ids
+        points = self._points
+        if len(record_ids) > self.nn_limit:
+            # Serpentine sweep through latitude bands: O(n log n) and free of long jumps.
+            bands = max(1, int(math.sqrt(len(record_ids) / 2)))
+
+            def sweep_key(record_id: str) -> tuple[int, float]:
+                x, y, z = points[record_id]
+                band = min(bands - 1, int((math.asin(max(-1.0, min(1.0, z))) / math.pi + 0.5) * bands))
+                lon = math.atan2(y, x)
+                return band, lon if band % 2 == 0 else -lon
+
+            return sorted(record_ids, key=sweep_key)
+
+        remaining = record_ids[1:]
+        route = [record_ids[0]]
+        current = points[record_ids[0]]
+        while remaining:
+            best_index = 0
+            best_dot = -2.0
+            cx, cy, cz = current
+            for index, record_id in enumerate(remaining):
+                x, y, z = points[record_id]
+                dot = cx * x + cy * y + cz * z
+                if dot > best_dot:
+                    best_dot = dot
+                    best_index = index
+            record_id = remaining[best_index]
+            remaining[best_index] = remaining[-1]
+            remaining.pop()
+            route.append(record_id)
+            current = points[record_id]
+        return route
+
+    def _improve(self, start: int, end: int, window: int) -> None:
+        route = self._route
+        count = len(route)
+        if count < 4:
+            return
+        vectors = [self._points[record_id] for record_id in route]
+        deadline = time.perf_counter() + self.budget
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for i in range(start, min(end, count - 2)):
+                if time.perf_counter() >= deadline:
+                    return
+                a = vectors[i]
+                b = vectors[i + 1]
+                ab = arc(a, b)
+                for j in range(i + 2, min(count, i + 2 + window)):
+                    if i == 0 and j == count - 1:
+                        continue
+                    c = vectors[j]
+                    d = vectors[(j + 1) % count]
+                    if arc(a, c) + arc(b, d) < ab + arc(c, d) - 1e-12:
+                        route[i + 1 : j + 1] = route[j:i:-1]
+                        vectors[i + 1 : j + 1] = vectors[j:i:-1]
+                        b = vectors[i + 1]
+                        ab = arc(a, b)
+                        improved = True